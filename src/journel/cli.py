@@ -7,23 +7,7 @@ from pathlib import Path
 import click
 
 from . import __version__
-from .config import Config
-from .display import (
-    console,
-    print_completion_celebration,
-    print_context_export,
-    print_error,
-    print_info,
-    print_list,
-    print_project_details,
-    print_status,
-    print_success,
-    print_welcome,
-)
-from .models import LogEntry, Project
-from .storage import Storage
-from .session import SessionManager
-from .utils import slugify, detect_git_repo, parse_time_from_message
+from .commands import detect_current_project, get_storage
 
 # Slash command version for AI provider integration
 SLASH_COMMAND_VERSION = "2.1.0"
@@ -579,15 +563,47 @@ def _create_slash_command_for_provider(provider: str, file_path: Path) -> None:
     file_path.write_text(content, encoding="utf-8")
 
 
-def get_storage(no_emoji: bool = False) -> Storage:
-    """Get storage instance with config."""
-    config = Config()
-    if no_emoji:
-        config.set("use_emojis", False)
-    return Storage(config)
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked.
+
+    Commands listed in LAZY_COMMANDS live in journel.commands.<name> and
+    expose a `cmd` attribute; everything else is registered eagerly.
+    """
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(LAZY_COMMANDS))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in LAZY_COMMANDS:
+            import importlib
+            module = importlib.import_module(f".commands.{cmd_name}", __package__)
+            return module.cmd
+        return super().get_command(ctx, cmd_name)
+
+
+# Subcommands loaded on demand from journel.commands
+LAZY_COMMANDS = (
+    "archive",
+    "ask",
+    "ctx",
+    "done",
+    "edit",
+    "init",
+    "link",
+    "list",
+    "log",
+    "new",
+    "note",
+    "resume",
+    "stats",
+    "status",
+    "sync",
+    "unarchive",
+    "wins",
+)
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.version_option(version=__version__)
 @click.option("--no-emoji", is_flag=True, help="Disable emoji output (use ASCII)")
 @click.option("--install-completion", is_flag=True, help="Install shell completion")
@@ -646,7 +662,7 @@ def main(ctx, no_emoji, install_completion, show_completion):
     """
     # Handle completion installation
     if install_completion:
-        import subprocess
+        from .display import console, print_info
         shell = click.get_current_context().resilient_parsing
         print_info("Installing shell completion...")
         console.print("\n[bold]Shell Completion Setup:[/bold]")
@@ -660,6 +676,7 @@ def main(ctx, no_emoji, install_completion, show_completion):
         return
 
     if show_completion:
+        from .display import console
         console.print("\n[bold]Shell completion is built-in![/bold]")
         console.print("\nRun: [cyan]jnl --install-completion[/cyan] for setup instructions\n")
         return
@@ -670,130 +687,7 @@ def main(ctx, no_emoji, install_completion, show_completion):
 
     if ctx.invoked_subcommand is None:
         # Default to status command
-        ctx.invoke(status)
-
-
-@main.command()
-def init():
-    """Initialize JOURNEL for first-time use."""
-    config = Config()
-
-    # Check if already initialized
-    if config.journel_dir.exists() and (config.journel_dir / ".git").exists():
-        print_error("JOURNEL is already initialized")
-        print_info(f"Location: {config.journel_dir}")
-        return
-
-    storage = Storage(config)
-    storage.init_structure()
-
-    print_welcome()
-    print_success(f"JOURNEL initialized at {config.journel_dir}")
-
-
-@main.command()
-@click.argument("name")
-@click.argument("description", required=False)
-@click.option("--tags", help="Comma-separated tags")
-@click.option("--ongoing", is_flag=True, help="Mark as ongoing/long-term project")
-@click.option("--maintenance", is_flag=True, help="Mark as maintenance/infrastructure project")
-@click.option("--yes", is_flag=True, help="Skip prompts (non-interactive mode)")
-def new(name, description, tags, ongoing, maintenance, yes):
-    """Create a new project.
-
-    Usage:
-        jnl new MyProject
-        jnl new MyProject "A longer description"
-        jnl new MyProject "Description" --tags "python,cli"
-        jnl new MyProject --ongoing  (for long-term projects)
-        jnl new MyProject --maintenance  (for infrastructure/libraries)
-        jnl new MyProject --yes  (skip all prompts)
-
-    Includes gentle gate-keeping to prevent project-hopping.
-    """
-    storage = get_storage()
-    config = storage.config
-
-    # Check for mutually exclusive flags
-    if ongoing and maintenance:
-        print_error("Project cannot be both --ongoing and --maintenance")
-        return
-
-    # Check for existing projects
-    projects = storage.list_projects()
-    active_regular = [p for p in projects if p.status == "in-progress" and p.days_since_active() <= 14 and p.project_type == "regular"]
-    active_ongoing = [p for p in projects if p.status == "in-progress" and p.days_since_active() <= 90 and p.project_type == "ongoing"]
-
-    # Gate-keeping: check appropriate limit based on project type
-    # Note: Maintenance projects have no limit (don't gate-keep)
-    if ongoing:
-        max_ongoing = config.get("max_ongoing_projects", 2)
-        if len(active_ongoing) >= max_ongoing:
-            print_error(f"You already have {len(active_ongoing)} ongoing long-term projects!")
-            console.print("\nOngoing projects:")
-            for p in active_ongoing:
-                console.print(f"  - {p.name} ({p.completion}% complete)")
-            console.print("\n[yellow]Ongoing projects require sustained deep attention.[/yellow]")
-            console.print("[dim]Consider completing one or converting to regular tracking.[/dim]")
-
-            if not yes and not click.confirm("\nReally start another ongoing project?", default=False):
-                print_info("Good choice! Focus matters for long-term success.")
-                return
-    else:
-        max_active = config.get("max_active_projects", 5)
-        if len(active_regular) >= max_active:
-            print_error(f"You already have {len(active_regular)} active projects!")
-            console.print("\nActive projects:")
-            for p in active_regular:
-                console.print(f"  - {p.name} ({p.completion}% complete)")
-
-            if not yes and not click.confirm("\nReally start something new?", default=False):
-                print_info("Good choice! Focus on finishing what you started.")
-                return
-
-    # Create project ID
-    project_id = slugify(name)
-
-    # Check if project already exists
-    if storage.load_project(project_id):
-        print_error(f"Project '{project_id}' already exists")
-        return
-
-    # Create project
-    if maintenance:
-        project_type = "maintenance"
-    elif ongoing:
-        project_type = "ongoing"
-    else:
-        project_type = "regular"
-
-    project = Project(
-        id=project_id,
-        name=name,
-        full_name=description or name,
-        tags=tags.split(",") if tags else [],
-        created=date.today(),
-        last_active=date.today(),
-        project_type=project_type,
-    )
-
-    # Auto-detect git repo
-    git_url = detect_git_repo()
-    if git_url:
-        if yes or click.confirm(f"\nDetected git repo: {git_url}\nLink to this project?", default=True):
-            project.github = git_url
-            print_success(f"Linked to: {git_url}")
-
-    storage.save_project(project)
-    storage.update_project_index()
-
-    print_success(f"Created project: {name}")
-    print_info(f"ID: {project_id}")
-    if not git_url or project.github == "":
-        print_info("Next steps:")
-        console.print("  1. Add project details: jnl edit " + project_id)
-        console.print("  2. Link to GitHub/Claude: jnl link " + project_id + " <url>")
-        console.print("  3. Start logging work: jnl log \"your message\"")
+        ctx.invoke(main.get_command(ctx, "status"))
 
 
 @main.command(name="set-ongoing")
@@ -811,6 +705,7 @@ def set_ongoing(project, yes):
         jnl set-ongoing myproject
         jnl set-ongoing myproject --yes
     """
+    from .display import console, print_error, print_info, print_success
     storage = get_storage()
     proj = storage.load_project(project)
 
@@ -851,6 +746,7 @@ def set_regular(project):
     Usage:
         jnl set-regular myproject
     """
+    from .display import print_error, print_info, print_success
     storage = get_storage()
     proj = storage.load_project(project)
 
@@ -886,6 +782,7 @@ def set_maintenance(project, yes):
         jnl set-maintenance myproject
         jnl set-maintenance myproject --yes
     """
+    from .display import console, print_error, print_info, print_success
     storage = get_storage()
     proj = storage.load_project(project)
 
@@ -917,444 +814,6 @@ def set_maintenance(project, yes):
     print_info("Use 'jnl status' to see it in the MAINTENANCE section")
 
 
-@main.command()
-@click.option("--brief", is_flag=True, help="Brief output for prompts")
-@click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
-@click.pass_context
-def status(ctx, brief, format):
-    """Show overview of all projects (default command)."""
-    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
-    storage = get_storage(no_emoji)
-    config = storage.config
-
-    projects = storage.list_projects()
-
-    if not projects:
-        if format == "json":
-            import json
-            print(json.dumps({"projects": [], "count": 0}))
-        else:
-            print_info("No projects yet. Create one with: jnl new <name>")
-        return
-
-    if format == "json":
-        import json
-        # Convert projects to JSON-serializable format
-        projects_data = []
-        for p in projects:
-            projects_data.append({
-                "id": p.id,
-                "name": p.name,
-                "full_name": p.full_name,
-                "status": p.status,
-                "tags": p.tags,
-                "created": p.created.isoformat() if hasattr(p.created, 'isoformat') else str(p.created),
-                "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
-                "days_since_active": p.days_since_active(),
-                "completion": p.completion,
-                "priority": p.priority,
-                "project_type": p.project_type,
-                "github": p.github,
-                "claude_project": p.claude_project,
-                "next_steps": p.next_steps,
-                "blockers": p.blockers,
-            })
-        print(json.dumps({"projects": projects_data, "count": len(projects_data)}, indent=2))
-    elif brief:
-        active = [p for p in projects if p.status == "in-progress" and p.days_since_active() <= 14]
-        console.print(f"[JOURNEL: {len(active)} active projects]")
-    else:
-        # Check for active session
-        session_manager = SessionManager.get_instance(storage)
-        active_session = session_manager.get_active_session()
-        print_status(projects, config, active_session=active_session)
-
-
-@main.command()
-@click.argument("project_or_message")
-@click.argument("message", required=False)
-@click.option("--hours", "-h", type=float, help="Hours spent (can also be in message like '(2h)')")
-def log(project_or_message, message, hours):
-    """Quick activity logging.
-
-    Usage:
-        jnl log "Fixed bug (2h)"                    - auto-detect project
-        jnl log journel "Fixed bug (2h)"            - explicit project
-        jnl log "Implemented feature - 3h"          - time with dash
-        jnl log myproject "worked 1.5h"             - project + time
-
-    If project is not specified, attempts to detect from current directory.
-    Time can be specified with --hours or in the message using (2h), - 3h, or "worked 1.5h".
-    """
-    storage = get_storage()
-
-    # Track what was auto-detected for better feedback
-    project_auto_detected = False
-    time_parsed = False
-
-    # Determine if first arg is project or message
-    project = None
-    if message is not None:
-        # Two args provided: first is project, second is message
-        project = project_or_message
-        actual_message = message
-    else:
-        # One arg provided: it's the message, auto-detect project
-        actual_message = project_or_message
-        cwd = Path.cwd()
-        # Try to match directory name to project
-        potential_id = slugify(cwd.name)
-        if storage.load_project(potential_id):
-            project = potential_id
-            project_auto_detected = True
-
-    # Parse time from message if not explicitly provided
-    if hours is None:
-        actual_message, parsed_hours = parse_time_from_message(actual_message)
-        if parsed_hours:
-            hours = parsed_hours
-            time_parsed = True
-
-    # Create log entry
-    entry = LogEntry(
-        date=date.today(),
-        project=project,
-        message=actual_message,
-        hours=hours,
-    )
-
-    storage.add_log_entry(entry)
-
-    # Update project last_active if project specified
-    project_name = None
-    if project:
-        proj = storage.load_project(project)
-        if proj:
-            proj.last_active = date.today()
-            storage.save_project(proj)
-            storage.update_project_index()
-            project_name = proj.name
-
-    # Enhanced feedback
-    print_success(f"Logged: \"{actual_message}\"")
-
-    if project:
-        if project_auto_detected:
-            console.print(f"[cyan]>>>[/cyan] Project: [bold]{project_name or project}[/bold] [dim](auto-detected)[/dim]")
-        else:
-            console.print(f"[cyan]>>>[/cyan] Project: [bold]{project_name or project}[/bold]")
-    else:
-        console.print(f"[yellow]>>>[/yellow] [dim]No project linked (not in a project directory)[/dim]")
-
-    if hours:
-        if time_parsed:
-            console.print(f"[cyan]>>>[/cyan] Time: [bold]{hours}h[/bold] [dim](parsed from message)[/dim]")
-        else:
-            console.print(f"[cyan]>>>[/cyan] Time: [bold]{hours}h[/bold]")
-
-    # Contextual hints
-    if project:
-        # Check if session is active
-        from .display import get_icon
-        session_manager = SessionManager.get_instance(storage)
-        active_session = session_manager.get_active_session()
-        use_emojis = storage.config.get("use_emojis", True)
-
-        if not active_session:
-            tip = get_icon("bulb", use_emojis)
-            console.print(f"\n[dim]{tip} Track time? -> jnl start {project}[/dim]")
-        elif active_session.project_id != project:
-            warn = get_icon("warning", use_emojis)
-            console.print(f"\n[dim]{warn} Active session on {active_session.project_id}. Switch? -> jnl stop && jnl start {project}[/dim]")
-
-
-@main.command()
-@click.option("--project", "-p", help="Export context for specific project (use '.' for current directory)")
-@click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
-@click.argument("question", required=False)
-def ctx(project, format, question):
-    """Export context for LLM analysis.
-
-    Generates a markdown summary of active projects and recent activity
-    that you can copy/paste to Claude or other AI assistants.
-
-    Usage:
-        jnl ctx
-        jnl ctx "what should I work on today?"
-        jnl ctx --project mica
-        jnl ctx --format json
-        jnl ctx .                    (current directory project)
-        jnl ctx --project . "question"
-    """
-    storage = get_storage()
-
-    # Handle '.' shortcut for current directory
-    if question == ".":
-        # User typed: jnl ctx .
-        project = "."
-        question = None
-
-    if project == ".":
-        # Auto-detect project from current directory
-        cwd = Path.cwd()
-        potential_id = slugify(cwd.name)
-        proj = storage.load_project(potential_id)
-        if not proj:
-            print_error(f"No project found matching current directory: {cwd.name}")
-            print_info(f"Tried project ID: {potential_id}")
-            return
-        project = potential_id
-
-    # Get projects
-    if project:
-        proj = storage.load_project(project)
-        if not proj:
-            print_error(f"Project '{project}' not found")
-            return
-        projects = [proj]
-    else:
-        projects = storage.list_projects()
-        # Filter to active only
-        projects = [p for p in projects if p.status != "completed"]
-
-    # Get recent logs
-    recent_logs = storage.get_recent_logs(days=7)
-
-    # Output in requested format
-    if format == "json":
-        import json
-        # Filter to active projects for context
-        active_projects = [p for p in projects if p.status != "completed" and p.days_since_active() <= 14]
-
-        # Build JSON context
-        context_data = {
-            "active_projects": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "full_name": p.full_name,
-                    "completion": p.completion,
-                    "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
-                    "days_since_active": p.days_since_active(),
-                    "next_steps": p.next_steps,
-                    "blockers": p.blockers,
-                    "tags": p.tags,
-                    "priority": p.priority,
-                    "project_type": p.project_type,
-                    "github": p.github,
-                    "claude_project": p.claude_project,
-                }
-                for p in active_projects
-            ],
-            "recent_logs": recent_logs,
-        }
-
-        if question:
-            context_data["question"] = question
-
-        print(json.dumps(context_data, indent=2))
-    else:
-        # Print context
-        print_context_export(projects, recent_logs, question)
-
-
-@main.command()
-@click.argument("question")
-@click.option("--project", "-p", help="Focus on specific project (use '.' for current directory)")
-def ask(question, project):
-    """Format a question with auto-gathered context.
-
-    This is similar to 'ctx' but formats output specifically as a question
-    for AI assistants.
-
-    Usage:
-        jnl ask "what should I work on today?"
-        jnl ask "how can I finish this faster?" --project mica
-        jnl ask "what's next?" --project .
-    """
-    storage = get_storage()
-
-    # Handle '.' shortcut for current directory
-    if project == ".":
-        cwd = Path.cwd()
-        potential_id = slugify(cwd.name)
-        proj = storage.load_project(potential_id)
-        if not proj:
-            print_error(f"No project found matching current directory: {cwd.name}")
-            print_info(f"Tried project ID: {potential_id}")
-            return
-        project = potential_id
-
-    # Get projects
-    if project:
-        proj = storage.load_project(project)
-        if not proj:
-            print_error(f"Project '{project}' not found")
-            return
-        projects = [proj]
-    else:
-        projects = storage.list_projects()
-        # Filter to active only
-        projects = [p for p in projects if p.status != "completed"]
-
-    # Get recent logs
-    recent_logs = storage.get_recent_logs(days=7)
-
-    # Print context with question prominently
-    print_context_export(projects, recent_logs, question)
-
-
-@main.command()
-@click.argument("project_id")
-@click.option("--yes", is_flag=True, help="Skip prompts (non-interactive mode)")
-@click.option("--skip-celebration", is_flag=True, help="Skip celebration (AI-friendly)")
-@click.pass_context
-def done(ctx, project_id, yes, skip_celebration):
-    """Mark a project as complete with celebration ritual!"""
-    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
-    storage = get_storage(no_emoji)
-    config = storage.config
-
-    project = storage.load_project(project_id)
-    if not project:
-        print_error(f"Project '{project_id}' not found")
-        return
-
-    if project.status == "completed":
-        print_info(f"{project.name} is already completed!")
-        return
-
-    # Ask what they learned (skip if --yes)
-    if not yes:
-        learned = click.prompt("\nWhat did you learn?", default="", show_default=False)
-        if learned:
-            project.learned = learned
-
-        # Optional: how do you feel?
-        feeling = click.prompt("How do you feel? (optional)", default="", show_default=False)
-        if feeling:
-            # Append to notes
-            project.notes += f"\n\n## Completion Reflection\n{feeling}\n"
-
-    # Mark as complete
-    project.completion = 100
-    project.status = "completed"
-    project.last_active = date.today()
-
-    storage.move_to_completed(project)
-    storage.update_project_index()
-
-    # Count total completed
-    completed = [p for p in storage.list_projects() if p.status == "completed"]
-
-    # Celebrate! (skip if --yes or --skip-celebration)
-    if not skip_celebration and not yes and config.get("completion_celebration"):
-        use_emojis = config.get("use_emojis", True)
-        print_completion_celebration(project, len(completed), use_emojis)
-    else:
-        print_success(f"Project '{project.name}' marked as complete!")
-
-
-@main.command()
-@click.argument("project_id")
-def resume(project_id):
-    """Restore context for picking up work on a project."""
-    storage = get_storage()
-
-    project = storage.load_project(project_id)
-    if not project:
-        print_error(f"Project '{project_id}' not found")
-        return
-
-    console.print(f"\n[bold]Resuming: {project.name}[/bold]\n")
-
-    console.print(f"Last worked: {project.last_active} ({project.days_since_active()} days ago)")
-    console.print(f"Completion: {project.completion}%\n")
-
-    if project.next_steps:
-        console.print(f"[bold cyan]Next steps:[/bold cyan] {project.next_steps}\n")
-
-    if project.blockers:
-        console.print(f"[bold red]Blockers:[/bold red] {project.blockers}\n")
-
-    if project.claude_project:
-        console.print(f"[dim]Claude:[/dim] {project.claude_project}")
-
-    if project.github:
-        console.print(f"[dim]GitHub:[/dim] {project.github}")
-
-    console.print()
-
-    # Update last_active
-    project.last_active = date.today()
-    storage.save_project(project)
-
-
-@main.command(name="list")
-@click.option("--active", is_flag=True, help="Show only active projects")
-@click.option("--dormant", is_flag=True, help="Show only dormant projects")
-@click.option("--completed", is_flag=True, help="Show only completed projects")
-@click.option("--archived", is_flag=True, help="Show only archived projects")
-@click.option("--tag", help="Filter by tag")
-@click.option("--show-id", is_flag=True, help="Show project IDs in output")
-@click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
-def list_projects(active, dormant, completed, archived, tag, show_id, format):
-    """List all projects with optional filters."""
-    storage = get_storage()
-
-    # Include archived if specifically requested
-    include_archived = archived
-    projects = storage.list_projects(include_archived=include_archived)
-
-    # Apply filters
-    dormant_days = storage.config.get("dormant_days", 14)
-
-    if active:
-        projects = [p for p in projects if p.status == "in-progress" and p.days_since_active() <= dormant_days]
-        title = "Active Projects"
-    elif dormant:
-        projects = [p for p in projects if p.days_since_active() > dormant_days and p.status not in ["completed", "archived"]]
-        title = "Dormant Projects"
-    elif completed:
-        projects = [p for p in projects if p.status == "completed"]
-        title = "Completed Projects"
-    elif archived:
-        projects = [p for p in projects if p.status == "archived"]
-        title = "Archived Projects"
-    else:
-        title = "All Projects (excluding archived)"
-
-    if tag:
-        projects = [p for p in projects if tag in p.tags]
-        title += f" (tag: {tag})"
-
-    if format == "json":
-        import json
-        # Convert projects to JSON-serializable format
-        projects_data = []
-        for p in projects:
-            projects_data.append({
-                "id": p.id,
-                "name": p.name,
-                "full_name": p.full_name,
-                "status": p.status,
-                "tags": p.tags,
-                "created": p.created.isoformat() if hasattr(p.created, 'isoformat') else str(p.created),
-                "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
-                "days_since_active": p.days_since_active(),
-                "completion": p.completion,
-                "priority": p.priority,
-                "project_type": p.project_type,
-                "github": p.github,
-                "claude_project": p.claude_project,
-                "next_steps": p.next_steps,
-                "blockers": p.blockers,
-            })
-        print(json.dumps({"projects": projects_data, "count": len(projects_data), "filter": title}, indent=2))
-    else:
-        print_list(projects, title=title, show_id=show_id)
-
-
 @main.command()
 @click.argument("project_id")
 @click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
@@ -1365,6 +824,7 @@ def get(project_id, format):
         jnl get myproject
         jnl get myproject --format json
     """
+    from .display import console, print_error
     storage = get_storage()
 
     project = storage.load_project(project_id)
@@ -1459,7 +919,9 @@ def query(filter_expr, project_type, status, tag, priority, dormant, dormant_day
         status=in-progress
         completion>50
     """
+    from .display import print_info, print_list
     storage = get_storage()
+    today = date.today()
     projects = storage.list_projects(include_archived=(status == "archived"))
 
     # Apply filters
@@ -1483,7 +945,7 @@ def query(filter_expr, project_type, status, tag, priority, dormant, dormant_day
 
         # Dormant filter
         if dormant:
-            if p.status == "completed" or p.days_since_active() <= dormant_days:
+            if p.status == "completed" or p.days_since_active(today) <= dormant_days:
                 continue
 
         # Nearly done filter
@@ -1559,7 +1021,7 @@ def query(filter_expr, project_type, status, tag, priority, dormant, dormant_day
                     "tags": p.tags,
                     "created": p.created.isoformat() if hasattr(p.created, 'isoformat') else str(p.created),
                     "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
-                    "days_since_active": p.days_since_active(),
+                    "days_since_active": p.days_since_active(today),
                     "completion": p.completion,
                     "priority": p.priority,
                     "project_type": p.project_type,
@@ -1628,7 +1090,9 @@ def batch(filter_expr, project_type, status, tag, priority, dormant, dormant_day
         # Set completion on nearly-done projects
         jnl batch --filter "completion>80" --action set-completion --action-value 90
     """
+    from .display import console, print_info
     storage = get_storage()
+    today = date.today()
     projects = storage.list_projects(include_archived=(status == "archived"))
 
     # Apply same filters as query command
@@ -1643,7 +1107,7 @@ def batch(filter_expr, project_type, status, tag, priority, dormant, dormant_day
         if priority and p.priority != priority:
             continue
         if dormant:
-            if p.status == "completed" or p.days_since_active() <= dormant_days:
+            if p.status == "completed" or p.days_since_active(today) <= dormant_days:
                 continue
 
         # Custom filter expression
@@ -1832,6 +1296,7 @@ def update(project_id, completion, priority, add_tags, remove_tags, next_steps,
         jnl update myproject --status in-progress
         jnl update myproject --completion 75 --priority high --format json
     """
+    from .display import console, print_error, print_success
     storage = get_storage()
 
     project = storage.load_project(project_id)
@@ -1917,315 +1382,6 @@ def update(project_id, completion, priority, add_tags, remove_tags, next_steps,
             console.print(f"  - {change}")
 
 
-@main.command()
-@click.argument("project_id")
-def edit(project_id):
-    """Open project file in editor."""
-    storage = get_storage()
-    config = storage.config
-
-    project = storage.load_project(project_id)
-    if not project:
-        print_error(f"Project '{project_id}' not found")
-        return
-
-    # Determine file path
-    if project.status == "completed":
-        file_path = config.completed_dir / project.file_name
-    else:
-        file_path = config.projects_dir / project.file_name
-
-    # Open in editor
-    editor = config.get("editor", "notepad")
-    import subprocess
-
-    try:
-        subprocess.run([editor, str(file_path)], check=True)
-    except Exception as e:
-        print_error(f"Failed to open editor: {e}")
-        print_info(f"File location: {file_path}")
-
-
-@main.command()
-@click.argument("project_id")
-@click.argument("url", required=False)
-@click.option("--github", is_flag=True, help="Add as GitHub URL")
-@click.option("--claude", is_flag=True, help="Add as Claude project URL")
-def link(project_id, url, github, claude):
-    """Add GitHub or Claude links to a project.
-
-    If no URL is provided, attempts to auto-detect from git repo.
-    """
-    storage = get_storage()
-
-    project = storage.load_project(project_id)
-    if not project:
-        print_error(f"Project '{project_id}' not found")
-        return
-
-    # Auto-detect if no URL provided
-    if not url:
-        git_url = detect_git_repo()
-        if git_url:
-            if click.confirm(f"Detected git repo: {git_url}\nLink to this project?", default=True):
-                url = git_url
-                github = True
-            else:
-                print_info("Cancelled")
-                return
-        else:
-            print_error("No URL provided and no git repo detected")
-            return
-
-    if github or "github.com" in url:
-        project.github = url
-        print_success(f"Added GitHub link to {project.name}")
-    elif claude or "claude.ai" in url:
-        project.claude_project = url
-        print_success(f"Added Claude project link to {project.name}")
-    else:
-        # Ask which type
-        if click.confirm("Is this a GitHub URL?", default=True):
-            project.github = url
-        else:
-            project.claude_project = url
-        print_success(f"Added link to {project.name}")
-
-    storage.save_project(project)
-
-
-@main.command()
-@click.argument("text")
-def note(text):
-    """Quick note capture (goes to today's log and current project if detected)."""
-    storage = get_storage()
-
-    # Try to detect current project
-    cwd = Path.cwd()
-    potential_id = slugify(cwd.name)
-    project = None
-
-    if storage.load_project(potential_id):
-        project = potential_id
-
-    # Add to log
-    entry = LogEntry(
-        date=date.today(),
-        project=project,
-        message=f"Note: {text}",
-    )
-
-    storage.add_log_entry(entry)
-    print_success("Note saved")
-    if project:
-        print_info(f"Associated with project: {project}")
-
-
-@main.command()
-@click.argument("project_ids", nargs=-1, required=True)
-@click.option("--dormant", is_flag=True, help="Archive all dormant projects")
-@click.option("--yes", is_flag=True, help="Skip confirmation (non-interactive mode)")
-@click.pass_context
-def archive(ctx, project_ids, dormant, yes):
-    """Archive projects to clear them from active view.
-
-    Archives are for projects you're shelving (not finishing).
-    Use 'done' for completed projects.
-
-    Usage:
-        jnl archive my-project
-        jnl archive project1 project2 project3
-        jnl archive --dormant (archives all dormant projects)
-        jnl archive --dormant --yes (non-interactive)
-    """
-    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
-    storage = get_storage(no_emoji)
-    config = storage.config
-
-    projects_to_archive = []
-
-    if dormant:
-        # Archive all dormant projects
-        dormant_days = config.get("dormant_days", 14)
-        all_projects = storage.list_projects()
-        projects_to_archive = [
-            p for p in all_projects
-            if p.status == "in-progress" and p.days_since_active() > dormant_days
-        ]
-
-        if not projects_to_archive:
-            print_info("No dormant projects to archive")
-            return
-
-        console.print(f"\n[yellow]Found {len(projects_to_archive)} dormant projects:[/yellow]")
-        for p in projects_to_archive:
-            console.print(f"  - {p.name} (inactive for {p.days_since_active()} days)")
-
-        if not yes and not click.confirm("\nArchive all these projects?", default=False):
-            print_info("Cancelled")
-            return
-    else:
-        # Archive specific projects
-        for project_id in project_ids:
-            project = storage.load_project(project_id)
-            if not project:
-                print_error(f"Project '{project_id}' not found")
-                continue
-            if project.status == "archived":
-                print_info(f"{project.name} is already archived")
-                continue
-            projects_to_archive.append(project)
-
-    # Archive them
-    for project in projects_to_archive:
-        storage.move_to_archived(project)
-        print_success(f"Archived: {project.name}")
-
-    storage.update_project_index()
-
-    if len(projects_to_archive) > 1:
-        console.print(f"\n[green]Archived {len(projects_to_archive)} projects[/green]")
-
-
-@main.command()
-@click.argument("project_id")
-@click.pass_context
-def unarchive(ctx, project_id):
-    """Restore an archived project back to active.
-
-    Usage:
-        jnl unarchive my-project
-    """
-    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
-    storage = get_storage(no_emoji)
-
-    project = storage.load_project(project_id)
-    if not project:
-        print_error(f"Project '{project_id}' not found")
-        return
-
-    if project.status != "archived":
-        print_error(f"{project.name} is not archived")
-        return
-
-    storage.unarchive_project(project)
-    storage.update_project_index()
-
-    print_success(f"Unarchived: {project.name}")
-    print_info("Project is now active again")
-
-
-@main.command()
-@click.pass_context
-def wins(ctx):
-    """Show completed projects and achievements."""
-    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
-    storage = get_storage(no_emoji)
-    config = storage.config
-    use_emojis = config.get("use_emojis", True)
-
-    completed = [p for p in storage.list_projects(status="completed")]
-
-    if not completed:
-        print_info("No completed projects yet. Finish one with: jnl done <project>")
-        return
-
-    # Sort by completion date (last_active)
-    completed.sort(key=lambda p: p.last_active, reverse=True)
-
-    from .display import get_icon
-    check = get_icon("check", use_emojis)
-    party = get_icon("party", use_emojis)
-    fire = get_icon("fire", use_emojis)
-
-    console.print(f"\n[bold green]{check} COMPLETED PROJECTS[/bold green]", f"({len(completed)})\n")
-
-    # Show recent completions
-    recent = completed[:5]
-    console.print("[bold]Recent completions:[/bold]")
-    for p in recent:
-        from .utils import format_date_relative
-        console.print(f"  {party} {p.name:<30} (completed {format_date_relative(p.last_active)})")
-        if p.learned:
-            console.print(f"     [dim]Learned: {p.learned}[/dim]")
-
-    if len(completed) > 5:
-        console.print(f"\n[dim]All time:[/dim] {', '.join([p.name for p in completed[5:]])}")
-
-    # Calculate streak (completions in last 30 days)
-    recent_wins = [p for p in completed if p.days_since_active() <= 30]
-    if recent_wins:
-        console.print(f"\n[bold yellow]{fire} Current streak:[/bold yellow] {len(recent_wins)} completion(s) in the last month!")
-
-    console.print()
-
-
-@main.command()
-@click.pass_context
-def stats(ctx):
-    """Show overall statistics and insights."""
-    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
-    storage = get_storage(no_emoji)
-    config = storage.config
-
-    all_projects = storage.list_projects()
-
-    # Categorize
-    dormant_days = config.get("dormant_days", 14)
-    active = [p for p in all_projects if p.status == "in-progress" and p.days_since_active() <= dormant_days]
-    dormant = [p for p in all_projects if p.status == "in-progress" and p.days_since_active() > dormant_days]
-    completed = [p for p in all_projects if p.status == "completed"]
-
-    console.print("\n[bold]📊 JOURNEL Statistics[/bold]\n" if config.get("use_emojis") else "\n[bold]JOURNEL Statistics[/bold]\n")
-
-    # Project counts
-    console.print("[bold]Projects:[/bold]")
-    console.print(f"  Active: {len(active)}")
-    console.print(f"  Dormant: {len(dormant)}")
-    console.print(f"  Completed: {len(completed)}")
-    console.print(f"  Total: {len(all_projects)}")
-
-    # Completion rate
-    if len(all_projects) > 0:
-        completion_rate = (len(completed) / len(all_projects)) * 100
-        console.print(f"\n[bold]Completion Rate:[/bold] {completion_rate:.1f}%")
-
-    # Time statistics
-    time_stats = storage.get_time_stats(days=30)
-    if time_stats["total_hours"] > 0:
-        console.print(f"\n[bold]Time Logged (last 30 days):[/bold]")
-        console.print(f"  Total: {time_stats['total_hours']:.1f} hours")
-
-        # Top projects by time
-        if time_stats["by_project"]:
-            sorted_projects = sorted(time_stats["by_project"].items(), key=lambda x: x[1], reverse=True)
-            console.print(f"\n  [bold]Top projects:[/bold]")
-            for proj_name, hours in sorted_projects[:5]:
-                console.print(f"    {proj_name}: {hours:.1f}h")
-
-    # Recent activity
-    recent_active = [p for p in all_projects if p.days_since_active() <= 7]
-    console.print(f"\n[bold]Active This Week:[/bold] {len(recent_active)} projects")
-
-    # Streak
-    recent_completions = [p for p in completed if p.days_since_active() <= 30]
-    if recent_completions:
-        console.print(f"[bold]Recent Wins:[/bold] {len(recent_completions)} completions in last 30 days")
-
-    # Most complete project
-    in_progress = [p for p in all_projects if p.status == "in-progress"]
-    if in_progress:
-        most_complete = max(in_progress, key=lambda p: p.completion)
-        console.print(f"\n[bold]Closest to Done:[/bold] {most_complete.name} ({most_complete.completion}%)")
-
-    # Oldest active project
-    if active:
-        oldest = min(active, key=lambda p: p.last_active)
-        console.print(f"[bold]Oldest Active:[/bold] {oldest.name} (last worked {oldest.days_since_active()} days ago)")
-
-    console.print()
-
-
 @main.command()
 @click.pass_context
 def tui(ctx):
@@ -2235,6 +1391,7 @@ def tui(ctx):
     Navigate with arrow keys or vim keys (j/k).
     Press ? for help.
     """
+    from .display import print_error, print_info
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
 
@@ -2267,6 +1424,8 @@ def start(ctx, project_id, task, force):
 
     The session will track elapsed time and remind you to take breaks.
     """
+    from .display import print_error, print_info
+    from .session import SessionManager
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
     session_manager = SessionManager.get_instance(storage)
@@ -2304,6 +1463,8 @@ def stop(ctx, notes):
         jnl stop                               - End session (interactive)
         jnl stop "Completed feature X"         - End with notes
     """
+    from .display import print_error, print_info
+    from .session import SessionManager
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
     session_manager = SessionManager.get_instance(storage)
@@ -2342,6 +1503,8 @@ def pause(ctx):
         jnl pause                              - Pause current session
         jnl continue                           - Resume later
     """
+    from .display import print_error
+    from .session import SessionManager
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
     session_manager = SessionManager.get_instance(storage)
@@ -2369,6 +1532,8 @@ def continue_session(ctx):
     Usage:
         jnl continue                           - Resume paused session
     """
+    from .display import print_error
+    from .session import SessionManager
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
     session_manager = SessionManager.get_instance(storage)
@@ -2386,50 +1551,6 @@ def continue_session(ctx):
         print_error(str(e))
 
 
-@main.command()
-def sync():
-    """Sync JOURNEL data with git remote.
-
-    Performs git pull, then git push to sync your ~/.journel directory
-    across machines.
-    """
-    storage = get_storage()
-
-    if not storage.repo:
-        print_error("Git repository not initialized. Run 'journel init' first.")
-        return
-
-    try:
-        console.print("[cyan]Syncing with git remote...[/cyan]")
-
-        # Check if remote exists
-        if not storage.repo.remotes:
-            print_error("No git remote configured.")
-            print_info("Set up a remote with: cd ~/.journel && git remote add origin <url>")
-            return
-
-        origin = storage.repo.remotes.origin
-
-        # Pull first
-        console.print("Pulling changes...")
-        origin.pull()
-
-        # Commit any local changes
-        if storage.repo.is_dirty():
-            storage.repo.index.add(["."])
-            storage.repo.index.commit("Sync: local changes")
-
-        # Push
-        console.print("Pushing changes...")
-        origin.push()
-
-        print_success("Sync complete!")
-
-    except Exception as e:
-        print_error(f"Sync failed: {e}")
-        print_info("You can manually sync with: cd ~/.journel && git pull && git push")
-
-
 # ===== AI Provider Setup Commands =====
 
 @main.group(name="setup")
@@ -2497,6 +1618,7 @@ def setup_all():
     Sets up JOURNEL integration for all supported AI assistants at once.
     You can skip individual providers if you don't use them.
     """
+    from .display import console
     console.print("\n[bold cyan]Setting up JOURNEL for all AI providers[/bold cyan]")
     console.print("You'll be prompted for each provider. Skip any you don't use.\n")
 
@@ -2538,6 +1660,7 @@ def setup_all():
 
 def _setup_provider_interactive(provider: str):
     """Interactive setup for any AI provider."""
+    from .display import console, print_error, print_success
     provider_config = AI_PROVIDERS[provider]
     provider_name = provider_config["name"]
     command_file = _get_provider_command_path(provider)
@@ -2657,6 +1780,7 @@ def ai_setup_cursor_new():
 
 def _ai_setup_provider(provider: str):
     """Non-interactive setup for any AI provider (LLM-friendly)."""
+    from .display import console
     provider_config = AI_PROVIDERS[provider]
     provider_name = provider_config["name"]
     command_file = _get_provider_command_path(provider)
@@ -2693,6 +1817,7 @@ def _ai_setup_provider(provider: str):
 @main.command(name="setup-claude", hidden=True)
 def setup_claude_deprecated():
     """Deprecated: Use 'jnl setup claude' instead."""
+    from .display import console
     console.print("[yellow]Note:[/yellow] 'jnl setup-claude' is deprecated. Use 'jnl setup claude' instead.")
     console.print()
     _setup_provider_interactive("claude")
@@ -2701,6 +1826,7 @@ def setup_claude_deprecated():
 @main.command(name="ai-setup-claude", hidden=True)
 def ai_setup_claude_deprecated():
     """Deprecated: Use 'jnl ai-setup claude' instead."""
+    from .display import console
     console.print("[yellow]Note:[/yellow] 'jnl ai-setup-claude' is deprecated. Use 'jnl ai-setup claude' instead.")
     console.print()
     _ai_setup_provider("claude")
@@ -2728,7 +1854,11 @@ def ai_log(project_or_message, message, hours, agent):
     This is for Tier 1 (Suggested Actions) - the user must explicitly approve and run
     this command. For Claude Code users, this can be used via slash commands.
     """
+    from .display import console, print_success
+    from .models import LogEntry
+    from .utils import parse_time_from_message
     storage = get_storage()
+    today = date.today()
 
     # Same logic as regular log command
     project_auto_detected = False
@@ -2736,15 +1866,15 @@ def ai_log(project_or_message, message, hours, agent):
 
     # Determine if first arg is project or message
     project = None
+    proj = None
     if message is not None:
         project = project_or_message
         actual_message = message
     else:
         actual_message = project_or_message
-        cwd = Path.cwd()
-        potential_id = slugify(cwd.name)
-        if storage.load_project(potential_id):
-            project = potential_id
+        proj = detect_current_project(storage)
+        if proj:
+            project = proj.id
             project_auto_detected = True
 
     # Parse time from message if not explicitly provided
@@ -2756,7 +1886,7 @@ def ai_log(project_or_message, message, hours, agent):
 
     # Create log entry with AI attribution
     entry = LogEntry(
-        date=date.today(),
+        date=today,
         project=project,
         message=actual_message,
         hours=hours,
@@ -2769,11 +1899,13 @@ def ai_log(project_or_message, message, hours, agent):
     # Update project last_active
     project_name = None
     if project:
-        proj = storage.load_project(project)
+        proj = proj or storage.load_project(project)
         if proj:
-            proj.last_active = date.today()
-            storage.save_project(proj)
-            storage.update_project_index()
+            # Only rewrite the project and index the first time each day
+            if proj.last_active != today:
+                proj.last_active = today
+                storage.save_project(proj)
+                storage.update_project_index()
             project_name = proj.name
 
     # Enhanced feedback with AI marker
@@ -2815,6 +1947,8 @@ def ai_start(ctx, project_id, task, force, agent):
 
     This enables tracking of pair programming sessions with AI assistants.
     """
+    from .display import console, print_error, print_info
+    from .session import SessionManager
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
     session_manager = SessionManager.get_instance(storage)
@@ -2859,6 +1993,8 @@ def ai_stop(ctx, notes, agent):
 
     Prompts focus on learning and knowledge transfer from AI collaboration.
     """
+    from .display import console, print_error, print_info
+    from .session import SessionManager
     no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
     storage = get_storage(no_emoji)
     session_manager = SessionManager.get_instance(storage)
@@ -2911,7 +2047,9 @@ def import_group():
 @click.option("--ai-mode", is_flag=True, help="AI-friendly mode (plain text I/O)")
 @click.option("--json", "json_output", is_flag=True, help="JSON Lines output (implies --ai-mode)")
 @click.option("--force-new", is_flag=True, help="Start new session (ignore existing state)")
-def import_github(recent, resume, preview, archive_remaining, include_archived, include_forks, ai_mode, json_output, force_new):
+@click.option("--refresh", is_flag=True, help="Re-fetch the repo list when resuming")
+@click.option("--batch-json", is_flag=True, help="JSON mode with one decision array per batch (implies --json)")
+def import_github(recent, resume, preview, archive_remaining, include_archived, include_forks, ai_mode, json_output, force_new, refresh, batch_json):
     """Import GitHub repos as JOURNEL projects.
 
     ADHD-friendly batch workflow:
@@ -2938,6 +2076,8 @@ def import_github(recent, resume, preview, archive_remaining, include_archived,
         ai_mode=ai_mode,
         json_output=json_output,
         force_new=force_new,
+        refresh=refresh,
+        batch_json=batch_json,
     )
 
 
@@ -2967,6 +2107,7 @@ def help_command(ctx, command, show_all):
       jnl help status       Quick help for 'status' command
       jnl help --all        See all 26+ commands
     """
+    from .display import console, print_error, print_info
     from .help_text import get_simplified_help, get_full_help, get_command_help
 
     # jnl help <command> - Show focused help for specific command
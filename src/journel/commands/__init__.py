@@ -0,0 +1,47 @@
+"""Lazily-loaded JOURNEL subcommands.
+
+Each module in this package defines a single Click command exposed as `cmd`;
+`journel.cli.LazyGroup` imports a module only when its command is invoked.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..models import Project
+    from ..storage import Storage
+
+
+def get_storage(no_emoji: bool = False) -> "Storage":
+    """Get storage instance with config.
+
+    The instance is cached on the root Click context, so every call made
+    during one CLI invocation shares a single Config/Storage pair.
+    """
+    import click
+
+    ctx = click.get_current_context(silent=True)
+    cache = ctx.find_root().meta if ctx is not None else {}
+    key = f"journel.storage.no_emoji={no_emoji}"
+
+    storage = cache.get(key)
+    if storage is None:
+        from ..config import Config
+        from ..storage import Storage
+        config = Config()
+        if no_emoji:
+            config.set("use_emojis", False)
+        storage = cache[key] = Storage(config)
+    return storage
+
+
+def current_project_id() -> str:
+    """Get the project ID the current directory name maps to."""
+    from pathlib import Path
+
+    from ..utils import slugify
+    return slugify(Path.cwd().name)
+
+
+def detect_current_project(storage: "Storage") -> Optional["Project"]:
+    """Find the project whose ID matches the current directory name."""
+    return storage.load_project(current_project_id())
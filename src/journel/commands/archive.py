@@ -0,0 +1,83 @@
+"""jnl archive: Archive projects to clear them from active view."""
+
+from datetime import date
+
+import click
+
+from ..display import console, print_error, print_info, print_success
+from . import get_storage
+
+
+@click.command()
+@click.argument("project_ids", nargs=-1)
+@click.option("--dormant", is_flag=True, help="Archive all dormant projects")
+@click.option("--yes", is_flag=True, help="Skip confirmation (non-interactive mode)")
+@click.pass_context
+def archive(ctx, project_ids, dormant, yes):
+    """Archive projects to clear them from active view.
+
+    Archives are for projects you're shelving (not finishing).
+    Use 'done' for completed projects.
+
+    Usage:
+        jnl archive my-project
+        jnl archive project1 project2 project3
+        jnl archive --dormant (archives all dormant projects)
+        jnl archive --dormant --yes (non-interactive)
+    """
+    if not project_ids and not dormant:
+        raise click.UsageError("Specify project IDs to archive, or use --dormant")
+
+    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
+    storage = get_storage(no_emoji)
+    today = date.today()
+    config = storage.config
+
+    projects_to_archive = []
+
+    if dormant:
+        # Archive all dormant projects
+        dormant_days = config.get("dormant_days", 14)
+        all_projects = storage.list_projects()
+        projects_to_archive = [
+            p for p in all_projects
+            if p.status == "in-progress" and p.days_since_active(today) > dormant_days
+        ]
+
+        if not projects_to_archive:
+            print_info("No dormant projects to archive")
+            return
+
+        console.print(f"\n[yellow]Found {len(projects_to_archive)} dormant projects:[/yellow]")
+        for p in projects_to_archive:
+            console.print(f"  - {p.name} (inactive for {p.days_since_active(today)} days)")
+
+        if not yes and not click.confirm("\nArchive all these projects?", default=False):
+            print_info("Cancelled")
+            return
+    else:
+        # Archive specific projects (one directory scan for all ids)
+        projects_by_id = storage.get_projects_by_id()
+        for project_id in project_ids:
+            project = projects_by_id.get(project_id)
+            if not project:
+                print_error(f"Project '{project_id}' not found")
+                continue
+            if project.status == "archived":
+                print_info(f"{project.name} is already archived")
+                continue
+            projects_to_archive.append(project)
+
+    # Archive them
+    for project in projects_to_archive:
+        storage.move_to_archived(project)
+        print_success(f"Archived: {project.name}")
+
+    # One index rebuild for the whole batch
+    storage.update_project_index()
+
+    if len(projects_to_archive) > 1:
+        console.print(f"\n[green]Archived {len(projects_to_archive)} projects[/green]")
+
+
+cmd = archive
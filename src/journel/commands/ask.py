@@ -0,0 +1,55 @@
+"""jnl ask: Format a question with auto-gathered context."""
+
+from pathlib import Path
+
+import click
+
+from ..display import print_context_export, print_error, print_info
+from . import current_project_id, detect_current_project, get_storage
+
+
+@click.command()
+@click.argument("question")
+@click.option("--project", "-p", help="Focus on specific project (use '.' for current directory)")
+def ask(question, project):
+    """Format a question with auto-gathered context.
+
+    This is similar to 'ctx' but formats output specifically as a question
+    for AI assistants.
+
+    Usage:
+        jnl ask "what should I work on today?"
+        jnl ask "how can I finish this faster?" --project mica
+        jnl ask "what's next?" --project .
+    """
+    storage = get_storage()
+
+    # Handle '.' shortcut for current directory
+    if project == ".":
+        proj = detect_current_project(storage)
+        if not proj:
+            print_error(f"No project found matching current directory: {Path.cwd().name}")
+            print_info(f"Tried project ID: {current_project_id()}")
+            return
+    elif project:
+        proj = storage.load_project(project)
+        if not proj:
+            print_error(f"Project '{project}' not found")
+            return
+
+    # Get projects
+    if project:
+        projects = [proj]
+    else:
+        projects = storage.list_projects()
+        # Filter to active only
+        projects = [p for p in projects if p.status != "completed"]
+
+    # Get recent logs
+    recent_logs = storage.get_recent_logs(days=7)
+
+    # Print context with question prominently
+    print_context_export(projects, recent_logs, question)
+
+
+cmd = ask
@@ -0,0 +1,101 @@
+"""jnl ctx: Export context for LLM analysis."""
+
+from datetime import date
+from pathlib import Path
+
+import click
+
+from ..display import print_context_export, print_error, print_info
+from . import current_project_id, detect_current_project, get_storage
+
+
+@click.command()
+@click.option("--project", "-p", help="Export context for specific project (use '.' for current directory)")
+@click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
+@click.argument("question", required=False)
+def ctx(project, format, question):
+    """Export context for LLM analysis.
+
+    Generates a markdown summary of active projects and recent activity
+    that you can copy/paste to Claude or other AI assistants.
+
+    Usage:
+        jnl ctx
+        jnl ctx "what should I work on today?"
+        jnl ctx --project mica
+        jnl ctx --format json
+        jnl ctx .                    (current directory project)
+        jnl ctx --project . "question"
+    """
+    storage = get_storage()
+    today = date.today()
+
+    # Handle '.' shortcut for current directory
+    if question == ".":
+        # User typed: jnl ctx .
+        project = "."
+        question = None
+
+    if project == ".":
+        # Auto-detect project from current directory
+        proj = detect_current_project(storage)
+        if not proj:
+            print_error(f"No project found matching current directory: {Path.cwd().name}")
+            print_info(f"Tried project ID: {current_project_id()}")
+            return
+    elif project:
+        proj = storage.load_project(project)
+        if not proj:
+            print_error(f"Project '{project}' not found")
+            return
+
+    # Get projects
+    if project:
+        projects = [proj]
+    else:
+        projects = storage.list_projects()
+        # Filter to active only
+        projects = [p for p in projects if p.status != "completed"]
+
+    # Get recent logs
+    recent_logs = storage.get_recent_logs(days=7)
+
+    # Output in requested format
+    if format == "json":
+        import json
+        # Filter to active projects for context
+        active_projects = [p for p in projects if p.status != "completed" and p.days_since_active(today) <= 14]
+
+        # Build JSON context
+        context_data = {
+            "active_projects": [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "full_name": p.full_name,
+                    "completion": p.completion,
+                    "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
+                    "days_since_active": p.days_since_active(today),
+                    "next_steps": p.next_steps,
+                    "blockers": p.blockers,
+                    "tags": p.tags,
+                    "priority": p.priority,
+                    "project_type": p.project_type,
+                    "github": p.github,
+                    "claude_project": p.claude_project,
+                }
+                for p in active_projects
+            ],
+            "recent_logs": recent_logs,
+        }
+
+        if question:
+            context_data["question"] = question
+
+        print(json.dumps(context_data, indent=2))
+    else:
+        # Print context
+        print_context_export(projects, recent_logs, question)
+
+
+cmd = ctx
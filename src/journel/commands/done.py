@@ -0,0 +1,63 @@
+"""jnl done: Mark a project as complete with celebration ritual!"""
+
+from datetime import date
+
+import click
+
+from ..display import print_completion_celebration, print_error, print_info, print_success
+from . import get_storage
+
+
+@click.command()
+@click.argument("project_id")
+@click.option("--yes", is_flag=True, help="Skip prompts (non-interactive mode)")
+@click.option("--skip-celebration", is_flag=True, help="Skip celebration (AI-friendly)")
+@click.pass_context
+def done(ctx, project_id, yes, skip_celebration):
+    """Mark a project as complete with celebration ritual!"""
+    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
+    storage = get_storage(no_emoji)
+    today = date.today()
+    config = storage.config
+
+    project = storage.load_project(project_id)
+    if not project:
+        print_error(f"Project '{project_id}' not found")
+        return
+
+    if project.status == "completed":
+        print_info(f"{project.name} is already completed!")
+        return
+
+    # Ask what they learned (skip if --yes)
+    if not yes:
+        learned = click.prompt("\nWhat did you learn?", default="", show_default=False)
+        if learned:
+            project.learned = learned
+
+        # Optional: how do you feel?
+        feeling = click.prompt("How do you feel? (optional)", default="", show_default=False)
+        if feeling:
+            # Append to notes
+            project.notes += f"\n\n## Completion Reflection\n{feeling}\n"
+
+    # Mark as complete
+    project.completion = 100
+    project.status = "completed"
+    project.last_active = today
+
+    storage.move_to_completed(project)
+    storage.update_project_index()
+
+    # Count total completed (includes this one)
+    completed_count = storage.get_completed_count()
+
+    # Celebrate! (skip if --yes or --skip-celebration)
+    if not skip_celebration and not yes and config.get("completion_celebration"):
+        use_emojis = config.get("use_emojis", True)
+        print_completion_celebration(project, completed_count, use_emojis)
+    else:
+        print_success(f"Project '{project.name}' marked as complete!")
+
+
+cmd = done
@@ -0,0 +1,46 @@
+"""jnl edit: Open project file in editor."""
+
+import os
+import sys
+
+import click
+
+from ..display import print_error, print_info
+from . import get_storage
+
+
+@click.command()
+@click.argument("project_id")
+def edit(project_id):
+    """Open project file in editor."""
+    storage = get_storage()
+    config = storage.config
+
+    project = storage.load_project(project_id)
+    if not project:
+        print_error(f"Project '{project_id}' not found")
+        return
+
+    # Determine file path
+    if project.status == "completed":
+        file_path = config.completed_dir / project.file_name
+    else:
+        file_path = config.projects_dir / project.file_name
+
+    # Open in editor
+    editor = config.get("editor", "notepad")
+
+    try:
+        if os.name == "posix":
+            # Nothing runs after the editor, so replace this process with it
+            sys.stdout.flush()
+            os.execvp(editor, [editor, str(file_path)])
+        else:
+            import subprocess
+            subprocess.run([editor, str(file_path)], check=True)
+    except Exception as e:
+        print_error(f"Failed to open editor: {e}")
+        print_info(f"File location: {file_path}")
+
+
+cmd = edit
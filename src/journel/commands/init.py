@@ -0,0 +1,28 @@
+"""jnl init: Initialize JOURNEL for first-time use."""
+
+import click
+
+from ..config import Config
+from ..display import print_error, print_info, print_success, print_welcome
+from ..storage import Storage
+
+
+@click.command()
+def init():
+    """Initialize JOURNEL for first-time use."""
+    config = Config()
+
+    # Check if already initialized
+    if config.journel_dir.exists() and (config.journel_dir / ".git").exists():
+        print_error("JOURNEL is already initialized")
+        print_info(f"Location: {config.journel_dir}")
+        return
+
+    storage = Storage(config)
+    storage.init_structure()
+
+    print_welcome()
+    print_success(f"JOURNEL initialized at {config.journel_dir}")
+
+
+cmd = init
@@ -0,0 +1,57 @@
+"""jnl link: Add GitHub or Claude links to a project."""
+
+import click
+
+from ..display import print_error, print_info, print_success
+from ..utils import detect_git_repo
+from . import get_storage
+
+
+@click.command()
+@click.argument("project_id")
+@click.argument("url", required=False)
+@click.option("--github", is_flag=True, help="Add as GitHub URL")
+@click.option("--claude", is_flag=True, help="Add as Claude project URL")
+def link(project_id, url, github, claude):
+    """Add GitHub or Claude links to a project.
+
+    If no URL is provided, attempts to auto-detect from git repo.
+    """
+    storage = get_storage()
+
+    project = storage.load_project(project_id)
+    if not project:
+        print_error(f"Project '{project_id}' not found")
+        return
+
+    # Only probe for a git repo when no URL was given
+    if not url:
+        git_url = detect_git_repo()
+        if not git_url:
+            print_error("No URL provided and no git repo detected")
+            return
+        if click.confirm(f"Detected git repo: {git_url}\nLink to this project?", default=True):
+            url = git_url
+            github = True
+        else:
+            print_info("Cancelled")
+            return
+
+    if github or "github.com" in url:
+        project.github = url
+        print_success(f"Added GitHub link to {project.name}")
+    elif claude or "claude.ai" in url:
+        project.claude_project = url
+        print_success(f"Added Claude project link to {project.name}")
+    else:
+        # Ask which type
+        if click.confirm("Is this a GitHub URL?", default=True):
+            project.github = url
+        else:
+            project.claude_project = url
+        print_success(f"Added link to {project.name}")
+
+    storage.save_project(project)
+
+
+cmd = link
@@ -0,0 +1,87 @@
+"""jnl list: List all projects with optional filters."""
+
+from datetime import date
+
+import click
+
+from ..display import print_list
+from . import get_storage
+
+
+@click.command(name="list")
+@click.option("--active", is_flag=True, help="Show only active projects")
+@click.option("--dormant", is_flag=True, help="Show only dormant projects")
+@click.option("--completed", is_flag=True, help="Show only completed projects")
+@click.option("--archived", is_flag=True, help="Show only archived projects")
+@click.option("--tag", help="Filter by tag")
+@click.option("--show-id", is_flag=True, help="Show project IDs in output")
+@click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
+def list_projects(active, dormant, completed, archived, tag, show_id, format):
+    """List all projects with optional filters."""
+    storage = get_storage()
+    today = date.today()
+
+    # Include archived if specifically requested
+    include_archived = archived
+    projects = storage.list_projects(include_archived=include_archived)
+
+    # Pick the status filter, then apply it together with the tag filter
+    dormant_days = storage.config.get("dormant_days", 14)
+
+    if active:
+        def status_ok(p):
+            return p.status == "in-progress" and p.days_since_active(today) <= dormant_days
+        title = "Active Projects"
+    elif dormant:
+        def status_ok(p):
+            return p.status not in ("completed", "archived") and p.days_since_active(today) > dormant_days
+        title = "Dormant Projects"
+    elif completed:
+        def status_ok(p):
+            return p.status == "completed"
+        title = "Completed Projects"
+    elif archived:
+        def status_ok(p):
+            return p.status == "archived"
+        title = "Archived Projects"
+    else:
+        status_ok = None
+        title = "All Projects (excluding archived)"
+
+    if tag:
+        title += f" (tag: {tag})"
+
+    if status_ok or tag:
+        projects = [
+            p for p in projects
+            if (not tag or tag in p.tags) and (status_ok is None or status_ok(p))
+        ]
+
+    if format == "json":
+        import json
+        # Convert projects to JSON-serializable format
+        projects_data = []
+        for p in projects:
+            projects_data.append({
+                "id": p.id,
+                "name": p.name,
+                "full_name": p.full_name,
+                "status": p.status,
+                "tags": p.tags,
+                "created": p.created.isoformat() if hasattr(p.created, 'isoformat') else str(p.created),
+                "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
+                "days_since_active": p.days_since_active(today),
+                "completion": p.completion,
+                "priority": p.priority,
+                "project_type": p.project_type,
+                "github": p.github,
+                "claude_project": p.claude_project,
+                "next_steps": p.next_steps,
+                "blockers": p.blockers,
+            })
+        print(json.dumps({"projects": projects_data, "count": len(projects_data), "filter": title}, indent=2))
+    else:
+        print_list(projects, title=title, show_id=show_id)
+
+
+cmd = list_projects
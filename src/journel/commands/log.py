@@ -0,0 +1,114 @@
+"""jnl log: Quick activity logging."""
+
+from datetime import date
+
+import click
+
+from ..display import console, print_success
+from ..models import LogEntry
+from ..session import SessionManager
+from ..utils import parse_time_from_message
+from . import detect_current_project, get_storage
+
+
+@click.command()
+@click.argument("project_or_message")
+@click.argument("message", required=False)
+@click.option("--hours", "-h", type=float, help="Hours spent (can also be in message like '(2h)')")
+def log(project_or_message, message, hours):
+    """Quick activity logging.
+
+    Usage:
+        jnl log "Fixed bug (2h)"                    - auto-detect project
+        jnl log journel "Fixed bug (2h)"            - explicit project
+        jnl log "Implemented feature - 3h"          - time with dash
+        jnl log myproject "worked 1.5h"             - project + time
+
+    If project is not specified, attempts to detect from current directory.
+    Time can be specified with --hours or in the message using (2h), - 3h, or "worked 1.5h".
+    """
+    storage = get_storage()
+    today = date.today()
+
+    # Track what was auto-detected for better feedback
+    project_auto_detected = False
+    time_parsed = False
+
+    # Determine if first arg is project or message
+    project = None
+    proj = None
+    if message is not None:
+        # Two args provided: first is project, second is message
+        project = project_or_message
+        actual_message = message
+    else:
+        # One arg provided: it's the message, auto-detect project
+        actual_message = project_or_message
+        proj = detect_current_project(storage)
+        if proj:
+            project = proj.id
+            project_auto_detected = True
+
+    # Parse time from message if not explicitly provided
+    if hours is None:
+        actual_message, parsed_hours = parse_time_from_message(actual_message)
+        if parsed_hours:
+            hours = parsed_hours
+            time_parsed = True
+
+    # Create log entry
+    entry = LogEntry(
+        date=today,
+        project=project,
+        message=actual_message,
+        hours=hours,
+    )
+
+    storage.add_log_entry(entry)
+
+    # Update project last_active if project specified
+    project_name = None
+    if project:
+        proj = proj or storage.load_project(project)
+        if proj:
+            # Only rewrite the project and index the first time each day
+            if proj.last_active != today:
+                proj.last_active = today
+                storage.save_project(proj)
+                storage.update_project_index()
+            project_name = proj.name
+
+    # Enhanced feedback
+    print_success(f"Logged: \"{actual_message}\"")
+
+    if project:
+        if project_auto_detected:
+            console.print(f"[cyan]>>>[/cyan] Project: [bold]{project_name or project}[/bold] [dim](auto-detected)[/dim]")
+        else:
+            console.print(f"[cyan]>>>[/cyan] Project: [bold]{project_name or project}[/bold]")
+    else:
+        console.print(f"[yellow]>>>[/yellow] [dim]No project linked (not in a project directory)[/dim]")
+
+    if hours:
+        if time_parsed:
+            console.print(f"[cyan]>>>[/cyan] Time: [bold]{hours}h[/bold] [dim](parsed from message)[/dim]")
+        else:
+            console.print(f"[cyan]>>>[/cyan] Time: [bold]{hours}h[/bold]")
+
+    # Contextual hints
+    if project:
+        # Check if session is active
+        from ..display import get_icon
+        session_manager = SessionManager.get_instance(storage)
+        active_session = session_manager.get_active_session()
+        use_emojis = storage.config.get("use_emojis", True)
+
+        if not active_session:
+            tip = get_icon("bulb", use_emojis)
+            console.print(f"\n[dim]{tip} Track time? -> jnl start {project}[/dim]")
+        elif active_session.project_id != project:
+            warn = get_icon("warning", use_emojis)
+            console.print(f"\n[dim]{warn} Active session on {active_session.project_id}. Switch? -> jnl stop && jnl start {project}[/dim]")
+
+
+cmd = log
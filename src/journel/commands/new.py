@@ -0,0 +1,120 @@
+"""jnl new: Create a new project."""
+
+from datetime import date
+
+import click
+
+from ..display import console, print_error, print_info, print_success
+from ..models import Project
+from ..utils import slugify, detect_git_repo
+from . import get_storage
+
+
+@click.command()
+@click.argument("name")
+@click.argument("description", required=False)
+@click.option("--tags", help="Comma-separated tags")
+@click.option("--ongoing", is_flag=True, help="Mark as ongoing/long-term project")
+@click.option("--maintenance", is_flag=True, help="Mark as maintenance/infrastructure project")
+@click.option("--yes", is_flag=True, help="Skip prompts (non-interactive mode)")
+def new(name, description, tags, ongoing, maintenance, yes):
+    """Create a new project.
+
+    Usage:
+        jnl new MyProject
+        jnl new MyProject "A longer description"
+        jnl new MyProject "Description" --tags "python,cli"
+        jnl new MyProject --ongoing  (for long-term projects)
+        jnl new MyProject --maintenance  (for infrastructure/libraries)
+        jnl new MyProject --yes  (skip all prompts)
+
+    Includes gentle gate-keeping to prevent project-hopping.
+    """
+    # Validate and normalize input before touching storage
+    if ongoing and maintenance:
+        print_error("Project cannot be both --ongoing and --maintenance")
+        return
+
+    project_id = slugify(name)
+    tag_list = tags.split(",") if tags else []
+
+    storage = get_storage()
+    today = date.today()
+    config = storage.config
+
+    # Check for existing projects (archived ones never count as active)
+    projects_by_id = storage.get_projects_by_id()
+    projects = projects_by_id.values()
+    active_regular = [p for p in projects if p.status == "in-progress" and p.days_since_active(today) <= 14 and p.project_type == "regular"]
+    active_ongoing = [p for p in projects if p.status == "in-progress" and p.days_since_active(today) <= 90 and p.project_type == "ongoing"]
+
+    # Gate-keeping: check appropriate limit based on project type
+    # Note: Maintenance projects have no limit (don't gate-keep)
+    if ongoing:
+        max_ongoing = config.get("max_ongoing_projects", 2)
+        if len(active_ongoing) >= max_ongoing:
+            print_error(f"You already have {len(active_ongoing)} ongoing long-term projects!")
+            console.print("\nOngoing projects:")
+            for p in active_ongoing:
+                console.print(f"  - {p.name} ({p.completion}% complete)")
+            console.print("\n[yellow]Ongoing projects require sustained deep attention.[/yellow]")
+            console.print("[dim]Consider completing one or converting to regular tracking.[/dim]")
+
+            if not yes and not click.confirm("\nReally start another ongoing project?", default=False):
+                print_info("Good choice! Focus matters for long-term success.")
+                return
+    else:
+        max_active = config.get("max_active_projects", 5)
+        if len(active_regular) >= max_active:
+            print_error(f"You already have {len(active_regular)} active projects!")
+            console.print("\nActive projects:")
+            for p in active_regular:
+                console.print(f"  - {p.name} ({p.completion}% complete)")
+
+            if not yes and not click.confirm("\nReally start something new?", default=False):
+                print_info("Good choice! Focus on finishing what you started.")
+                return
+
+    # Check if project already exists
+    if project_id in projects_by_id:
+        print_error(f"Project '{project_id}' already exists")
+        return
+
+    # Create project
+    if maintenance:
+        project_type = "maintenance"
+    elif ongoing:
+        project_type = "ongoing"
+    else:
+        project_type = "regular"
+
+    project = Project(
+        id=project_id,
+        name=name,
+        full_name=description or name,
+        tags=tag_list,
+        created=today,
+        last_active=today,
+        project_type=project_type,
+    )
+
+    # Auto-detect git repo
+    git_url = detect_git_repo()
+    if git_url:
+        if yes or click.confirm(f"\nDetected git repo: {git_url}\nLink to this project?", default=True):
+            project.github = git_url
+            print_success(f"Linked to: {git_url}")
+
+    storage.save_project(project)
+    storage.update_project_index()
+
+    print_success(f"Created project: {name}")
+    print_info(f"ID: {project_id}")
+    if not git_url or project.github == "":
+        print_info("Next steps:")
+        console.print("  1. Add project details: jnl edit " + project_id)
+        console.print("  2. Link to GitHub/Claude: jnl link " + project_id + " <url>")
+        console.print("  3. Start logging work: jnl log \"your message\"")
+
+
+cmd = new
@@ -0,0 +1,36 @@
+"""jnl note: Quick note capture (goes to today's log and current project if detected)."""
+
+from datetime import date
+
+import click
+
+from ..display import print_info, print_success
+from ..models import LogEntry
+from . import detect_current_project, get_storage
+
+
+@click.command()
+@click.argument("text")
+def note(text):
+    """Quick note capture (goes to today's log and current project if detected)."""
+    storage = get_storage()
+    today = date.today()
+
+    # Try to detect current project
+    proj = detect_current_project(storage)
+    project = proj.id if proj else None
+
+    # Add to log
+    entry = LogEntry(
+        date=today,
+        project=project,
+        message=f"Note: {text}",
+    )
+
+    storage.add_log_entry(entry)
+    print_success("Note saved")
+    if project:
+        print_info(f"Associated with project: {project}")
+
+
+cmd = note
@@ -0,0 +1,50 @@
+"""jnl resume: Restore context for picking up work on a project."""
+
+from datetime import date
+
+import click
+
+from ..display import console, print_error
+from . import get_storage
+
+
+@click.command()
+@click.argument("project_id")
+def resume(project_id):
+    """Restore context for picking up work on a project."""
+    storage = get_storage()
+    today = date.today()
+
+    project = storage.load_project(project_id)
+    if not project:
+        print_error(f"Project '{project_id}' not found")
+        return
+
+    lines = [f"\n[bold]Resuming: {project.name}[/bold]\n"]
+
+    lines.append(f"Last worked: {project.last_active} ({project.days_since_active(today)} days ago)")
+    lines.append(f"Completion: {project.completion}%\n")
+
+    if project.next_steps:
+        lines.append(f"[bold cyan]Next steps:[/bold cyan] {project.next_steps}\n")
+
+    if project.blockers:
+        lines.append(f"[bold red]Blockers:[/bold red] {project.blockers}\n")
+
+    if project.claude_project:
+        lines.append(f"[dim]Claude:[/dim] {project.claude_project}")
+
+    if project.github:
+        lines.append(f"[dim]GitHub:[/dim] {project.github}")
+
+    lines.append("")
+    console.print("\n".join(lines))
+
+    # Update last_active (patch the date line rather than rewriting the file)
+    if project.last_active != today:
+        project.last_active = today
+        if not storage.touch_last_active(project.id, today):
+            storage.save_project(project)
+
+
+cmd = resume
@@ -0,0 +1,86 @@
+"""jnl stats: Show overall statistics and insights."""
+
+from datetime import date
+
+import click
+
+from ..display import console
+from . import get_storage
+
+
+@click.command()
+@click.pass_context
+def stats(ctx):
+    """Show overall statistics and insights."""
+    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
+    storage = get_storage(no_emoji)
+    today = date.today()
+    config = storage.config
+
+    all_projects = storage.list_projects()
+
+    # Categorize in a single pass, computing days since active once per project
+    dormant_days = config.get("dormant_days", 14)
+    active, dormant, completed, in_progress = [], [], [], []
+    recent_active, recent_completions = [], []
+    for p in all_projects:
+        days = p.days_since_active(today)
+        if p.status == "in-progress":
+            in_progress.append(p)
+            (active if days <= dormant_days else dormant).append(p)
+        elif p.status == "completed":
+            completed.append(p)
+            if days <= 30:
+                recent_completions.append(p)
+        if days <= 7:
+            recent_active.append(p)
+
+    # Build the report and write it in one go
+    lines = ["\n[bold]📊 JOURNEL Statistics[/bold]\n" if config.get("use_emojis") else "\n[bold]JOURNEL Statistics[/bold]\n"]
+
+    # Project counts
+    lines.append("[bold]Projects:[/bold]")
+    lines.append(f"  Active: {len(active)}")
+    lines.append(f"  Dormant: {len(dormant)}")
+    lines.append(f"  Completed: {len(completed)}")
+    lines.append(f"  Total: {len(all_projects)}")
+
+    # Completion rate
+    if len(all_projects) > 0:
+        completion_rate = (len(completed) / len(all_projects)) * 100
+        lines.append(f"\n[bold]Completion Rate:[/bold] {completion_rate:.1f}%")
+
+    # Time statistics
+    time_stats = storage.get_time_stats(days=30)
+    if time_stats["total_hours"] > 0:
+        lines.append(f"\n[bold]Time Logged (last 30 days):[/bold]")
+        lines.append(f"  Total: {time_stats['total_hours']:.1f} hours")
+
+        # Top projects by time
+        if time_stats["top_projects"]:
+            lines.append(f"\n  [bold]Top projects:[/bold]")
+            for proj_name, hours in time_stats["top_projects"]:
+                lines.append(f"    {proj_name}: {hours:.1f}h")
+
+    # Recent activity
+    lines.append(f"\n[bold]Active This Week:[/bold] {len(recent_active)} projects")
+
+    # Streak
+    if recent_completions:
+        lines.append(f"[bold]Recent Wins:[/bold] {len(recent_completions)} completions in last 30 days")
+
+    # Most complete project
+    if in_progress:
+        most_complete = max(in_progress, key=lambda p: p.completion)
+        lines.append(f"\n[bold]Closest to Done:[/bold] {most_complete.name} ({most_complete.completion}%)")
+
+    # Oldest active project
+    if active:
+        oldest = min(active, key=lambda p: p.last_active)
+        lines.append(f"[bold]Oldest Active:[/bold] {oldest.name} (last worked {oldest.days_since_active(today)} days ago)")
+
+    lines.append("")
+    console.print("\n".join(lines))
+
+
+cmd = stats
@@ -0,0 +1,66 @@
+"""jnl status: Show overview of all projects (default command)."""
+
+from datetime import date
+
+import click
+
+from ..display import console, print_info, print_status
+from ..session import SessionManager
+from . import get_storage
+
+
+@click.command()
+@click.option("--brief", is_flag=True, help="Brief output for prompts")
+@click.option("--format", type=click.Choice(["text", "json"]), default="text", help="Output format (text or json)")
+@click.pass_context
+def status(ctx, brief, format):
+    """Show overview of all projects (default command)."""
+    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
+    storage = get_storage(no_emoji)
+    today = date.today()
+    config = storage.config
+
+    projects = storage.list_projects()
+
+    if not projects:
+        if format == "json":
+            import json
+            print(json.dumps({"projects": [], "count": 0}))
+        else:
+            print_info("No projects yet. Create one with: jnl new <name>")
+        return
+
+    if format == "json":
+        import json
+        # Convert projects to JSON-serializable format
+        projects_data = []
+        for p in projects:
+            projects_data.append({
+                "id": p.id,
+                "name": p.name,
+                "full_name": p.full_name,
+                "status": p.status,
+                "tags": p.tags,
+                "created": p.created.isoformat() if hasattr(p.created, 'isoformat') else str(p.created),
+                "last_active": p.last_active.isoformat() if hasattr(p.last_active, 'isoformat') else str(p.last_active),
+                "days_since_active": p.days_since_active(today),
+                "completion": p.completion,
+                "priority": p.priority,
+                "project_type": p.project_type,
+                "github": p.github,
+                "claude_project": p.claude_project,
+                "next_steps": p.next_steps,
+                "blockers": p.blockers,
+            })
+        print(json.dumps({"projects": projects_data, "count": len(projects_data)}, indent=2))
+    elif brief:
+        active = [p for p in projects if p.status == "in-progress" and p.days_since_active(today) <= 14]
+        console.print(f"[JOURNEL: {len(active)} active projects]")
+    else:
+        # Check for active session
+        session_manager = SessionManager.get_instance(storage)
+        active_session = session_manager.get_active_session()
+        print_status(projects, config, active_session=active_session)
+
+
+cmd = status
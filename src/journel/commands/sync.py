@@ -0,0 +1,115 @@
+"""jnl sync: Sync JOURNEL data with git remote."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from ..display import console, print_error, print_info, print_success
+from . import get_storage
+
+if TYPE_CHECKING:
+    import git
+
+
+@click.command()
+def sync():
+    """Sync JOURNEL data with git remote.
+
+    Fetches while committing local changes, merges or rebases as git pull
+    would, then pushes to sync your ~/.journel directory across machines.
+    """
+    storage = get_storage()
+
+    if not storage.repo:
+        print_error("Git repository not initialized. Run 'journel init' first.")
+        return
+
+    try:
+        console.print("[cyan]Syncing with git remote...[/cyan]")
+
+        # Check if remote exists
+        if not storage.repo.remotes:
+            print_error("No git remote configured.")
+            print_info("Set up a remote with: cd ~/.journel && git remote add origin <url>")
+            return
+
+        origin = storage.repo.remotes.origin
+
+        from git.cmd import Git  # GitPython is slow to import; see _integrate
+
+        # Fetch in the background while local changes are committed. The
+        # fetch gets its own Git command object: a Repo's persistent cat-file
+        # processes can't be shared between threads.
+        console.print("Pulling changes...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetch = executor.submit(Git(storage.repo.working_dir).fetch, origin.name)
+
+            # Commit any local changes
+            if storage.has_uncommitted_changes():
+                storage.repo.index.add(["."])
+                storage.repo.index.commit("Sync: local changes")
+
+            fetch.result()
+
+        # Integrate what was fetched; no second network round trip
+        tracking = storage.repo.active_branch.tracking_branch()
+        if tracking is not None:
+            if not _integrate(storage.repo, tracking.name):
+                print_error("Sync stopped: local and remote changes could not be combined.")
+                print_info("Your local commits are kept. Resolve with: cd ~/.journel && git pull")
+                return
+        else:
+            origin.pull()
+
+        # Push
+        console.print("Pushing changes...")
+        origin.push()
+
+        print_success("Sync complete!")
+
+    except Exception as e:
+        print_error(f"Sync failed: {e}")
+        print_info("You can manually sync with: cd ~/.journel && git pull && git push")
+
+
+def _config_value(repo: "git.Repo", *keys: str) -> str:
+    """Return the first set git config value among keys, or ""."""
+    for key in keys:
+        value = repo.git.config("--get", key, with_exceptions=False).strip()
+        if value:
+            return value
+    return ""
+
+
+def _integrate(repo: "git.Repo", upstream: str) -> bool:
+    """Merge or rebase onto upstream the way 'git pull' would.
+
+    Honours branch.<name>.rebase / pull.rebase and pull.ff. On a conflict
+    the merge or rebase is aborted, leaving the branch as it was, and
+    False is returned.
+    """
+    # GitPython is slow to import, and 'jnl --help' loads this module
+    from git import GitCommandError
+
+    git_dir = Path(repo.git_dir)
+    rebase = _config_value(repo, f"branch.{repo.active_branch.name}.rebase", "pull.rebase").lower()
+    try:
+        if rebase not in ("", "false", "no", "off", "0"):
+            args = ["--rebase-merges"] if rebase in ("merges", "m") else []
+            repo.git.rebase(*args, upstream)
+        else:
+            ff = _config_value(repo, "pull.ff").lower()
+            args = {"only": ["--ff-only"], "false": ["--no-ff"]}.get(ff, [])
+            repo.git.merge("--no-edit", *args, upstream)
+    except GitCommandError:
+        if (git_dir / "rebase-merge").exists() or (git_dir / "rebase-apply").exists():
+            repo.git.rebase("--abort")
+        elif (git_dir / "MERGE_HEAD").exists():
+            repo.git.merge("--abort")
+        return False
+    return True
+
+
+cmd = sync
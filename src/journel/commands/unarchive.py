@@ -0,0 +1,37 @@
+"""jnl unarchive: Restore an archived project back to active."""
+
+import click
+
+from ..display import print_error, print_info, print_success
+from . import get_storage
+
+
+@click.command()
+@click.argument("project_id")
+@click.pass_context
+def unarchive(ctx, project_id):
+    """Restore an archived project back to active.
+
+    Usage:
+        jnl unarchive my-project
+    """
+    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
+    storage = get_storage(no_emoji)
+
+    project = storage.load_project(project_id)
+    if not project:
+        print_error(f"Project '{project_id}' not found")
+        return
+
+    if project.status != "archived":
+        print_error(f"{project.name} is not archived")
+        return
+
+    storage.unarchive_project(project)
+    storage.update_project_index()
+
+    print_success(f"Unarchived: {project.name}")
+    print_info("Project is now active again")
+
+
+cmd = unarchive
@@ -0,0 +1,62 @@
+"""jnl wins: Show completed projects and achievements."""
+
+import heapq
+from datetime import date
+from operator import attrgetter
+
+import click
+
+from ..display import console, get_icon, print_info
+from ..utils import format_date_relative
+from . import get_storage
+
+
+@click.command()
+@click.pass_context
+def wins(ctx):
+    """Show completed projects and achievements."""
+    no_emoji = ctx.obj.get('no_emoji', False) if ctx.obj else False
+    storage = get_storage(no_emoji)
+    today = date.today()
+    config = storage.config
+    use_emojis = config.get("use_emojis", True)
+
+    completed = storage.list_projects(status="completed")
+
+    if not completed:
+        print_info("No completed projects yet. Finish one with: jnl done <project>")
+        return
+
+    # Most recent completions (by last_active) without sorting everything
+    by_date = attrgetter("last_active")
+    recent = heapq.nlargest(5, completed, key=by_date)
+
+    check = get_icon("check", use_emojis)
+    party = get_icon("party", use_emojis)
+    fire = get_icon("fire", use_emojis)
+
+    # Build the report and write it in one go
+    lines = [f"\n[bold green]{check} COMPLETED PROJECTS[/bold green] ({len(completed)})\n"]
+
+    # Show recent completions
+    lines.append("[bold]Recent completions:[/bold]")
+    for p in recent:
+        lines.append(f"  {party} {p.name:<30} (completed {format_date_relative(p.last_active, today)})")
+        if p.learned:
+            lines.append(f"     [dim]Learned: {p.learned}[/dim]")
+
+    if len(completed) > 5:
+        shown = {id(p) for p in recent}
+        older = sorted((p for p in completed if id(p) not in shown), key=by_date, reverse=True)
+        lines.append(f"\n[dim]All time:[/dim] {', '.join([p.name for p in older])}")
+
+    # Calculate streak (completions in last 30 days)
+    recent_wins = [p for p in completed if p.days_since_active(today) <= 30]
+    if recent_wins:
+        lines.append(f"\n[bold yellow]{fire} Current streak:[/bold yellow] {len(recent_wins)} completion(s) in the last month!")
+
+    lines.append("")
+    console.print("\n".join(lines))
+
+
+cmd = wins
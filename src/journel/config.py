@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
+from .utils import yaml_dump, yaml_load
 
 
 DEFAULT_CONFIG = {
@@ -51,14 +51,14 @@ class Config:
         """Load configuration from file."""
         if self.config_file.exists():
             with open(self.config_file, "r", encoding="utf-8") as f:
-                user_config = yaml.safe_load(f) or {}
+                user_config = yaml_load(f) or {}
                 self._config.update(user_config)
 
     def save(self) -> None:
         """Save configuration to file."""
         self.journel_dir.mkdir(parents=True, exist_ok=True)
         with open(self.config_file, "w", encoding="utf-8") as f:
-            yaml.dump(self._config, f, default_flow_style=False)
+            yaml_dump(self._config, f)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
@@ -1,12 +1,16 @@
 """Display and formatting utilities using Rich."""
 
+import io
 import sys
-from datetime import date
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import chain, islice, repeat
 from typing import List, Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
 from rich.progress import Progress, BarColumn, TextColumn
 
@@ -49,6 +53,9 @@ EMOJIS = {
     "warning": "⚠️",
     "party": "🎉",
     "star": "🌟",
+    "wave": "🌊",
+    "wrench": "🔧",
+    "time": "⏱ ",
 }
 
 ASCII_FALLBACKS = {
@@ -59,8 +66,15 @@ ASCII_FALLBACKS = {
     "warning": "[!]",
     "party": "***",
     "star": "*",
+    "wave": "[ONGOING]",
+    "wrench": "[MAINT]",
+    "time": "[TIME] ",
 }
 
+# Resolved icon sets, so hot paths pick one dict instead of branching per icon
+_ICONS_EMOJI = dict(EMOJIS) if _EMOJI_SUPPORT else dict(ASCII_FALLBACKS)
+_ICONS_ASCII = dict(ASCII_FALLBACKS)
+
 
 def get_icon(name: str, use_emojis: bool = True) -> str:
     """Get an icon (emoji or ASCII fallback).
@@ -68,15 +82,24 @@ def get_icon(name: str, use_emojis: bool = True) -> str:
     Automatically uses ASCII if terminal doesn't support emoji,
     even if use_emojis is True.
     """
-    # Auto-fallback to ASCII if terminal can't render emoji
-    if use_emojis and _EMOJI_SUPPORT:
-        return EMOJIS.get(name, "")
-    return ASCII_FALLBACKS.get(name, "")
+    return get_icons(use_emojis).get(name, "")
+
+
+def get_icons(use_emojis: bool = True) -> dict:
+    """Get the full icon set for the given emoji preference.
+
+    Falls back to ASCII if the terminal can't render emoji.
+    """
+    return _ICONS_EMOJI if use_emojis else _ICONS_ASCII
 
 
+@lru_cache(maxsize=256)
 def format_completion(completion: int, show_bar: bool = False, width: int = 10) -> str:
     """Format completion percentage with color coding.
 
+    Memoized: the markup depends only on the arguments, and list/status
+    views format the same handful of percentages over and over.
+
     Args:
         completion: Completion percentage (0-100)
         show_bar: If True, include a progress bar
@@ -103,6 +126,24 @@ def format_completion(completion: int, show_bar: bool = False, width: int = 10)
         return f"[{color}]{completion:>3}%[/{color}]"
 
 
+def _relative_dates(projects: List[Project]) -> dict:
+    """Map each distinct last_active date to its relative description.
+
+    Projects cluster on a few dates, so format each date once per render.
+    """
+    today = date.today()
+    return {d: format_date_relative(d, today) for d in {p.last_active for p in projects}}
+
+
+def _print_lines(lines: List[str]) -> None:
+    """Print markup lines as a single grouped render.
+
+    Each line is rendered on its own (so unbalanced markup can't bleed into
+    the next) but Rich lays them out and writes them in one pass.
+    """
+    console.print(Group(*[console.render_str(line) for line in lines]))
+
+
 def print_welcome() -> None:
     """Print welcome message after init."""
     welcome = """
@@ -133,17 +174,19 @@ def print_status(projects: List[Project], config, active_session: Optional['Sess
     # Get config values early
     use_emojis = config.get("use_emojis", True)
     dormant_days = config.get("dormant_days", 14)
+    icons = get_icons(use_emojis)
+    lines = []
 
     # Show active session first if present
     if active_session:
         elapsed = active_session.elapsed_time()
         hours = elapsed.total_seconds() / 3600
         # Use simple [TIME] prefix if emojis not supported
-        time_icon = "⏱ " if _EMOJI_SUPPORT and use_emojis else "[TIME] "
-        console.print(f"\n[yellow]{time_icon} Active Session:[/yellow] [bold]{active_session.project_id}[/bold] ({_format_time_duration(elapsed)})")
+        time_icon = icons["time"]
+        lines.append(f"\n[yellow]{time_icon} Active Session:[/yellow] [bold]{active_session.project_id}[/bold] ({_format_time_duration(elapsed)})")
         if active_session.task:
-            console.print(f"    Task: {active_session.task}")
-        console.print(f"    [dim]Stop: jnl stop | Pause: jnl pause[/dim]\n")
+            lines.append(f"    Task: {active_session.task}")
+        lines.append(f"    [dim]Stop: jnl stop | Pause: jnl pause[/dim]\n")
 
     # Categorize projects
     active_regular = []
@@ -154,7 +197,14 @@ def print_status(projects: List[Project], config, active_session: Optional['Sess
 
     dormant_days_ongoing = config.get("dormant_days_ongoing", 90)
 
-    for p in projects:
+    # Compare dates against precomputed cutoffs instead of asking each
+    # project for its age (which re-reads the clock per call)
+    today = date.today()
+    cutoff_regular = today - timedelta(days=dormant_days)
+    cutoff_ongoing = today - timedelta(days=dormant_days_ongoing)
+
+    # Sort once by last_active; categorizing keeps that order in every bucket
+    for p in sorted(projects, key=lambda p: p.last_active, reverse=True):
         if p.status == "completed":
             completed.append(p)
         elif p.project_type == "maintenance":
@@ -162,124 +212,119 @@ def print_status(projects: List[Project], config, active_session: Optional['Sess
             maintenance.append(p)
         else:
             # Use different dormant thresholds for regular vs ongoing
-            threshold = dormant_days_ongoing if p.project_type == "ongoing" else dormant_days
+            cutoff = cutoff_ongoing if p.project_type == "ongoing" else cutoff_regular
 
-            if p.days_since_active() > threshold:
+            if p.last_active < cutoff:
                 dormant.append(p)
             elif p.project_type == "ongoing":
                 active_ongoing.append(p)
             else:
                 active_regular.append(p)
 
-    # Sort by last_active
-    active_regular.sort(key=lambda p: p.last_active, reverse=True)
-    active_ongoing.sort(key=lambda p: p.last_active, reverse=True)
-    maintenance.sort(key=lambda p: p.last_active, reverse=True)
-    dormant.sort(key=lambda p: p.last_active, reverse=True)
-    completed.sort(key=lambda p: p.last_active, reverse=True)
+    rel = _relative_dates(projects)
 
     # Print active regular projects
     if active_regular:
-        fire = get_icon("fire", use_emojis)
-        console.print(f"\n[bold yellow]{fire} ACTIVE[/bold yellow]", f"({len(active_regular)})")
+        fire = icons["fire"]
+        lines.append(f"\n[bold yellow]{fire} ACTIVE[/bold yellow] ({len(active_regular)})")
         for p in active_regular:
             completion_str = format_completion(p.completion, show_bar=True)
-            status_line = f"  [bold]{p.name:<20}[/bold] {completion_str}   {format_date_relative(p.last_active):<15}"
+            status_line = f"  [bold]{p.name:<20}[/bold] {completion_str}   {rel[p.last_active]:<15}"
             if p.next_steps:
                 status_line += f"  [dim][{p.next_steps[:30]}][/dim]"
-            console.print(status_line)
+            lines.append(status_line)
 
     # Print ongoing long-term projects
     if active_ongoing:
         # Use wave emoji for ongoing projects
-        wave = "🌊" if _EMOJI_SUPPORT and use_emojis else "[ONGOING]"
-        console.print(f"\n[bold cyan]{wave} ONGOING[/bold cyan]", f"({len(active_ongoing)})")
+        wave = icons["wave"]
+        lines.append(f"\n[bold cyan]{wave} ONGOING[/bold cyan] ({len(active_ongoing)})")
         for p in active_ongoing:
             completion_str = format_completion(p.completion, show_bar=True)
             # Show description instead of next_steps for ongoing projects
-            status_line = f"  [bold]{p.name:<20}[/bold] {completion_str}   {format_date_relative(p.last_active):<15}"
+            status_line = f"  [bold]{p.name:<20}[/bold] {completion_str}   {rel[p.last_active]:<15}"
             if p.full_name:
                 status_line += f"  [dim]{p.full_name[:40]}[/dim]"
-            console.print(status_line)
+            lines.append(status_line)
 
     # Print maintenance/infrastructure projects
     if maintenance:
         # Use wrench emoji for maintenance projects
-        wrench = "🔧" if _EMOJI_SUPPORT and use_emojis else "[MAINT]"
-        console.print(f"\n[bold magenta]{wrench} MAINTENANCE[/bold magenta]")
+        wrench = icons["wrench"]
+        lines.append(f"\n[bold magenta]{wrench} MAINTENANCE[/bold magenta]")
         for p in maintenance:
             # Maintenance doesn't show progress bar (no completion goal)
-            status_line = f"  [dim]{p.name:<20}[/dim]   {format_date_relative(p.last_active):<15}"
+            status_line = f"  [dim]{p.name:<20}[/dim]   {rel[p.last_active]:<15}"
             if p.full_name:
                 status_line += f"  [dim]{p.full_name[:50]}[/dim]"
-            console.print(status_line)
+            lines.append(status_line)
 
     if not active_regular and not active_ongoing:
-        console.print("\n[dim]No active projects[/dim]")
+        lines.append("\n[dim]No active projects[/dim]")
 
     # Print dormant projects
     if dormant:
-        sleep = get_icon("sleep", use_emojis)
-        console.print(f"\n[bold blue]{sleep} DORMANT[/bold blue] ({len(dormant)})")
-        for p in dormant[:5]:  # Show max 5
+        sleep = icons["sleep"]
+        lines.append(f"\n[bold blue]{sleep} DORMANT[/bold blue] ({len(dormant)})")
+        for p in islice(dormant, 5):  # Show max 5
             completion_str = format_completion(p.completion, show_bar=False)
-            console.print(f"  [dim]{p.name:<20}[/dim] {completion_str}   {format_date_relative(p.last_active):<15}")
+            lines.append(f"  [dim]{p.name:<20}[/dim] {completion_str}   {rel[p.last_active]:<15}")
         if len(dormant) > 5:
-            console.print(f"  [dim]... and {len(dormant) - 5} more[/dim]")
+            lines.append(f"  [dim]... and {len(dormant) - 5} more[/dim]")
 
     # Print completed summary
     if completed:
-        check = get_icon("check", use_emojis)
-        console.print(f"\n[bold green]{check} COMPLETED[/bold green] ({len(completed)})")
+        check = icons["check"]
+        lines.append(f"\n[bold green]{check} COMPLETED[/bold green] ({len(completed)})")
         recent = completed[:3]
         if recent:
             names = ", ".join([p.name for p in recent])
-            console.print(f"  [dim]Recently: {names}[/dim]")
+            lines.append(f"  [dim]Recently: {names}[/dim]")
 
     # Print tips/nudges
     if config.get("gentle_nudges"):
-        all_active = active_regular + active_ongoing
-        if all_active:
-            # Find nearly done projects
-            nearly_done = [p for p in all_active if p.completion >= 80]
-            if nearly_done:
-                p = nearly_done[0]
-                bulb = get_icon("bulb", use_emojis)
-                console.print(f"\n[bold cyan]{bulb} Tip:[/bold cyan] {p.name} is {p.completion}% done - finish it first?")
+        # Find the first nearly done project (only one tip is shown)
+        p = next((p for p in chain(active_regular, active_ongoing) if p.completion >= 80), None)
+        if p is not None:
+            bulb = icons["bulb"]
+            lines.append(f"\n[bold cyan]{bulb} Tip:[/bold cyan] {p.name} is {p.completion}% done - finish it first?")
 
         # Warn about too many active projects (regular only)
         max_active = config.get("max_active_projects", 5)
         if len(active_regular) > max_active:
-            warn = get_icon("warning", use_emojis)
-            console.print(f"\n[yellow]{warn} You have {len(active_regular)} active projects. Consider completing some before starting new ones.[/yellow]")
+            warn = icons["warning"]
+            lines.append(f"\n[yellow]{warn} You have {len(active_regular)} active projects. Consider completing some before starting new ones.[/yellow]")
 
         # Note about ongoing projects if at/near limit
         max_ongoing = config.get("max_ongoing_projects", 2)
         if len(active_ongoing) >= max_ongoing:
-            warn = get_icon("warning", use_emojis)
-            console.print(f"\n[yellow]{warn} You have {len(active_ongoing)} ongoing projects. Long-term projects require sustained focus.[/yellow]")
+            warn = icons["warning"]
+            lines.append(f"\n[yellow]{warn} You have {len(active_ongoing)} ongoing projects. Long-term projects require sustained focus.[/yellow]")
 
     # Project health warnings
     if dormant:
-        warn = get_icon("warning", use_emojis)
-        console.print(f"\n[yellow]{warn} Health Check:[/yellow] {len(dormant)} dormant project(s)")
+        warn = icons["warning"]
+        lines.append(f"\n[yellow]{warn} Health Check:[/yellow] {len(dormant)} dormant project(s)")
 
         # Find stalled projects (30+ days)
-        stalled = [p for p in dormant if p.days_since_active() >= 30]
+        stalled_cutoff = today - timedelta(days=30)
+        stalled = [p for p in dormant if p.last_active <= stalled_cutoff]
         if stalled:
-            console.print(f"  [dim]{len(stalled)} project(s) inactive for 30+ days[/dim]")
-            console.print(f"  [dim]Consider: jnl archive --dormant[/dim]")
+            lines.append(f"  [dim]{len(stalled)} project(s) inactive for 30+ days[/dim]")
+            lines.append(f"  [dim]Consider: jnl archive --dormant[/dim]")
 
     # Command hints (if enabled)
     if config.get("show_command_hints", True):
-        _print_command_hints(active_regular, active_ongoing, maintenance, dormant, completed, use_emojis)
+        _print_command_hints(lines, active_regular, active_ongoing, maintenance, dormant, completed, use_emojis)
 
-    console.print()  # Blank line
+    lines.append("")  # Blank line
 
+    _print_lines(lines)
 
-def _print_command_hints(active_regular: List[Project], active_ongoing: List[Project], maintenance: List[Project], dormant: List[Project], completed: List[Project], use_emojis: bool) -> None:
-    """Print helpful command suggestions based on current project state."""
-    bulb = get_icon("bulb", use_emojis)
+
+def _print_command_hints(lines: List[str], active_regular: List[Project], active_ongoing: List[Project], maintenance: List[Project], dormant: List[Project], completed: List[Project], use_emojis: bool) -> None:
+    """Add helpful command suggestions based on current project state to lines."""
+    bulb = get_icons(use_emojis)["bulb"]
 
     hints = []
     all_active = active_regular + active_ongoing
@@ -288,9 +333,9 @@ def _print_command_hints(active_regular: List[Project], active_ongoing: List[Pro
     # Context-specific hints
     if all_active:
         # Find projects close to completion
-        nearly_done = [p for p in all_active if p.completion >= 80]
-        if nearly_done:
-            hints.append(f"jnl done {nearly_done[0].id} - Complete {nearly_done[0].name}")
+        nearly_done = next((p for p in all_active if p.completion >= 80), None)
+        if nearly_done is not None:
+            hints.append(f"jnl done {nearly_done.id} - Complete {nearly_done.name}")
 
         # Suggest logging work
         most_recent = max(all_active, key=lambda p: p.last_active)
@@ -300,7 +345,7 @@ def _print_command_hints(active_regular: List[Project], active_ongoing: List[Pro
         hints.append("jnl ctx - Get AI context for planning")
 
     if dormant:
-        oldest_dormant = max(dormant, key=lambda p: p.days_since_active())
+        oldest_dormant = min(dormant, key=lambda p: p.last_active)
         hints.append(f"jnl resume {oldest_dormant.id} - Pick up {oldest_dormant.name}")
 
         if len(dormant) > 2:
@@ -314,34 +359,36 @@ def _print_command_hints(active_regular: List[Project], active_ongoing: List[Pro
 
     # Print hints
     if hints:
-        console.print(f"\n[bold cyan]{bulb} Quick commands:[/bold cyan]")
+        lines.append(f"\n[bold cyan]{bulb} Quick commands:[/bold cyan]")
         # Show max 4 hints to avoid overwhelming
         for hint in hints[:4]:
-            console.print(f"  [dim]>[/dim] {hint}")
+            lines.append(f"  [dim]>[/dim] {hint}")
 
 
 def print_project_details(project: Project) -> None:
     """Print detailed project information."""
-    console.print(f"\n[bold]{project.full_name or project.name}[/bold]")
-    console.print(f"Status: {project.status} | Completion: {project.completion}%")
-    console.print(f"Last active: {format_date_relative(project.last_active)}")
+    lines = [f"\n[bold]{project.full_name or project.name}[/bold]"]
+    lines.append(f"Status: {project.status} | Completion: {project.completion}%")
+    lines.append(f"Last active: {format_date_relative(project.last_active)}")
 
     if project.tags:
-        console.print(f"Tags: {', '.join(project.tags)}")
+        lines.append(f"Tags: {', '.join(project.tags)}")
 
     if project.next_steps:
-        console.print(f"\n[bold cyan]Next steps:[/bold cyan] {project.next_steps}")
+        lines.append(f"\n[bold cyan]Next steps:[/bold cyan] {project.next_steps}")
 
     if project.blockers:
-        console.print(f"[bold red]Blockers:[/bold red] {project.blockers}")
+        lines.append(f"[bold red]Blockers:[/bold red] {project.blockers}")
 
     if project.github:
-        console.print(f"\nGitHub: {project.github}")
+        lines.append(f"\nGitHub: {project.github}")
 
     if project.claude_project:
-        console.print(f"Claude: {project.claude_project}")
+        lines.append(f"Claude: {project.claude_project}")
+
+    lines.append("")
 
-    console.print()
+    _print_lines(lines)
 
 
 def print_completion_celebration(project: Project, total_completed: int, use_emojis: bool = True) -> None:
@@ -363,6 +410,13 @@ def print_completion_celebration(project: Project, total_completed: int, use_emo
     console.print(Panel(celebration, border_style="green", expand=False))
 
 
+# Column styles for print_list, parsed once instead of per table
+_HEADER_STYLE = Style(bold=True)
+_NAME_STYLE = Style(color="cyan")
+_STATUS_STYLE = Style(color="yellow")
+_DIM_STYLE = Style(dim=True)
+
+
 def print_list(projects: List[Project], title: str = "Projects", show_id: bool = False) -> None:
     """Print a list of projects in table format.
 
@@ -375,92 +429,115 @@ def print_list(projects: List[Project], title: str = "Projects", show_id: bool =
         console.print("[dim]No projects found[/dim]")
         return
 
-    table = Table(title=title, show_header=True, header_style="bold")
+    table = Table(title=title, show_header=True, header_style=_HEADER_STYLE)
     if show_id:
-        table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Name", style="cyan", no_wrap=True)
-    table.add_column("Status", style="yellow")
+        table.add_column("ID", style=_DIM_STYLE, no_wrap=True)
+    table.add_column("Name", style=_NAME_STYLE, no_wrap=True)
+    table.add_column("Status", style=_STATUS_STYLE)
     table.add_column("Progress", justify="right")
-    table.add_column("Last Active", style="dim")
-    table.add_column("Tags", style="dim")
-
-    for p in projects:
-        # Use color-coded completion with progress bar
-        completion_display = format_completion(p.completion, show_bar=True)
-        row_data = []
-        if show_id:
-            row_data.append(p.id)
-        row_data.extend([
+    table.add_column("Last Active", style=_DIM_STYLE)
+    table.add_column("Tags", style=_DIM_STYLE)
+
+    # One pass, each row built once; show_id decided once, not per row
+    rel = _relative_dates(projects)
+    id_cells = ((p.id,) for p in projects) if show_id else repeat(())
+    for p, lead in zip(projects, id_cells):
+        table.add_row(
+            *lead,
             p.name,
             p.status,
-            completion_display,
-            format_date_relative(p.last_active),
+            # Use color-coded completion with progress bar
+            format_completion(p.completion, show_bar=True),
+            rel[p.last_active],
             ", ".join(p.tags[:2]) if p.tags else "",
-        ])
-        table.add_row(*row_data)
+        )
 
     console.print(table)
 
 
 def print_context_export(projects: List[Project], recent_logs: str, question: str = None) -> None:
-    """Print context export for LLM."""
-    output = ["# JOURNEL Context Export", ""]
+    """Print context export for LLM.
+
+    The export is plain Markdown meant to be pasted elsewhere, so it is
+    written straight to stdout rather than through Rich (which would parse
+    brackets in notes as markup and add highlighting).
+    """
+    buf = io.StringIO()
+    w = buf.write
+    w("# JOURNEL Context Export\n\n")
 
     # Active projects
-    active = [p for p in projects if p.status != "completed" and p.days_since_active() <= 14]
+    cutoff = date.today() - timedelta(days=14)
+    active = [p for p in projects if p.status != "completed" and p.last_active >= cutoff]
     if active:
-        output.append("## Active Projects")
-        output.append("")
+        rel = _relative_dates(active)
+        w("## Active Projects\n\n")
         for p in active:
-            output.append(f"### {p.name} ({p.completion}% complete)")
-            output.append(f"- Last active: {format_date_relative(p.last_active)}")
+            w(f"### {p.name} ({p.completion}% complete)\n")
+            w(f"- Last active: {rel[p.last_active]}\n")
             if p.next_steps:
-                output.append(f"- Next steps: {p.next_steps}")
+                w(f"- Next steps: {p.next_steps}\n")
             if p.blockers:
-                output.append(f"- Blockers: {p.blockers}")
-            output.append("")
+                w(f"- Blockers: {p.blockers}\n")
+            w("\n")
 
     # Recent activity
-    output.append("## Recent Activity")
-    output.append("")
-    output.append(recent_logs)
-    output.append("")
+    w("## Recent Activity\n\n")
+    w(recent_logs)
+    w("\n\n")
 
     # Question if provided
     if question:
-        output.append("## Question")
-        output.append("")
-        output.append(question)
-        output.append("")
+        w("## Question\n\n")
+        w(question)
+        w("\n\n")
+
+    w("---\n")
+    w("[Copy this to Claude for analysis]\n")
 
-    output.append("---")
-    output.append("[Copy this to Claude for analysis]")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
-    console.print("\n".join(output))
+
+# Piped/redirected output can't show styling (FORCE_COLOR still counts as
+# a terminal), so the one-line message helpers skip Rich's markup pass
+_PLAIN_OUTPUT = not console.is_terminal
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
+    if _PLAIN_OUTPUT:
+        sys.stdout.write(f"Error: {message}\n")
+        return
     console.print(f"[bold red]Error:[/bold red] {message}")
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
+    if _PLAIN_OUTPUT:
+        sys.stdout.write(f"[OK] {message}\n")
+        return
     console.print(f"[green][OK][/green] {message}")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
+    if _PLAIN_OUTPUT:
+        sys.stdout.write(f">>> {message}\n")
+        return
     console.print(f"[cyan]>>>[/cyan] {message}")
 
 
+# Ordinal suffix for every value of n % 100 (11th-13th and teens are "th")
+_ORDINAL_SUFFIX = tuple(
+    "th" if 10 <= i <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(i % 10, "th")
+    for i in range(100)
+)
+
+
 def _ordinal(n: int) -> str:
     """Convert number to ordinal string (1st, 2nd, 3rd, etc.)."""
-    if 10 <= n % 100 <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-    return f"{n}{suffix}"
+    return f"{n}{_ORDINAL_SUFFIX[n % 100]}"
 
 
 # Session display functions
@@ -1,16 +1,45 @@
 """GitHub API client using gh CLI."""
 
 import json
+import shutil
 import subprocess
+import sys
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from .utils import load_json
+
+try:
+    import ijson
+except ImportError:  # Optional, lets repo listings stream (see the "fast" extra)
+    ijson = None
+
+
+if sys.version_info >= (3, 11):
+    # Parses GitHub's trailing "Z" natively
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse a GitHub ISO 8601 timestamp."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 @dataclass
 class GitHubRepo:
     """Represents a GitHub repository."""
 
+    # Explicit slots (dataclass(slots=True) needs 3.10+): one object per
+    # repo in the account, so skip the per-instance __dict__
+    __slots__ = (
+        "name", "full_name", "description", "html_url", "stargazers_count",
+        "pushed_at", "language", "topics", "fork", "archived", "size",
+        "open_issues_count", "pushed_date",
+    )
+
     name: str
     full_name: str
     description: Optional[str]
@@ -18,23 +47,43 @@ class GitHubRepo:
     stargazers_count: int
     pushed_at: datetime
     language: Optional[str]
-    topics: List[str]
+    topics: List[str]  # Topic names
     fork: bool
     archived: bool
     size: int
     open_issues_count: int
 
+    def __post_init__(self) -> None:
+        # Calendar day of the last push, which display and project creation
+        # use; not a dataclass field, so it stays out of asdict() and ==
+        self.pushed_date: date = self.pushed_at.date()
+
     @classmethod
     def from_dict(cls, data: dict) -> "GitHubRepo":
-        """Create GitHubRepo from gh CLI JSON output."""
-        # Handle topics - might be already flattened or need flattening
-        topics = data.get("repositoryTopics", [])
-        if isinstance(topics, list) and not isinstance(topics, dict):
-            # Already flattened
+        """Create GitHubRepo from gh CLI JSON output.
+
+        Expects "repositoryTopics" already flattened to a list of topic
+        names (see _repo_from_node).
+        """
+        try:
+            # Fast path: every field our GraphQL query selects is present
+            language = data["primaryLanguage"]
+            return cls(
+                name=data["name"],
+                full_name=data["nameWithOwner"],
+                description=data["description"],
+                html_url=data["url"],
+                stargazers_count=data["stargazerCount"],
+                pushed_at=_parse_timestamp(data["pushedAt"]),
+                language=language["name"] if language else None,
+                topics=data["repositoryTopics"],
+                fork=data["isFork"],
+                archived=data["isArchived"],
+                size=data["diskUsage"],
+                open_issues_count=data["openIssues"]["totalCount"],
+            )
+        except KeyError:
             pass
-        else:
-            # Need to flatten
-            topics = [t["topic"]["name"] for t in topics.get("nodes", [])] if topics else []
 
         return cls(
             name=data.get("name", ""),
@@ -42,9 +91,9 @@ class GitHubRepo:
             description=data.get("description"),
             html_url=data.get("url", ""),
             stargazers_count=data.get("stargazerCount", 0),
-            pushed_at=datetime.fromisoformat(data.get("pushedAt", "").replace("Z", "+00:00")),
+            pushed_at=_parse_timestamp(data.get("pushedAt", "")),
             language=data.get("primaryLanguage", {}).get("name") if data.get("primaryLanguage") else None,
-            topics=topics,
+            topics=data.get("repositoryTopics", []),
             fork=data.get("isFork", False),
             archived=data.get("isArchived", False),
             size=data.get("diskUsage", 0),
@@ -52,15 +101,136 @@ class GitHubRepo:
         )
 
 
+# Commits by the viewer on a repository's default branch (needs $me: ID!)
+_HISTORY_COUNT = "defaultBranchRef { target { ... on Commit { history(author: {id: $me}) { totalCount } } } }"
+
+# ijson prefix of the repo nodes in the fetch_user_repos response
+_REPO_NODES_PATH = "data.viewer.repositories.nodes.item"
+
+# What a malformed or cut-off gh response raises while being parsed
+_PARSE_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+def _iter_json_documents(text: str):
+    """Yield each JSON document from concatenated JSON text."""
+    decoder = json.JSONDecoder()
+    pos, end = 0, len(text)
+    while True:
+        while pos < end and text[pos].isspace():
+            pos += 1
+        if pos >= end:
+            return
+        obj, pos = decoder.raw_decode(text, pos)
+        yield obj
+
+
+def _page_nodes(data: bytes) -> List[dict]:
+    """Collect the repo nodes from one or more concatenated response pages."""
+    try:
+        pages = [load_json(data)]
+    except json.JSONDecodeError:
+        # --paginate prints one JSON document per page
+        pages = list(_iter_json_documents(data.decode("utf-8")))
+    return [
+        node
+        for page in pages
+        for node in page.get("data", {}).get("viewer", {}).get("repositories", {}).get("nodes", [])
+    ]
+
+
+class _Watchdog:
+    """Kill a process once it has gone `timeout` seconds without progress."""
+
+    def __init__(self, proc: subprocess.Popen, timeout: float):
+        self.expired = False
+        self._proc = proc
+        self._timeout = timeout
+        self._deadline = time.monotonic() + timeout
+        self._stopped = threading.Event()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def feed(self) -> None:
+        """Record progress, restarting the countdown."""
+        self._deadline = time.monotonic() + self._timeout
+
+    def cancel(self) -> None:
+        """Stop watching."""
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._deadline - time.monotonic()):
+            if time.monotonic() >= self._deadline:
+                self.expired = True
+                self._proc.kill()
+                return
+
+
+class _WatchedReader:
+    """Binary stream wrapper that feeds a _Watchdog on every read."""
+
+    def __init__(self, stream, watchdog: _Watchdog):
+        self.saw_data = False  # Whether anything but whitespace was read
+        self._stream = stream
+        self._watchdog = watchdog
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            return b"".join(iter(lambda: self.read(65536), b""))
+        # read1 returns what has arrived instead of waiting for size bytes
+        data = self._stream.read1(size)
+        self._watchdog.feed()
+        if not self.saw_data and data.strip():
+            self.saw_data = True
+        return data
+
+
+def _repo_from_node(node: dict) -> GitHubRepo:
+    """Create a GitHubRepo from a GraphQL repository node."""
+    # Flatten topics, the one place this happens
+    node["repositoryTopics"] = [
+        t["topic"]["name"] for t in (node.get("repositoryTopics") or {}).get("nodes", ())
+    ]
+    return GitHubRepo.from_dict(node)
+
+
 class GitHubClient:
     """Client for interacting with GitHub via gh CLI."""
 
+    # GitHub's maximum page size for connections (the REST per_page cap too)
+    _PAGE_SIZE = 100
+
+    # Seconds gh may go without output while listing repos before it is killed
+    _TIMEOUT = 30
+
+    # Repos per aliased GraphQL query in fetch_commits_counts
+    _COMMITS_BATCH = 50
+
+    # Cached result of the gh probe in _check_gh_installed
+    _gh_authenticated: Optional[bool] = None
+
     def __init__(self):
         """Initialize GitHub client."""
         self._check_gh_installed()
+        self._viewer: Optional[dict] = None
 
     def _check_gh_installed(self) -> bool:
-        """Check if gh CLI is installed and authenticated."""
+        """Check if gh CLI is installed and authenticated.
+
+        The result is cached on the class, so only the first client per
+        process pays for the 'gh auth status' call.
+        """
+        if GitHubClient._gh_authenticated is not None:
+            return GitHubClient._gh_authenticated
+
+        error = RuntimeError(
+            "GitHub CLI (gh) not found or not authenticated.\n"
+            "Install: https://cli.github.com/\n"
+            "Authenticate: gh auth login"
+        )
+        # Cheap PATH lookup before spawning anything
+        if shutil.which("gh") is None:
+            raise error
+
         try:
             result = subprocess.run(
                 ["gh", "auth", "status"],
@@ -68,28 +238,49 @@ class GitHubClient:
                 text=True,
                 timeout=5,
             )
-            return result.returncode == 0
         except (subprocess.SubprocessError, FileNotFoundError):
-            raise RuntimeError(
-                "GitHub CLI (gh) not found or not authenticated.\n"
-                "Install: https://cli.github.com/\n"
-                "Authenticate: gh auth login"
-            )
+            raise error
 
-    def fetch_user_repos(self, limit: int = 100) -> List[GitHubRepo]:
+        GitHubClient._gh_authenticated = result.returncode == 0
+        return GitHubClient._gh_authenticated
+
+    def fetch_user_repos(self, limit: Optional[int] = None) -> List[GitHubRepo]:
         """Fetch all repositories for the authenticated user.
 
         Args:
-            limit: Maximum number of repos to fetch (default: 1000)
+            limit: Maximum number of repos to fetch (default: all)
 
         Returns:
-            List of GitHubRepo objects
+            List of GitHubRepo objects, most recently pushed first
+        """
+        return list(self.iter_user_repos(limit))
+
+    def iter_user_repos(self, limit: Optional[int] = None) -> Iterator[GitHubRepo]:
+        """Yield the authenticated user's repositories as they are parsed.
+
+        Pages are requested at GitHub's maximum size (_PAGE_SIZE), so the
+        fewest round trips are made; past one page, gh follows the cursor
+        itself (--paginate) so every page comes from one gh process. With
+        ijson installed, repos are yielded while later pages are still
+        arriving, and stopping early (or reaching limit) stops gh.
+
+        Args:
+            limit: Maximum number of repos to yield (default: all)
+
+        Yields:
+            GitHubRepo objects, most recently pushed first
+
+        Raises:
+            RuntimeError: If gh fails, stalls, or returns empty or unparsable output
         """
+        paginate = limit is None or limit > self._PAGE_SIZE
+        page_size = self._PAGE_SIZE if paginate else limit
+
         # Build GraphQL query for detailed repo info
         query = """
-        query($limit: Int!) {
+        query($limit: Int!, $endCursor: String) {
           viewer {
-            repositories(first: $limit, orderBy: {field: PUSHED_AT, direction: DESC}) {
+            repositories(first: $limit, after: $endCursor, orderBy: {field: PUSHED_AT, direction: DESC}) {
               nodes {
                 name
                 nameWithOwner
@@ -114,43 +305,146 @@ class GitHubClient:
                   totalCount
                 }
               }
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
             }
           }
         }
         """
 
+        args = ["gh", "api", "graphql", "-f", f"query={query}", "-F", f"limit={page_size}"]
+        if paginate:
+            args.append("--paginate")
+
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        repos = self._read_repos(proc)
         try:
-            result = subprocess.run(
-                ["gh", "api", "graphql", "-f", f"query={query}", "-F", f"limit={limit}"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            yield from islice(repos, limit)
+        finally:
+            # Stops gh if the limit or the consumer ended the listing early
+            repos.close()
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to fetch repos: {result.stderr}")
+    def _read_repos(self, proc: subprocess.Popen) -> Iterator[GitHubRepo]:
+        """Yield repos from gh's output, stopping gh if it stalls or is abandoned.
 
-            data = json.loads(result.stdout)
-            repo_nodes = data.get("data", {}).get("viewer", {}).get("repositories", {}).get("nodes", [])
+        With ijson, repos are yielded as the output arrives, without holding
+        the whole response and its parsed form at once; otherwise the output
+        is read and checked in full first. gh is killed after _TIMEOUT
+        seconds without output, so listings of any length get the same
+        per-page allowance.
+        """
+        watchdog = _Watchdog(proc, self._TIMEOUT)
+        stdout = _WatchedReader(proc.stdout, watchdog)
+        nodes: List[dict] = []
+        parse_error = None
+        finished = False
+        try:
+            try:
+                if ijson is not None:
+                    # multiple_values: --paginate prints one document per page
+                    for node in ijson.items(stdout, _REPO_NODES_PATH, multiple_values=True):
+                        yield _repo_from_node(node)
+                else:
+                    nodes = _page_nodes(stdout.read())
+            except _PARSE_ERRORS as e:
+                # Usually an empty or cut-off stream; the exit status says why
+                parse_error = e
+            stderr = proc.stderr.read()
+            proc.wait()
+            finished = True
+        finally:
+            watchdog.cancel()
+            if not finished:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
 
-            repos = []
-            for node in repo_nodes:
-                # Flatten topics
-                topics = [t["topic"]["name"] for t in node.get("repositoryTopics", {}).get("nodes", [])]
-                node["repositoryTopics"] = topics
+        if watchdog.expired:
+            raise RuntimeError("GitHub API request timed out")
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to fetch repos: {stderr.decode('utf-8', 'replace')}")
+        if parse_error is not None:
+            raise RuntimeError(f"Failed to parse GitHub response: {parse_error}")
+        if not stdout.saw_data:
+            raise RuntimeError("Failed to parse GitHub response: no output from gh")
+        yield from map(_repo_from_node, nodes)
 
-                repos.append(GitHubRepo.from_dict(node))
+    def _get_viewer(self) -> Optional[dict]:
+        """Get the authenticated user's login and node id (cached per client)."""
+        if self._viewer is None:
+            try:
+                result = subprocess.run(
+                    ["gh", "api", "graphql", "-f", "query=query { viewer { login id } }"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                )
+                if result.returncode != 0:
+                    return None
+                self._viewer = json.loads(result.stdout)["data"]["viewer"]
+            except (subprocess.SubprocessError, json.JSONDecodeError, KeyError, TypeError):
+                return None
+        return self._viewer
 
-            return repos
+    def fetch_commits_counts(self, repo_full_names: List[str]) -> Dict[str, int]:
+        """Get commit counts by the authenticated user for many repos at once.
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("GitHub API request timed out")
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse GitHub response: {e}")
+        Counts come from the default branch history, filtered by author on
+        GitHub's side, with one aliased GraphQL query per batch of repos
+        instead of a subprocess (and a full commit listing) per repo.
+
+        Args:
+            repo_full_names: Full repo names (e.g., ["owner/repo", ...])
+
+        Returns:
+            Dict mapping repo full name to commit count (0 if unavailable)
+        """
+        counts = {name: 0 for name in repo_full_names}
+        viewer = self._get_viewer()
+        if not viewer or not repo_full_names:
+            return counts
+
+        for start in range(0, len(repo_full_names), self._COMMITS_BATCH):
+            batch = repo_full_names[start:start + self._COMMITS_BATCH]
+            fields = []
+            for i, full_name in enumerate(batch):
+                owner, _, name = full_name.partition("/")
+                # JSON string literals are valid GraphQL string literals
+                fields.append(
+                    f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+                    f"{{ {_HISTORY_COUNT} }}"
+                )
+            query = "query($me: ID!) {\n" + "\n".join(fields) + "\n}"
+
+            try:
+                result = subprocess.run(
+                    ["gh", "api", "graphql", "-f", f"query={query}", "-f", f"me={viewer['id']}"],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                # Missing repos come back as errors alongside partial data
+                data = json.loads(result.stdout).get("data") or {}
+            except (subprocess.SubprocessError, json.JSONDecodeError, AttributeError):
+                continue
+
+            for i, full_name in enumerate(batch):
+                try:
+                    counts[full_name] = data[f"r{i}"]["defaultBranchRef"]["target"]["history"]["totalCount"]
+                except (KeyError, TypeError):
+                    pass
+
+        return counts
 
     def get_user_commits_count(self, repo_full_name: str) -> int:
         """Get number of commits by authenticated user in a repo.
 
+        GitHub counts the default branch history filtered by author, so
+        only the total comes back instead of every commit page.
+
         Args:
             repo_full_name: Full repo name (e.g., "owner/repo")
 
@@ -158,34 +452,29 @@ class GitHubClient:
             Number of commits by the user
         """
         try:
-            # Get authenticated user
-            user_result = subprocess.run(
-                ["gh", "api", "user", "-q", ".login"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if user_result.returncode != 0:
+            # Get authenticated user (looked up once per client)
+            viewer = self._get_viewer()
+            if not viewer:
                 return 0
 
-            username = user_result.stdout.strip()
-
-            # Count commits by user
-            commits_result = subprocess.run(
-                ["gh", "api", f"repos/{repo_full_name}/commits",
-                 "--paginate", "-q", f'.[].commit.author.name | select(. == "{username}") | length'],
+            owner, _, name = repo_full_name.partition("/")
+            query = (
+                "query($owner: String!, $name: String!, $me: ID!) "
+                f"{{ repository(owner: $owner, name: $name) {{ {_HISTORY_COUNT} }} }}"
+            )
+            result = subprocess.run(
+                ["gh", "api", "graphql", "-f", f"query={query}",
+                 "-f", f"owner={owner}", "-f", f"name={name}", "-f", f"me={viewer['id']}"],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
 
-            if commits_result.returncode != 0:
+            if result.returncode != 0:
                 return 0
 
-            # Count non-empty lines
-            count = len([line for line in commits_result.stdout.strip().split("\n") if line])
-            return count
+            repo = json.loads(result.stdout)["data"]["repository"]
+            return repo["defaultBranchRef"]["target"]["history"]["totalCount"]
 
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+        except (subprocess.SubprocessError, json.JSONDecodeError, KeyError, TypeError):
             return 0
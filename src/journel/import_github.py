@@ -1,60 +1,279 @@
 """GitHub repository import with ADHD-friendly batch workflow."""
 
+import hashlib
 import json
 import sys
-from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict
+from datetime import datetime, date, timedelta, timezone
+from itertools import compress, islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import click
+from rich.text import Text
 
 from .config import Config
 from .display import console, print_error, print_success, print_info
 from .github_client import GitHubClient, GitHubRepo
 from .models import Project
 from .storage import Storage
-from .utils import slugify, format_date_relative
+from .utils import (
+    dump_json,
+    ensure_dir,
+    format_date_relative,
+    load_json,
+    slugify,
+    write_bytes_atomic,
+    yaml_load,
+)
 
 
 BATCH_SIZE = 10
 
+# Classification responses: response -> (project status, state counter).
+# A status of None means the repo is skipped; unknown responses archive.
+DECISIONS = {
+    "active": ("active", "imported_as_active"),
+    "a": ("active", "imported_as_active"),
+    "ongoing": ("ongoing", "imported_as_ongoing"),
+    "o": ("ongoing", "imported_as_ongoing"),
+    "maintenance": ("maintenance", "imported_as_maintenance"),
+    "m": ("maintenance", "imported_as_maintenance"),
+    "skip": (None, "skipped"),
+    "s": (None, "skipped"),
+    "archive": ("archived", "imported_as_archived"),
+    "": ("archived", "imported_as_archived"),
+}
+_ARCHIVE_DECISION = DECISIONS["archive"]
+
+# Keys offered by the interactive prompt
+_INTERACTIVE_KEYS = frozenset("aos")
+
+# Static lines of the interactive display, built as Text so they skip
+# markup parsing (which also ate the hint's [a]/[o]/[s]/[q] as tags)
+_REPO_SEPARATOR = Text(f"\n{'-' * 60}\n")
+_INTERACTIVE_HINT = Text("\n      [a]ctive / [o]ngoing / [Enter]=archive / [s]kip / [q]uit", style="dim")
+_INTERACTIVE_PROMPT = Text("      > ")
+
+# JSON result events, formatted directly since only the name varies;
+# compact, like every other event dump_json writes
+_RESULT_TEMPLATE = '{{"type":"result","action":"{action}","name":{name}}}\n'
+_GATED_RESULT_TEMPLATE = '{{"type":"result","action":"{action}","name":{name},"reason":"active_limit_hit"}}\n'
+
+_AI_RESULT_TEXT = {
+    "imported_as_active": "Created as ACTIVE",
+    "imported_as_ongoing": "Created as ONGOING",
+    "imported_as_maintenance": "Created as MAINTENANCE",
+    "imported_as_archived": "Archived",
+    "skipped": "Skipped",
+}
+
+_INTERACTIVE_RESULT_TEXT = {
+    "imported_as_active": "\n✅ Created as ACTIVE",
+    "imported_as_ongoing": "\n✅ Created as ONGOING",
+    "imported_as_archived": "\n✅ Archived",
+    "skipped": "\n⏭️  Skipped (not imported)",
+}
+
 
 def load_import_state(storage: Storage) -> Optional[Dict[str, Any]]:
-    """Load import state from meta directory."""
-    import yaml
-    state_file = storage.config.meta_dir / "import_state.yaml"
+    """Load import state from meta directory.
+
+    The snapshot file is brought up to date by replaying the decision
+    journal (see record_import_decision).
+    """
+    state_file = storage.config.meta_dir / "import_state.json"
 
     if not state_file.exists():
+        state = _migrate_yaml_import_state(storage)
+        if state is None:
+            return None
+    else:
+        state = load_json(state_file.read_bytes())
+
+    if state:
+        _replay_import_journal(storage, state)
+    return state
+
+
+def _migrate_yaml_import_state(storage: Storage) -> Optional[Dict[str, Any]]:
+    """Convert an import_state.yaml left by older versions to JSON."""
+    legacy_file = storage.config.meta_dir / "import_state.yaml"
+    if not legacy_file.exists():
         return None
 
-    with open(state_file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    with open(legacy_file, "r", encoding="utf-8") as f:
+        state = yaml_load(f)
+
+    if state:
+        # The per-repo list moves to the journal, where load_import_state
+        # reads it back; index 0 events aren't counted again on replay
+        processed = state.pop("repos_processed", None) or []
+        if processed:
+            journal_file = storage.config.meta_dir / "import_state.jsonl"
+            with open(journal_file, "ab") as f:
+                f.writelines(
+                    dump_json({**entry, "session": state["session_id"], "index": 0}) + b"\n"
+                    for entry in processed
+                )
+        state_file = storage.config.meta_dir / "import_state.json"
+        state_file.write_bytes(dump_json(state, indent=True))
+    legacy_file.unlink()
+    return state
+
+
+# Digest of the last snapshot written per state file (see save_import_state)
+_saved_snapshots: Dict[Path, bytes] = {}
 
 
 def save_import_state(storage: Storage, state: Dict[str, Any]) -> None:
-    """Save import state to meta directory."""
-    import yaml
-    storage.config.meta_dir.mkdir(parents=True, exist_ok=True)
-    state_file = storage.config.meta_dir / "import_state.yaml"
+    """Save an import state snapshot to meta directory.
+
+    Per-repo decisions live in the append-only journal, so the snapshot
+    leaves out repos_processed and stays the same size however far the
+    import has got.
+    """
+    state_file = storage.config.meta_dir / "import_state.json"
 
-    state["last_updated"] = datetime.now().isoformat()
+    # Skip the write when nothing but the timestamp would change
+    snapshot = {k: v for k, v in state.items() if k not in ("repos_processed", "last_updated")}
+    digest = hashlib.blake2b(dump_json(snapshot), digest_size=16).digest()
+    if _saved_snapshots.get(state_file) == digest and state_file.exists():
+        return
 
-    with open(state_file, "w", encoding="utf-8") as f:
-        yaml.dump(state, f, default_flow_style=False)
+    state["last_updated"] = snapshot["last_updated"] = datetime.now().isoformat()
+    write_bytes_atomic(state_file, dump_json(snapshot, indent=True))
+    _saved_snapshots[state_file] = digest
 
 
 def clear_import_state(storage: Storage) -> None:
-    """Clear import state file."""
-    state_file = storage.config.meta_dir / "import_state.yaml"
-    if state_file.exists():
-        state_file.unlink()
+    """Clear import state, journal and repo cache files."""
+    for name in ("import_state.json", "import_state.jsonl", "import_state.yaml", "repos_cache.json"):
+        state_file = storage.config.meta_dir / name
+        if state_file.exists():
+            state_file.unlink()
+
+
+def load_repos_cache(storage: Storage, session_id: str) -> Optional[List[GitHubRepo]]:
+    """Load the repo list saved for an import session, if there is one.
+
+    Resuming against the same list skips the GitHub fetch and keeps
+    current_position pointing at the same repos even if some were pushed
+    to in the meantime.
+    """
+    cache_file = storage.config.meta_dir / "repos_cache.json"
+    if not cache_file.exists():
+        return None
+
+    try:
+        cache = load_json(cache_file.read_bytes())
+        if cache.get("session_id") != session_id:
+            return None
+        return [
+            GitHubRepo(**{**data, "pushed_at": datetime.fromisoformat(data["pushed_at"])})
+            for data in cache["repos"]
+        ]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def save_repos_cache(storage: Storage, session_id: str, repos: List[GitHubRepo]) -> None:
+    """Save the fetched repo list for an import session."""
+    cache = {
+        "session_id": session_id,
+        "fetched_at": datetime.now().isoformat(),
+        "repos": [
+            {**asdict(repo), "pushed_at": repo.pushed_at.isoformat()}
+            for repo in repos
+        ],
+    }
+    (storage.config.meta_dir / "repos_cache.json").write_bytes(dump_json(cache))
+
+
+def append_import_event(storage: Storage, event: Dict[str, Any]) -> None:
+    """Append one event to the import journal (one JSON object per line)."""
+    journal_file = storage.config.meta_dir / "import_state.jsonl"
+    with open(journal_file, "ab") as f:
+        f.write(dump_json(event) + b"\n")
+
+
+def record_import_decision(
+    storage: Storage,
+    state: Dict[str, Any],
+    repo: GitHubRepo,
+    index: int,
+    action: str,
+    outcome: str,
+) -> None:
+    """Count a decision in the state and append it to the journal.
+
+    Args:
+        action: What the user chose (e.g. "a", "archive")
+        outcome: The state["processed"] counter it lands in
+    """
+    state["processed"][outcome] += 1
+    state["current_position"] = index
+
+    entry = {
+        "name": repo.name,
+        "action": action,
+        "timestamp": datetime.now().isoformat(),
+    }
+    state["repos_processed"].append(entry)
+    append_import_event(storage, {
+        **entry,
+        "session": state["session_id"],
+        "index": index,
+        "outcome": outcome,
+    })
+
+
+def _replay_import_journal(storage: Storage, state: Dict[str, Any]) -> None:
+    """Fold journal events newer than the snapshot into state."""
+    state.setdefault("repos_processed", [])
+    journal_file = storage.config.meta_dir / "import_state.jsonl"
+    if not journal_file.exists():
+        return
+
+    data = journal_file.read_bytes()
+    if not data.endswith(b"\n"):
+        # Drop a torn last line from an interrupted write, so the next
+        # append starts on a fresh line
+        data = data[:data.rfind(b"\n") + 1]
+        with open(journal_file, "r+b") as f:
+            f.truncate(len(data))
+
+    position = state.get("current_position", 0)
+    for line in data.splitlines():
+        try:
+            event = load_json(line)
+        except ValueError:
+            continue
+        if event.get("session") != state.get("session_id"):
+            continue
+
+        state["repos_processed"].append({
+            "name": event["name"],
+            "action": event["action"],
+            "timestamp": event["timestamp"],
+        })
+        if event["index"] > position:
+            state["processed"][event["outcome"]] += 1
+            position = event["index"]
+
+    state["current_position"] = position
 
 
 def create_new_import_state() -> Dict[str, Any]:
     """Create new import state."""
+    now = datetime.now()
+    started = now.isoformat()
     return {
-        "session_id": datetime.now().strftime("%Y-%m-%d-%H%M%S"),
-        "started": datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat(),
+        "session_id": now.strftime("%Y-%m-%d-%H%M%S"),
+        "started": started,
+        "last_updated": started,
         "stats": {
             "total_repos": 0,
             "filtered_out": 0,
@@ -84,58 +303,114 @@ def apply_filters(
     Returns:
         Tuple of (filtered_repos, filtered_out_count)
     """
-    filtered = []
-    filtered_out = 0
+    # GitHub timestamps are UTC-aware, so one aware cutoff serves every repo
+    cutoff = datetime.now(timezone.utc) - timedelta(days=30 * months) if recent_only else None
 
-    for repo in repos:
+    # One keep/drop flag per repo (cheapest checks first, so most repos
+    # short-circuit early), then a single C-level compress pass
+    keep = [
+        # Skip empty repos
+        repo.size != 0
         # Skip archived repos unless included
-        if repo.archived and not include_archived:
-            filtered_out += 1
-            continue
-
+        and (include_archived or not repo.archived)
         # Skip forks unless included (heuristic: fork with no stars likely unused)
-        if repo.fork and not include_forks and repo.stargazers_count == 0:
-            filtered_out += 1
-            continue
-
-        # Skip empty repos
-        if repo.size == 0:
-            filtered_out += 1
-            continue
-
+        and (include_forks or not repo.fork or repo.stargazers_count != 0)
         # Filter by recency
-        if recent_only:
-            cutoff = datetime.now().replace(tzinfo=repo.pushed_at.tzinfo) - timedelta(days=30 * months)
-            if repo.pushed_at < cutoff:
-                filtered_out += 1
-                continue
+        and (cutoff is None or repo.pushed_at >= cutoff)
+        for repo in repos
+    ]
+    filtered = list(compress(repos, keep))
 
-        filtered.append(repo)
+    return filtered, len(repos) - len(filtered)
 
-    return filtered, filtered_out
 
+# Terminal fd and original settings while raw_stdin is active
+_saved_tty: Optional[Tuple[int, Any]] = None
 
-def get_single_keypress() -> str:
-    """Get single keypress without requiring Enter.
 
-    Falls back to input() on systems without termios.
+@contextmanager
+def raw_stdin() -> Iterator[None]:
+    """Hold the terminal in key-at-a-time mode for a run of keypresses.
+
+    Switching once per batch instead of once per keypress avoids the
+    terminal flickering between repos. Uses cbreak rather than raw mode so
+    output printed between reads keeps its newline handling. Does nothing
+    on systems without termios.
     """
+    global _saved_tty
     try:
-        # Try Unix-style (termios)
         import termios
         import tty
 
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            char = sys.stdin.read(1)
-            return char
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     except (ImportError, AttributeError):
-        # Fall back to regular input on Windows
-        return input().strip().lower()[:1] if input().strip() else ""
+        yield
+        return
+
+    tty.setcbreak(fd)
+    _saved_tty = (fd, old_settings)
+    try:
+        yield
+    finally:
+        _saved_tty = None
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+@contextmanager
+def cooked_stdin() -> Iterator[None]:
+    """Restore line input inside raw_stdin, e.g. around click.confirm."""
+    if _saved_tty is None:
+        yield
+        return
+
+    import termios
+
+    fd, old_settings = _saved_tty
+    key_settings = termios.tcgetattr(fd)
+    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, key_settings)
+
+
+def _windows_getwch() -> Optional[Callable[[], str]]:
+    """Return msvcrt.getwch on Windows, None elsewhere."""
+    try:
+        import msvcrt
+    except ImportError:
+        return None
+    return msvcrt.getwch
+
+
+# Picked once at import rather than per keypress
+_getwch = _windows_getwch()
+
+
+def get_single_keypress() -> str:
+    """Get single keypress without requiring Enter.
+
+    Reads straight from stdin inside raw_stdin, otherwise switches the
+    terminal for this one key. Uses msvcrt on Windows consoles and falls
+    back to input() when neither is available.
+    """
+    if _saved_tty is not None:
+        return sys.stdin.read(1)
+
+    if _getwch is not None and sys.stdin.isatty():
+        char = _getwch()
+        if char == "\x03":
+            # getwch swallows Ctrl-C; raise it like a terminal would
+            raise KeyboardInterrupt
+        return char
+
+    with raw_stdin():
+        if _saved_tty is not None:
+            return sys.stdin.read(1)
+
+    line = input()
+    return line.strip().lower()[:1]
 
 
 def process_repo_ai_mode(
@@ -145,6 +420,9 @@ def process_repo_ai_mode(
     storage: Storage,
     state: Dict[str, Any],
     json_output: bool = False,
+    active_regular: Optional[List[Project]] = None,
+    existing_ids: Optional[set] = None,
+    defer_index: bool = False,
 ) -> Optional[str]:
     """Process a single repo in AI-friendly mode.
 
@@ -158,26 +436,16 @@ def process_repo_ai_mode(
         - Clear, parseable structure
         - Machine-readable but also human-debuggable
 
+    active_regular and existing_ids let a whole import session share one
+    project scan (see create_project_from_repo); they are updated in place.
+    With defer_index the caller refreshes the project index afterwards.
+
     Returns:
         None to continue, "quit" to quit
     """
-    config = storage.config
-
     if json_output:
         # Emit repo as JSON
-        repo_data = {
-            "type": "repo",
-            "index": index,
-            "total": total,
-            "name": repo.name,
-            "description": repo.description,
-            "stars": repo.stargazers_count,
-            "last_push": repo.pushed_at.date().isoformat(),
-            "language": repo.language,
-            "open_issues": repo.open_issues_count,
-            "url": repo.html_url,
-        }
-        print(json.dumps(repo_data), flush=True)
+        _emit(_repo_event(repo, index, total))
 
         # Emit prompt
         prompt_data = {
@@ -185,10 +453,10 @@ def process_repo_ai_mode(
             "message": "Classify as: active | ongoing | maintenance | archive | skip | quit",
             "options": ["active", "ongoing", "maintenance", "archive", "skip", "quit"],
         }
-        print(json.dumps(prompt_data), flush=True)
+        _emit(prompt_data)
 
         # Signal ready for input
-        print(json.dumps({"type": "awaiting_input"}), flush=True)
+        _emit({"type": "awaiting_input"})
 
         # Read response from stdin (blocking)
         try:
@@ -204,7 +472,7 @@ def process_repo_ai_mode(
         print(f"Name: {repo.name}")
         print(f"Description: {repo.description or 'N/A'}")
         print(f"Stars: {repo.stargazers_count} | Language: {repo.language or 'N/A'}")
-        print(f"Last push: {repo.pushed_at.date()}")
+        print(f"Last push: {repo.pushed_date}")
         if repo.open_issues_count > 0:
             print(f"Open issues: {repo.open_issues_count}")
         print(f"\nClassify as: active | ongoing | maintenance | archive | skip | quit")
@@ -215,20 +483,42 @@ def process_repo_ai_mode(
         except EOFError:
             response = "quit"
 
-    # Process response
-    if response == "quit" or response == "q":
+    return apply_ai_decision(
+        repo, index, storage, state, response, json_output,
+        active_regular, existing_ids, defer_index,
+    )
+
+
+def apply_ai_decision(
+    repo: GitHubRepo,
+    index: int,
+    storage: Storage,
+    state: Dict[str, Any],
+    response: str,
+    json_output: bool = False,
+    active_regular: Optional[List[Project]] = None,
+    existing_ids: Optional[set] = None,
+    defer_index: bool = False,
+) -> Optional[str]:
+    """Apply one AI-mode classification to a repo and report the result.
+
+    Returns:
+        None to continue, "quit" to quit
+    """
+    if response in ("quit", "q"):
         return "quit"
 
-    elif response == "active" or response == "a":
-        # Check gate-keeping for active projects
-        projects = storage.list_projects()
-        active_regular = [p for p in projects if p.status == "in-progress" and p.project_type == "regular"]
+    status, outcome = DECISIONS.get(response, _ARCHIVE_DECISION)
+    template = _RESULT_TEMPLATE
+    text = _AI_RESULT_TEXT[outcome]
 
-        max_active = config.get("max_active_projects", 5)
-        gate_issue = False
+    if status == "active":
+        # Check gate-keeping for active projects
+        if active_regular is None:
+            active_regular = _active_regular(storage)
 
+        max_active = storage.config.get("max_active_projects", 5)
         if len(active_regular) >= max_active:
-            gate_issue = True
             if json_output:
                 warning_data = {
                     "type": "gate_warning",
@@ -238,7 +528,7 @@ def process_repo_ai_mode(
                     "limit": max_active,
                     "recommendation": "ongoing_or_archive",
                 }
-                print(json.dumps(warning_data), flush=True)
+                _emit(warning_data)
             else:
                 print(f"\n⚠️  You already have {len(active_regular)} active projects (limit: {max_active})!")
                 print("Current active projects:")
@@ -246,90 +536,125 @@ def process_repo_ai_mode(
                     print(f"  - {p.name} ({p.completion}% complete)")
                 print("\nArchiving instead...")
 
-        if gate_issue:
-            create_project_from_repo(repo, storage, "archived")
-            state["processed"]["imported_as_archived"] += 1
-            if json_output:
-                result = {
-                    "type": "result",
-                    "action": "imported_as_archived",
-                    "name": repo.name,
-                    "reason": "active_limit_hit",
-                }
-                print(json.dumps(result), flush=True)
-            else:
-                print("Result: Archived (active limit reached)")
-        else:
-            create_project_from_repo(repo, storage, "active")
-            state["processed"]["imported_as_active"] += 1
-            if json_output:
-                result = {
-                    "type": "result",
-                    "action": "imported_as_active",
-                    "name": repo.name,
-                }
-                print(json.dumps(result), flush=True)
-            else:
-                print("Result: Created as ACTIVE")
-
-    elif response == "ongoing" or response == "o":
-        create_project_from_repo(repo, storage, "ongoing")
-        state["processed"]["imported_as_ongoing"] += 1
-        if json_output:
-            result = {
-                "type": "result",
-                "action": "imported_as_ongoing",
-                "name": repo.name,
-            }
-            print(json.dumps(result), flush=True)
-        else:
-            print("Result: Created as ONGOING")
-
-    elif response == "maintenance" or response == "m":
-        create_project_from_repo(repo, storage, "maintenance")
-        state["processed"]["imported_as_maintenance"] += 1
-        if json_output:
-            result = {
-                "type": "result",
-                "action": "imported_as_maintenance",
-                "name": repo.name,
-            }
-            print(json.dumps(result), flush=True)
-        else:
-            print("Result: Created as MAINTENANCE")
-
-    elif response == "skip" or response == "s":
-        state["processed"]["skipped"] += 1
-        if json_output:
-            result = {
-                "type": "result",
-                "action": "skipped",
-                "name": repo.name,
-            }
-            print(json.dumps(result), flush=True)
-        else:
-            print("Result: Skipped")
-
-    else:  # archive or Enter or any other key
-        create_project_from_repo(repo, storage, "archived")
-        state["processed"]["imported_as_archived"] += 1
-        if json_output:
-            result = {
-                "type": "result",
-                "action": "imported_as_archived",
-                "name": repo.name,
-            }
-            print(json.dumps(result), flush=True)
-        else:
-            print("Result: Archived")
+            status, outcome = _ARCHIVE_DECISION
+            template = _GATED_RESULT_TEMPLATE
+            text = "Archived (active limit reached)"
+
+    if status is not None:
+        project = create_project_from_repo(
+            repo, storage, status, existing_ids=existing_ids, defer_index=defer_index,
+        )
+        if status == "active":
+            _add_active(active_regular, project)
+
+    if json_output:
+        name = dump_json(repo.name).decode("utf-8")
+        sys.stdout.write(template.format(action=outcome, name=name))
+        sys.stdout.flush()
+    else:
+        print(f"Result: {text}")
+
+    # Track in state and journal
+    record_import_decision(storage, state, repo, index, response or "archive", outcome)
+
+    return None
 
-    # Track in state
-    state["repos_processed"].append({
+
+def _emit(event: Dict[str, Any]) -> None:
+    """Write one JSON-mode event line and flush it to the reader.
+
+    Encodes straight to bytes (orjson when installed, see dump_json),
+    so dates can be passed as-is.
+    """
+    line = dump_json(event) + b"\n"
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        print(line.decode("utf-8"), end="", flush=True)
+        return
+    # Anything already written as text must go out first
+    sys.stdout.flush()
+    out.write(line)
+    out.flush()
+
+
+def _repo_event(repo: GitHubRepo, index: int, total: int) -> Dict[str, Any]:
+    """Describe a repo for JSON mode output."""
+    return {
+        "type": "repo",
+        "index": index,
+        "total": total,
         "name": repo.name,
-        "action": response or "archive",
-        "timestamp": datetime.now().isoformat(),
-    })
-    state["current_position"] = index
+        "description": repo.description,
+        "stars": repo.stargazers_count,
+        "last_push": repo.pushed_date,
+        "language": repo.language,
+        "open_issues": repo.open_issues_count,
+        "url": repo.html_url,
+    }
+
+
+def process_batch_ai_mode(
+    batch: List[GitHubRepo],
+    first_index: int,
+    total: int,
+    storage: Storage,
+    state: Dict[str, Any],
+    active_regular: Optional[List[Project]] = None,
+    existing_ids: Optional[set] = None,
+    defer_index: bool = False,
+) -> Optional[str]:
+    """Process a whole batch with one JSON exchange.
+
+    Emits every repo of the batch in a single "batch" event, then reads
+    one line holding a JSON array of decisions, one per repo in order.
+    If the line isn't a valid array, or has fewer decisions than repos,
+    the remaining repos fall back to the one-at-a-time JSON exchange.
+
+    Returns:
+        None to continue, "quit" to quit
+    """
+    batch_data = {
+        "type": "batch",
+        "repos": [_repo_event(repo, first_index + i, total) for i, repo in enumerate(batch)],
+    }
+    _emit(batch_data)
+
+    prompt_data = {
+        "type": "prompt",
+        "message": "Reply with a JSON array, one of active | ongoing | maintenance | archive | skip | quit per repo",
+        "options": ["active", "ongoing", "maintenance", "archive", "skip", "quit"],
+    }
+    _emit(prompt_data)
+    _emit({"type": "awaiting_input"})
+
+    try:
+        line = input()
+    except EOFError:
+        return "quit"
+
+    try:
+        decisions = json.loads(line)
+        if not isinstance(decisions, list):
+            raise ValueError("expected a JSON array")
+        decisions = [str(d).strip().lower() for d in decisions]
+    except ValueError as e:
+        _emit({"type": "error", "message": f"Invalid batch decisions: {e}"})
+        decisions = []
+
+    for i, repo in enumerate(batch):
+        index = first_index + i
+        if i < len(decisions):
+            result = apply_ai_decision(
+                repo, index, storage, state, decisions[i], True,
+                active_regular, existing_ids, defer_index,
+            )
+        else:
+            result = process_repo_ai_mode(
+                repo, index, total, storage, state, True,
+                active_regular, existing_ids, defer_index,
+            )
+        if result == "quit":
+            return "quit"
 
     return None
 
@@ -340,98 +665,115 @@ def process_repo_interactive(
     total: int,
     storage: Storage,
     state: Dict[str, Any],
+    active_regular: Optional[List[Project]] = None,
+    existing_ids: Optional[set] = None,
+    defer_index: bool = False,
 ) -> Optional[str]:
     """Process a single repo interactively.
 
+    active_regular, existing_ids and defer_index work as in
+    process_repo_ai_mode.
+
     Returns:
         None to continue, "quit" to quit, "next_batch" for next batch prompt
     """
-    config = storage.config
-
-    # Display repo info
-    console.print(f"\n{'-' * 60}\n")
-    console.print(f"[bold cyan][{index}/{total}] {repo.name}[/bold cyan]")
-    console.print(f"      ⭐ {repo.stargazers_count} stars | 📅 {format_date_relative(repo.pushed_at.date())}")
+    # Display repo info, rendered and written in one go
+    parts = [
+        _REPO_SEPARATOR,
+        f"[bold cyan][{index}/{total}] {repo.name}[/bold cyan]",
+        f"      ⭐ {repo.stargazers_count} stars | 📅 {format_date_relative(repo.pushed_date)}",
+    ]
 
     if repo.description:
         desc = repo.description[:70] + "..." if len(repo.description) > 70 else repo.description
-        console.print(f"      {desc}")
+        parts.append(f"      {desc}")
 
     if repo.open_issues_count > 0:
-        console.print(f"      🔧 {repo.open_issues_count} open issues")
+        parts.append(f"      🔧 {repo.open_issues_count} open issues")
 
     if repo.language:
-        console.print(f"      💻 {repo.language}")
+        parts.append(f"      💻 {repo.language}")
 
-    console.print(f"\n      [dim][a]ctive / [o]ngoing / [Enter]=archive / [s]kip / [q]uit[/dim]")
-    console.print("      > ", end="")
+    parts.append(_INTERACTIVE_HINT)
+    parts.append(_INTERACTIVE_PROMPT)
+    console.print(*parts, sep="\n", end="")
 
     # Get input
-    choice = get_single_keypress().lower()
+    choice = get_single_keypress().strip().lower()
     console.print(choice if choice else "[Enter]")  # Echo the choice
 
-    # Process choice
-    if choice == 'q':
+    if choice == "q":
         return "quit"
 
-    elif choice == 'a':
+    # Only a/o/s are offered here; anything else archives
+    status, outcome = DECISIONS[choice] if choice in _INTERACTIVE_KEYS else _ARCHIVE_DECISION
+    message = _INTERACTIVE_RESULT_TEXT[outcome]
+
+    if status == "active":
         # Check gate-keeping for active projects
-        projects = storage.list_projects()
-        active_regular = [p for p in projects if p.status == "in-progress" and p.project_type == "regular"]
+        if active_regular is None:
+            active_regular = _active_regular(storage)
 
-        max_active = config.get("max_active_projects", 5)
+        max_active = storage.config.get("max_active_projects", 5)
         if len(active_regular) >= max_active:
             console.print(f"\n[yellow]⚠️  You already have {len(active_regular)} active projects![/yellow]")
             console.print("\nCurrent active projects:")
             for p in active_regular[:5]:
                 console.print(f"  - {p.name} ({p.completion}% complete)")
 
-            if not click.confirm("\nReally add as active?", default=False):
+            message = None
+            import click
+
+            with cooked_stdin():
+                confirmed = click.confirm("\nReally add as active?", default=False)
+            if not confirmed:
                 console.print("\n[dim]Archiving instead...[/dim]")
-                create_project_from_repo(repo, storage, "archived")
-                state["processed"]["imported_as_archived"] += 1
-            else:
-                create_project_from_repo(repo, storage, "active")
-                state["processed"]["imported_as_active"] += 1
-        else:
-            create_project_from_repo(repo, storage, "active")
-            state["processed"]["imported_as_active"] += 1
-            console.print("\n✅ Created as ACTIVE")
-
-    elif choice == 'o':
-        create_project_from_repo(repo, storage, "ongoing")
-        state["processed"]["imported_as_ongoing"] += 1
-        console.print("\n✅ Created as ONGOING")
-
-    elif choice == 's':
-        state["processed"]["skipped"] += 1
-        console.print("\n⏭️  Skipped (not imported)")
-
-    else:  # Enter or any other key = archive
-        create_project_from_repo(repo, storage, "archived")
-        state["processed"]["imported_as_archived"] += 1
-        console.print("\n✅ Archived")
-
-    # Track in state
-    state["repos_processed"].append({
-        "name": repo.name,
-        "action": choice or "archive",
-        "timestamp": datetime.now().isoformat(),
-    })
-    state["current_position"] = index
+                status, outcome = _ARCHIVE_DECISION
+
+    if status is not None:
+        project = create_project_from_repo(
+            repo, storage, status, existing_ids=existing_ids, defer_index=defer_index,
+        )
+        if status == "active":
+            _add_active(active_regular, project)
+
+    if message:
+        console.print(message)
+
+    # Track in state and journal
+    record_import_decision(storage, state, repo, index, choice or "archive", outcome)
 
     return None
 
 
-def create_project_from_repo(repo: GitHubRepo, storage: Storage, status: str) -> None:
-    """Create JOURNEL project from GitHub repo."""
+def create_project_from_repo(
+    repo: GitHubRepo,
+    storage: Storage,
+    status: str,
+    existing_ids: Optional[set] = None,
+    defer_index: bool = False,
+) -> Optional[Project]:
+    """Create JOURNEL project from GitHub repo.
+
+    Args:
+        existing_ids: IDs of all existing projects, to check against
+            instead of probing the disk; the new ID is added to it
+        defer_index: Skip the project index update; the caller runs it
+            once for a whole batch
+
+    Returns:
+        The created project, or None if it already existed
+    """
     project_id = slugify(repo.name)
 
     # Check if already exists
-    existing = storage.load_project(project_id)
-    if existing:
+    if existing_ids is not None:
+        exists = project_id in existing_ids
+    else:
+        exists = project_id in storage.list_project_ids(include_archived=True)
+    if exists:
         console.print(f"[yellow]Note:[/yellow] Project '{project_id}' already exists, skipping")
-        return
+        return None
 
     # Determine project type and status
     if status == "ongoing":
@@ -450,7 +792,7 @@ def create_project_from_repo(repo: GitHubRepo, storage: Storage, status: str) ->
         full_name=repo.description or repo.name,
         tags=repo.topics if repo.topics else [],
         created=date.today(),
-        last_active=repo.pushed_at.date(),
+        last_active=repo.pushed_date,
         status=project_status,
         project_type=project_type,
         github=repo.html_url,
@@ -461,7 +803,7 @@ def create_project_from_repo(repo: GitHubRepo, storage: Storage, status: str) ->
     project.notes = f"""# GitHub Import
 
 Imported from: {repo.html_url}
-Last activity: {repo.pushed_at.date()}
+Last activity: {repo.pushed_date}
 Stars: {repo.stargazers_count}
 {lang_line}
 
@@ -473,13 +815,45 @@ Stars: {repo.stargazers_count}
     # Save project
     if status == "archived":
         # Save to archived directory
-        storage.config.archived_dir.mkdir(parents=True, exist_ok=True)
         archived_path = storage.config.archived_dir / f"{project_id}.md"
         storage._save_project_to_path(project, archived_path)
     else:
         storage.save_project(project)
 
-    storage.update_project_index()
+    if not defer_index:
+        storage.update_project_index()
+
+    if existing_ids is not None:
+        existing_ids.add(project_id)
+    return project
+
+
+def _active_regular(storage: Storage) -> List[Project]:
+    """List the active regular projects the active-limit gate counts.
+
+    Reads the storage's cached project map, so calls between writes share
+    one directory scan.
+    """
+    return [
+        p for p in storage.get_projects_by_id().values()
+        if p.status == "in-progress" and p.project_type == "regular"
+    ]
+
+
+def _add_active(active_regular: Optional[List[Project]], project: Optional[Project]) -> None:
+    """Count a newly created active project in the session's gate list."""
+    if active_regular is not None and project is not None:
+        active_regular.append(project)
+
+
+def _batched(iterable: Iterable[GitHubRepo], size: int) -> Iterator[List[GitHubRepo]]:
+    """Split an iterable into lists of up to size items (itertools.batched)."""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
 
 
 def show_batch_summary(state: Dict[str, Any], batch_num: int, total_batches: int) -> None:
@@ -526,6 +900,56 @@ def show_completion_summary(state: Dict[str, Any]) -> None:
     console.print("Use [bold]jnl list --archived[/bold] to see archived projects.\n")
 
 
+def _quit_import(
+    storage: Storage,
+    state: Dict[str, Any],
+    ai_mode: bool,
+    json_output: bool,
+    position: int,
+    total: int,
+) -> None:
+    """Save progress and report a quit at the given repo position."""
+    storage.update_project_index()
+    save_import_state(storage, state)
+    if not ai_mode:
+        show_quit_summary(state, total - position)
+    elif json_output:
+        status_data = {
+            "type": "status",
+            "action": "quit",
+            "processed": position,
+            "remaining": total - position,
+            "stats": state["processed"],
+        }
+        _emit(status_data)
+
+
+def _start_repo_fetch() -> Optional["Future[List[GitHubRepo]]"]:
+    """Start fetching the user's repos on a worker thread.
+
+    The gh round trips then overlap with whatever the import does next
+    (prompting, scanning local projects). Returns None after reporting the
+    error if gh isn't available; fetch errors surface from result().
+    """
+    try:
+        client = GitHubClient()
+    except RuntimeError as e:
+        print_error(str(e))
+        return None
+
+    fetch: "Future[List[GitHubRepo]]" = Future()
+
+    def _run() -> None:
+        try:
+            fetch.set_result(client.fetch_user_repos())
+        except Exception as e:
+            fetch.set_exception(e)
+
+    # Daemon, so quitting at a prompt doesn't wait on gh
+    threading.Thread(target=_run, daemon=True).start()
+    return fetch
+
+
 def import_github_repos(
     recent_only: bool = False,
     resume: bool = False,
@@ -536,23 +960,32 @@ def import_github_repos(
     ai_mode: bool = False,
     json_output: bool = False,
     force_new: bool = False,
+    refresh: bool = False,
+    batch_json: bool = False,
 ) -> None:
-    """Import GitHub repos with ADHD-friendly batch workflow."""
+    """Import GitHub repos with ADHD-friendly batch workflow.
+
+    Resumed sessions reuse the repo list fetched when the session started
+    unless refresh is set. batch_json exchanges a whole batch of decisions
+    per prompt (see process_batch_ai_mode).
+    """
     config = Config()
     storage = Storage(config)
 
-    # json_output implies ai_mode
+    # Create the directories the import writes to once, up front; the
+    # per-repo and per-batch writers below assume they exist
+    ensure_dir(config.meta_dir)
+    ensure_dir(config.archived_dir)
+
+    # batch_json implies json_output, which implies ai_mode
+    if batch_json:
+        json_output = True
     if json_output:
         ai_mode = True
 
-    # Initialize GitHub client
-    try:
-        client = GitHubClient()
-    except RuntimeError as e:
-        print_error(str(e))
-        return
-
     # Load or create state
+    resuming = False
+    fetch = None
     if force_new:
         # Clear existing state
         clear_import_state(storage)
@@ -567,6 +1000,7 @@ def import_github_repos(
                 # AI mode: just start new silently
                 state = create_new_import_state()
             return
+        resuming = True
         if not ai_mode:
             console.print(f"\n[cyan]Resuming import from {state['started'][:10]}[/cyan]")
             console.print(f"Progress: {state['current_position']} processed, continuing...")
@@ -576,23 +1010,55 @@ def import_github_repos(
         if existing_state and ai_mode:
             # AI mode: auto-resume
             state = existing_state
+            resuming = True
         elif existing_state and not ai_mode:
             # Human mode: ask
             state = existing_state
+            resuming = True
             console.print(f"\n[cyan]Import in progress detected ({state['current_position']} processed)[/cyan]")
+            import click
+
+            # With no usable repo cache, both answers need a fresh list, so
+            # start fetching while the user decides
+            if refresh or load_repos_cache(storage, state["session_id"]) is None:
+                fetch = _start_repo_fetch()
+                if fetch is None:
+                    return
+
             if not click.confirm("Resume where you left off?", default=True):
                 clear_import_state(storage)
                 state = create_new_import_state()
+                resuming = False
         else:
             state = create_new_import_state()
 
-    # Fetch repos
-    console.print("\n[cyan]Fetching your GitHub repos...[/cyan]")
-    try:
-        all_repos = client.fetch_user_repos()
-    except RuntimeError as e:
-        print_error(f"Failed to fetch repos: {e}")
-        return
+    # Fetch repos (or reuse the list this session started with)
+    all_repos = None
+    if resuming and not refresh and fetch is None:
+        all_repos = load_repos_cache(storage, state["session_id"])
+
+    if all_repos is None and fetch is None:
+        fetch = _start_repo_fetch()
+        if fetch is None:
+            return
+
+    if not preview:
+        # Scan existing projects once, while gh works; the per-repo steps
+        # keep these current
+        existing_ids = set(storage.list_project_ids(include_archived=True))
+        active_regular = _active_regular(storage)
+        # Every created project lands in existing_ids, so its size tells
+        # whether the index is behind
+        indexed_count = len(existing_ids)
+
+    if fetch is not None:
+        console.print("\n[cyan]Fetching your GitHub repos...[/cyan]")
+        try:
+            all_repos = fetch.result()
+        except RuntimeError as e:
+            print_error(f"Failed to fetch repos: {e}")
+            return
+        save_repos_cache(storage, state["session_id"], all_repos)
 
     if not all_repos:
         print_info("No repositories found")
@@ -621,16 +1087,20 @@ def import_github_repos(
 
     if preview:
         console.print("\n[bold]Preview Mode - Repos to import:[/bold]\n")
+        today = date.today()
         for i, repo in enumerate(repos[:20], 1):
-            console.print(f"  {i}. {repo.name} - {format_date_relative(repo.pushed_at.date())}")
+            console.print(f"  {i}. {repo.name} - {format_date_relative(repo.pushed_date, today)}")
         if len(repos) > 20:
             console.print(f"  ... and {len(repos) - 20} more")
         console.print(f"\nRun [bold]jnl import github[/bold] to start importing.\n")
         return
 
+    # Snapshot up front so decisions journaled before the first batch
+    # boundary can be resumed
+    save_import_state(storage, state)
+
     # Start position (for resume)
     start_pos = state.get("current_position", 0)
-    remaining_repos = repos[start_pos:]
 
     # Show header (skip in AI mode)
     if not ai_mode:
@@ -642,71 +1112,86 @@ def import_github_repos(
         console.print("Press [bold]'q'[/bold] to QUIT and save progress\n")
 
     # Process in batches
-    total_batches = (len(remaining_repos) + BATCH_SIZE - 1) // BATCH_SIZE
+    total_batches = (len(repos) - start_pos + BATCH_SIZE - 1) // BATCH_SIZE
+    position = start_pos  # Repos handled before the current batch
 
-    for batch_num in range(1, total_batches + 1):
-        start_idx = (batch_num - 1) * BATCH_SIZE
-        end_idx = min(start_idx + BATCH_SIZE, len(remaining_repos))
-        batch = remaining_repos[start_idx:end_idx]
-
-        # Show batch header (skip in AI mode)
-        if not ai_mode:
-            console.print(f"\n[bold]BATCH {batch_num} of {total_batches}[/bold] (showing {len(batch)} repos)\n")
-
-        for i, repo in enumerate(batch):
-            global_index = start_pos + start_idx + i + 1
-
-            # Use AI mode or interactive mode
-            if ai_mode:
-                result = process_repo_ai_mode(repo, global_index, len(repos), storage, state, json_output)
-            else:
-                result = process_repo_interactive(repo, global_index, len(repos), storage, state)
+    try:
+        for batch_num, batch in enumerate(_batched(islice(repos, start_pos, None), BATCH_SIZE), 1):
+            first_index = position + 1
+            position += len(batch)
 
-            if result == "quit":
+            # Show batch header (skip in AI mode)
+            if not ai_mode:
+                console.print(f"\n[bold]BATCH {batch_num} of {total_batches}[/bold] (showing {len(batch)} repos)\n")
+
+            # One git commit for everything the batch saved
+            with storage.batch_commits(f"Import GitHub repos: batch {batch_num}"):
+                if batch_json:
+                    # Whole batch in one exchange
+                    result = process_batch_ai_mode(
+                        batch, first_index, len(repos), storage, state,
+                        active_regular, existing_ids, defer_index=True,
+                    )
+                    if result == "quit":
+                        # Report the repo the quit happened at, as per-repo mode does
+                        _quit_import(storage, state, ai_mode, json_output, state["current_position"] + 1, len(repos))
+                        return
+
+                # Interactive mode holds the terminal in key-at-a-time mode per batch
+                with nullcontext() if ai_mode else raw_stdin():
+                    for global_index, repo in enumerate(batch if not batch_json else (), first_index):
+                        # Use AI mode or interactive mode
+                        if ai_mode:
+                            result = process_repo_ai_mode(
+                                repo, global_index, len(repos), storage, state, json_output,
+                                active_regular, existing_ids, defer_index=True,
+                            )
+                        else:
+                            result = process_repo_interactive(
+                                repo, global_index, len(repos), storage, state,
+                                active_regular, existing_ids, defer_index=True,
+                            )
+
+                        if result == "quit":
+                            _quit_import(storage, state, ai_mode, json_output, global_index, len(repos))
+                            return
+
+                # Batch complete: refresh the index once for the whole batch (if
+                # it created anything) and snapshot state (decisions are already
+                # journaled)
+                if len(existing_ids) != indexed_count:
+                    storage.update_project_index()
+                    indexed_count = len(existing_ids)
                 save_import_state(storage, state)
-                if not ai_mode:
-                    show_quit_summary(state, len(repos) - global_index)
-                elif json_output:
-                    status_data = {
-                        "type": "status",
-                        "action": "quit",
-                        "processed": global_index,
-                        "remaining": len(repos) - global_index,
-                        "stats": state["processed"],
-                    }
-                    print(json.dumps(status_data), flush=True)
-                return
-
-            # Save state after each repo
-            save_import_state(storage, state)
-
-        # Batch complete
-        if not ai_mode:
-            show_batch_summary(state, batch_num, total_batches)
-
-            if batch_num < total_batches:
-                console.print(f"\n[bold]Continue with next batch?[/bold] [Y/n/q] > ", end="")
-                response = input().strip().lower()
-
-                if response in ['q', 'quit']:
-                    save_import_state(storage, state)
-                    show_quit_summary(state, len(repos) - (start_pos + end_idx))
-                    return
-                elif response in ['n', 'no']:
-                    save_import_state(storage, state)
-                    show_quit_summary(state, len(repos) - (start_pos + end_idx))
-                    return
-        elif json_output:
-            # Emit batch status in JSON mode
-            status_data = {
-                "type": "batch_complete",
-                "batch": batch_num,
-                "total_batches": total_batches,
-                "processed": start_pos + end_idx,
-                "remaining": len(repos) - (start_pos + end_idx),
-                "stats": state["processed"],
-            }
-            print(json.dumps(status_data), flush=True)
+            if not ai_mode:
+                show_batch_summary(state, batch_num, total_batches)
+
+                if batch_num < total_batches:
+                    console.print(f"\n[bold]Continue with next batch?[/bold] [Y/n/q] > ", end="")
+                    response = input().strip().lower()
+
+                    if response in ['q', 'quit']:
+                        show_quit_summary(state, len(repos) - position)
+                        return
+                    elif response in ['n', 'no']:
+                        show_quit_summary(state, len(repos) - position)
+                        return
+            elif json_output:
+                # Emit batch status in JSON mode
+                status_data = {
+                    "type": "batch_complete",
+                    "batch": batch_num,
+                    "total_batches": total_batches,
+                    "processed": position,
+                    "remaining": len(repos) - position,
+                    "stats": state["processed"],
+                }
+                _emit(status_data)
+    except KeyboardInterrupt:
+        # Ctrl-C: decisions are journaled already, but the project index
+        # is only refreshed at batch ends, so flush like a quit
+        _quit_import(storage, state, ai_mode, json_output, state["current_position"], len(repos))
+        return
 
     # All done!
     clear_import_state(storage)
@@ -1,12 +1,17 @@
 """Data models for JOURNEL."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Dict
 
+# Manual __slots__ can't coexist with field defaults, so slotted dataclasses
+# are only available where dataclass() generates them (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Project:
     """Represents a project in JOURNEL."""
 
@@ -67,13 +72,18 @@ class Project:
         project.notes = notes
         return project
 
-    def days_since_active(self) -> int:
-        """Get number of days since last activity."""
+    def days_since_active(self, today: Optional[date] = None) -> int:
+        """Get number of days since last activity.
+
+        Args:
+            today: Reference date; pass it in when checking many projects
+                to avoid calling date.today() for each one.
+        """
         if isinstance(self.last_active, str):
             last_active = datetime.fromisoformat(self.last_active).date()
         else:
             last_active = self.last_active
-        return (date.today() - last_active).days
+        return ((today or date.today()) - last_active).days
 
 
 @dataclass
@@ -1,16 +1,55 @@
 """Storage and file I/O operations for JOURNEL."""
 
-import json
-from datetime import date, datetime
+import os
+import re
+import shutil
+import subprocess
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
-
-import git
-import yaml
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
 
 from .config import Config
 from .models import LogEntry, Project, Session
-from .utils import ensure_dir, format_frontmatter, get_month_file, parse_frontmatter
+from .utils import (
+    dump_json,
+    ensure_dir,
+    get_month_file,
+    load_json,
+    parse_frontmatter,
+    write_frontmatter,
+    write_json,
+    yaml_dump,
+    yaml_load,
+)
+
+if TYPE_CHECKING:
+    import git
+
+# Matches the top-level last_active key in project frontmatter
+_LAST_ACTIVE_RE = re.compile(r"^last_active:.*$", re.MULTILINE)
+
+# Matches timed log entries like: - **project** (2.0h): message
+_TIME_ENTRY_RE = re.compile(r'-\s+\*\*(\w+)\*\*\s+\((\d+\.?\d*)\s*h\):')
+
+
+def _index_entry(project: Project) -> dict:
+    """Build a project's entry for the projects.json index."""
+    last_active = project.last_active
+    return {
+        "id": project.id,
+        "name": project.name,
+        "status": project.status,
+        "completion": project.completion,
+        "last_active": last_active.isoformat() if isinstance(last_active, date) else last_active,
+        "tags": list(project.tags),
+    }
+
+
+def _project_from_cached(frontmatter: dict, body: str) -> Project:
+    """Build a Project from cached frontmatter without sharing its lists."""
+    data = {k: list(v) if isinstance(v, list) else v for k, v in frontmatter.items()}
+    return Project.from_frontmatter(data, notes=body)
 
 
 class Storage:
@@ -19,7 +58,16 @@ class Storage:
     def __init__(self, config: Config):
         """Initialize storage handler."""
         self.config = config
-        self.repo: Optional[git.Repo] = None
+        self.repo: Optional["git.Repo"] = None
+        # git binary used for auto-commits, found when the repo is opened
+        self._git_exe: Optional[str] = None
+        self._projects_by_id: Optional[Dict[str, Project]] = None
+        # projects.json entries by ID, kept current by writes (see update_project_index)
+        self._index_entries: Optional[Dict[str, dict]] = None
+        self._file_cache: Optional[dict] = None
+        self._file_cache_dirty = False
+        # Set while batch_commits is active: whether a commit was deferred
+        self._commit_pending: Optional[bool] = None
 
     def init_structure(self, init_git: bool = True) -> None:
         """Initialize the ~/.journel/ directory structure.
@@ -68,8 +116,10 @@ generate context summaries for Claude or other LLMs.
 """
             readme_path.write_text(readme_content, encoding="utf-8")
 
-        # Initialize git repository
+        # Initialize git repository (GitPython is slow to import, so only here)
         if init_git:
+            import git
+
             if not (self.config.journel_dir / ".git").exists():
                 self.repo = git.Repo.init(self.config.journel_dir)
                 # Create initial commit
@@ -77,6 +127,7 @@ generate context summaries for Claude or other LLMs.
                 self.repo.index.commit("Initialize JOURNEL")
             else:
                 self.repo = git.Repo(self.config.journel_dir)
+            self._git_exe = shutil.which("git")
 
         # Save default config
         self.config.save()
@@ -100,14 +151,36 @@ generate context summaries for Claude or other LLMs.
 
         return None
 
+    def get_projects_by_id(self) -> Dict[str, Project]:
+        """Get all projects (including archived) keyed by ID.
+
+        Built from a single directory scan and cached until the next write
+        through this Storage instance.
+        """
+        if self._projects_by_id is None:
+            self._projects_by_id = {p.id: p for p in self.list_projects(include_archived=True)}
+        return self._projects_by_id
+
     def _load_project_file(self, path: Path) -> Project:
-        """Load project from file."""
+        """Load project from file.
+
+        Parses the file directly: the parse cache holds every project, so
+        reading (and rewriting) it would cost more than one YAML parse.
+        """
         content = path.read_text(encoding="utf-8")
         frontmatter, body = parse_frontmatter(content)
         return Project.from_frontmatter(frontmatter, notes=body)
 
     def save_project(self, project: Project) -> None:
         """Save a project to disk."""
+        self._write_project(project)
+
+        # Auto-commit if enabled
+        if self.config.get("auto_git_commit"):
+            self._git_commit(f"Update project: {project.name}")
+
+    def _write_project(self, project: Project) -> None:
+        """Write a project file to the directory for its status (no commit)."""
         # Determine directory based on status
         if project.status == "completed":
             project_dir = self.config.completed_dir
@@ -128,13 +201,10 @@ generate context summaries for Claude or other LLMs.
             body += "## Overview\n\n## Recent Activity\n\n## What I Learned\n\n## Notes\n"
 
         # Write file
-        content = format_frontmatter(project.to_frontmatter(), body)
         ensure_dir(project_dir)
-        project_file.write_text(content, encoding="utf-8")
-
-        # Auto-commit if enabled
-        if self.config.get("auto_git_commit"):
-            self._git_commit(f"Update project: {project.name}")
+        write_frontmatter(project_file, project.to_frontmatter(), body)
+        self._projects_by_id = None
+        self._index_update(project, indexed=project_dir != self.config.archived_dir)
 
     def _save_project_to_path(self, project: Project, path: Path) -> None:
         """Save a project to a specific path (used by import).
@@ -151,9 +221,51 @@ generate context summaries for Claude or other LLMs.
             body += "## Overview\n\n## Recent Activity\n\n## What I Learned\n\n## Notes\n"
 
         # Write file
-        content = format_frontmatter(project.to_frontmatter(), body)
         ensure_dir(path.parent)
-        path.write_text(content, encoding="utf-8")
+        write_frontmatter(path, project.to_frontmatter(), body)
+        self._projects_by_id = None
+        self._index_update(project, indexed=path.parent != self.config.archived_dir)
+
+    def touch_last_active(self, project_id: str, today: Optional[date] = None) -> bool:
+        """Bump a project's last_active date without re-serializing the file.
+
+        Patches the single `last_active:` frontmatter line in place, leaving
+        the rest of the file (including long notes) untouched.
+
+        Returns:
+            True if the file was patched, False if the project or the
+            frontmatter line could not be found.
+        """
+        if today is None:
+            today = date.today()
+
+        for project_dir in (self.config.projects_dir, self.config.completed_dir, self.config.archived_dir):
+            project_file = project_dir / f"{project_id}.md"
+            if project_file.exists():
+                break
+        else:
+            return False
+
+        content = project_file.read_text(encoding="utf-8")
+        end = content.find("\n---", 3) if content.startswith("---") else -1
+        if end == -1:
+            return False
+
+        frontmatter, n = _LAST_ACTIVE_RE.subn(
+            f"last_active: '{today.isoformat()}'", content[:end], count=1
+        )
+        if not n:
+            return False
+
+        project_file.write_text(frontmatter + content[end:], encoding="utf-8")
+        self._projects_by_id = None
+        if self._index_entries is not None and project_id in self._index_entries:
+            self._index_entries[project_id]["last_active"] = today.isoformat()
+
+        # Auto-commit if enabled
+        if self.config.get("auto_git_commit"):
+            self._git_commit(f"Touch project: {project_id}")
+        return True
 
     def list_projects(self, status: Optional[str] = None, include_archived: bool = False) -> List[Project]:
         """List all projects, optionally filtered by status."""
@@ -161,27 +273,132 @@ generate context summaries for Claude or other LLMs.
 
         # Load active/dormant projects
         if status is None or status in ["in-progress", "dormant"]:
-            for project_file in self.config.projects_dir.glob("*.md"):
-                project = self._load_project_file(project_file)
+            for project in self._scan_projects(self.config.projects_dir):
                 if status is None or project.status == status:
                     projects.append(project)
 
         # Load completed projects
         if status is None or status == "completed":
-            for project_file in self.config.completed_dir.glob("*.md"):
-                project = self._load_project_file(project_file)
-                projects.append(project)
+            projects.extend(self._scan_projects(self.config.completed_dir))
+
+        if status is None:
+            # Full scan of the indexed directories: refresh the index entries
+            self._index_entries = {p.id: _index_entry(p) for p in projects}
 
         # Load archived projects
         if include_archived or status == "archived":
-            for project_file in self.config.archived_dir.glob("*.md"):
-                project = self._load_project_file(project_file)
+            for project in self._scan_projects(self.config.archived_dir):
                 if project.status != "archived":
                     project.status = "archived"  # Ensure status is set
                 projects.append(project)
 
+        self._save_file_cache()
         return projects
 
+    def list_project_ids(self, include_archived: bool = False) -> List[str]:
+        """List project IDs from the directory listings, without opening files.
+
+        Enough for existence checks; IDs are the file names, as written by
+        save_project.
+        """
+        dirs = [self.config.projects_dir, self.config.completed_dir]
+        if include_archived:
+            dirs.append(self.config.archived_dir)
+
+        ids = []
+        for project_dir in dirs:
+            try:
+                ids.extend(
+                    e.name[:-3] for e in os.scandir(project_dir)
+                    if e.name.endswith(".md") and e.is_file()
+                )
+            except FileNotFoundError:
+                pass
+        return ids
+
+    def get_completed_count(self) -> int:
+        """Count completed projects from the directory listing, without parsing files."""
+        try:
+            return sum(
+                1 for e in os.scandir(self.config.completed_dir)
+                if e.name.endswith(".md") and e.is_file()
+            )
+        except FileNotFoundError:
+            return 0
+
+    def _scan_projects(self, project_dir: Path) -> List[Project]:
+        """Load every project file in a directory.
+
+        Parsed frontmatter is kept in .meta/project_cache.json keyed by file
+        name, mtime and size, so unchanged files are not re-parsed as YAML.
+        """
+        try:
+            entries = [e for e in os.scandir(project_dir) if e.name.endswith(".md") and e.is_file()]
+        except FileNotFoundError:
+            return []
+
+        cache = self._load_file_cache()
+        prefix = f"{project_dir.name}/"
+        seen = set()
+        projects = []
+
+        for entry in entries:
+            key = prefix + entry.name
+            seen.add(key)
+            frontmatter, body = self._parse_cached(cache, key, entry.path, entry.stat())
+            projects.append(_project_from_cached(frontmatter, body))
+
+        # Forget files that were moved or deleted
+        for key in [k for k in cache if k.startswith(prefix) and k not in seen]:
+            del cache[key]
+            self._file_cache_dirty = True
+
+        return projects
+
+    def _parse_cached(self, cache: dict, key: str, path: Union[str, Path], stat: os.stat_result) -> tuple:
+        """Get (frontmatter, body) for a project file, parsing only on a cache miss."""
+        cached = cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3]
+
+        content = Path(path).read_text(encoding="utf-8")
+        frontmatter, body = parse_frontmatter(content)
+        frontmatter = {
+            k: v.isoformat() if isinstance(v, (date, datetime)) else v
+            for k, v in frontmatter.items()
+        }
+        cache[key] = [stat.st_mtime_ns, stat.st_size, frontmatter, body]
+        self._file_cache_dirty = True
+        return frontmatter, body
+
+    def _load_file_cache(self) -> dict:
+        """Load the parsed-project cache from .meta (empty if missing or corrupt)."""
+        if self._file_cache is None:
+            cache_file = self.config.meta_dir / "project_cache.json"
+            try:
+                self._file_cache = load_json(cache_file.read_bytes())
+            except (OSError, ValueError):
+                self._file_cache = {}
+            if not isinstance(self._file_cache, dict):
+                self._file_cache = {}
+        return self._file_cache
+
+    def _save_file_cache(self) -> None:
+        """Write the parsed-project cache back if anything changed."""
+        if not self._file_cache_dirty:
+            return
+        try:
+            ensure_dir(self.config.meta_dir)
+            # The cache is machine-local (keyed on mtimes), keep it out of git
+            gitignore = self.config.meta_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("project_cache.json\n", encoding="utf-8")
+            cache_file = self.config.meta_dir / "project_cache.json"
+            cache_file.write_bytes(dump_json(self._file_cache))
+        except OSError:
+            pass
+        self._file_cache_dirty = False
+
     def add_log_entry(self, entry: LogEntry) -> None:
         """Add a log entry to the monthly log file."""
         log_file = self.config.logs_dir / get_month_file(entry.date)
@@ -197,24 +414,31 @@ generate context summaries for Claude or other LLMs.
         # Find or create date section
         date_str = entry.date.isoformat()
         date_header = f"## {date_str}"
+        entry_md = entry.to_markdown()
 
-        if date_header in content:
-            # Append to existing date section
-            lines = content.split("\n")
-            for i, line in enumerate(lines):
-                if line.startswith(date_header):
-                    # Insert after the header
-                    lines.insert(i + 1, entry.to_markdown())
-                    break
-            content = "\n".join(lines)
+        if content.startswith(date_header):
+            header_pos = 0
         else:
-            # Add new date section at the top (after title)
-            lines = content.split("\n")
-            # Find first line after title
-            insert_pos = 2 if len(lines) > 2 else len(lines)
-            lines.insert(insert_pos, f"\n{date_header}")
-            lines.insert(insert_pos + 1, entry.to_markdown())
-            content = "\n".join(lines)
+            header_pos = content.find(f"\n{date_header}")
+            if header_pos != -1:
+                header_pos += 1
+
+        if header_pos != -1:
+            # Insert right after the existing date header line
+            line_end = content.find("\n", header_pos)
+            if line_end == -1:
+                content = f"{content}\n{entry_md}"
+            else:
+                content = f"{content[:line_end + 1]}{entry_md}\n{content[line_end + 1:]}"
+        else:
+            # Add new date section at the top (after the title and blank line)
+            first_nl = content.find("\n")
+            second_nl = content.find("\n", first_nl + 1) if first_nl != -1 else -1
+            if second_nl == -1:
+                content = f"{content}\n\n{date_header}\n{entry_md}"
+            else:
+                pos = second_nl + 1
+                content = f"{content[:pos]}\n{date_header}\n{entry_md}\n{content[pos:]}"
 
         log_file.write_text(content, encoding="utf-8")
 
@@ -223,36 +447,53 @@ generate context summaries for Claude or other LLMs.
             self._git_commit(f"Add log entry: {date_str}")
 
     def get_recent_logs(self, days: int = 7) -> str:
-        """Get recent log entries as markdown."""
-        logs = []
-        current_date = date.today()
+        """Get the last `days` days of log entries (today included) as markdown.
 
-        # Check last 2 months of log files
-        for month_offset in range(2):
-            target_date = date(current_date.year, current_date.month, 1)
-            if month_offset > 0:
-                # Go back a month
-                if target_date.month == 1:
-                    target_date = date(target_date.year - 1, 12, 1)
-                else:
-                    target_date = date(target_date.year, target_date.month - 1, 1)
+        Months entirely before the cutoff aren't opened; within a month,
+        date sections older than the cutoff are skipped wherever they are.
+        """
+        logs = []
+        cutoff = (date.today() - timedelta(days=days - 1)).isoformat()
+        month = date.today().replace(day=1)
 
-            log_file = self.config.logs_dir / get_month_file(target_date)
+        while month.isoformat() >= cutoff[:8] + "01":
+            log_file = self.config.logs_dir / get_month_file(month)
             if log_file.exists():
-                logs.append(log_file.read_text(encoding="utf-8"))
+                recent = self._read_log_since(log_file, cutoff)
+                if recent:
+                    logs.append(recent)
+            month = (month - timedelta(days=1)).replace(day=1)
 
         return "\n\n".join(logs) if logs else "No recent activity logged."
 
+    @staticmethod
+    def _read_log_since(log_file: Path, cutoff: str) -> str:
+        """Read a monthly log's title and its date sections from cutoff on."""
+        lines = []
+        has_sections = False
+        in_range = True  # The title and anything else before the first section
+        with open(log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("## "):
+                    # Sections are usually newest first, but don't rely on it
+                    in_range = line[3:13] >= cutoff
+                    has_sections = has_sections or in_range
+                if in_range:
+                    lines.append(line)
+        return "".join(lines).rstrip("\n") if has_sections else ""
+
     def get_time_stats(self, days: int = 30) -> dict:
         """Get time statistics from logs.
 
         Returns dict with:
         - total_hours: total hours logged
         - by_project: dict of project -> hours
+        - top_projects: up to 5 (project, hours) pairs, most hours first
         - by_date: dict of date -> hours
         """
-        import re
+        import heapq
         from collections import defaultdict
+        from operator import itemgetter
 
         stats = {
             "total_hours": 0.0,
@@ -278,11 +519,7 @@ generate context summaries for Claude or other LLMs.
             content = log_file.read_text(encoding="utf-8")
 
             # Parse log entries
-            # Looking for patterns like: - **project** (2.0h): message
-            pattern = r'-\s+\*\*(\w+)\*\*\s+\((\d+\.?\d*)\s*h\):'
-            matches = re.findall(pattern, content)
-
-            for project_name, hours_str in matches:
+            for project_name, hours_str in _TIME_ENTRY_RE.findall(content):
                 hours = float(hours_str)
                 stats["total_hours"] += hours
                 stats["by_project"][project_name] += hours
@@ -290,24 +527,33 @@ generate context summaries for Claude or other LLMs.
         # Convert defaultdicts to regular dicts
         stats["by_project"] = dict(stats["by_project"])
         stats["by_date"] = dict(stats["by_date"])
+        stats["top_projects"] = heapq.nlargest(5, stats["by_project"].items(), key=itemgetter(1))
 
         return stats
 
     def move_to_completed(self, project: Project) -> None:
-        """Move a project to the completed directory."""
+        """Move a project to the completed directory.
+
+        Makes a single git commit for the move and leaves the project index
+        alone, so bulk callers can update it once at the end.
+        """
         old_path = self.config.projects_dir / project.file_name
         new_path = self.config.completed_dir / project.file_name
 
         if old_path.exists():
             project.status = "completed"
-            self.save_project(project)
+            self._write_project(project)
             old_path.unlink()  # Remove from active projects
 
             if self.config.get("auto_git_commit"):
                 self._git_commit(f"Complete project: {project.name}")
 
     def move_to_archived(self, project: Project) -> None:
-        """Move a project to the archived directory."""
+        """Move a project to the archived directory.
+
+        Makes a single git commit for the move and leaves the project index
+        alone, so bulk callers can update it once at the end.
+        """
         # Find the current location
         old_path = None
         if (self.config.projects_dir / project.file_name).exists():
@@ -317,7 +563,7 @@ generate context summaries for Claude or other LLMs.
 
         if old_path:
             project.status = "archived"
-            self.save_project(project)
+            self._write_project(project)
             old_path.unlink()  # Remove from current location
 
             if self.config.get("auto_git_commit"):
@@ -329,18 +575,44 @@ generate context summaries for Claude or other LLMs.
 
         if old_path.exists():
             project.status = "in-progress"
-            self.save_project(project)
+            self._write_project(project)
             old_path.unlink()  # Remove from archived
 
             if self.config.get("auto_git_commit"):
                 self._git_commit(f"Unarchive project: {project.name}")
 
+    @contextmanager
+    def batch_commits(self, message: str) -> Iterator[None]:
+        """Fold the auto-commits made inside the block into one commit.
+
+        Bulk operations (like the GitHub import) save many projects in a row;
+        this runs git once for all of them instead of once per save.
+        """
+        if self._commit_pending is not None:
+            # Nested: the outermost block commits
+            yield
+            return
+
+        self._commit_pending = False
+        try:
+            yield
+        finally:
+            pending = self._commit_pending
+            self._commit_pending = None
+            if pending:
+                self._git_commit(message)
+
     def _git_commit(self, message: str) -> None:
         """Create a git commit."""
+        if self._commit_pending is not None:
+            self._commit_pending = True
+            return
         if self.repo is None:
             return
 
         try:
+            if self._git_exe is not None and self._git_commit_cli(message):
+                return
             self.repo.index.add(["."])
             if self.repo.index.diff("HEAD"):  # Only commit if there are changes
                 self.repo.index.commit(message)
@@ -348,27 +620,69 @@ generate context summaries for Claude or other LLMs.
             # Silently fail git operations
             pass
 
+    def _git_commit_cli(self, message: str) -> bool:
+        """Commit through the git binary, a few plain forks per commit.
+
+        GitPython's index add/diff/commit is much slower. Returns False if
+        the commit itself failed (e.g. no user identity configured), leaving
+        the changes staged for the GitPython fallback, which has defaults.
+        """
+        def git(*args: str) -> int:
+            return subprocess.run(
+                [self._git_exe, *args], cwd=self.config.journel_dir, capture_output=True
+            ).returncode
+
+        if git("add", "-A") != 0:
+            return False
+        if git("diff", "--cached", "--quiet") == 0:
+            return True  # Nothing to commit
+        return git("commit", "-q", "-m", message) == 0
+
+    def has_uncommitted_changes(self) -> bool:
+        """Check the repository for uncommitted changes, untracked files included.
+
+        Asks the git binary, whose status uses the index stat cache, and
+        falls back to GitPython's slower is_dirty() if that fails (e.g. git
+        refusing the directory as unsafe).
+        """
+        if self._git_exe is not None:
+            result = subprocess.run(
+                [self._git_exe, "status", "--porcelain"],
+                cwd=self.config.journel_dir,
+                capture_output=True,
+            )
+            if result.returncode == 0:
+                return bool(result.stdout.strip())
+        return self.repo.is_dirty(untracked_files=True)
+
+    def _index_update(self, project: Project, indexed: bool) -> None:
+        """Apply a project write to the in-memory index entries, if loaded."""
+        if self._index_entries is None:
+            return
+        if indexed:
+            self._index_entries[project.id] = _index_entry(project)
+        else:
+            self._index_entries.pop(project.id, None)
+
     def update_project_index(self) -> None:
-        """Update the machine-readable project index."""
-        projects = self.list_projects()
+        """Update the machine-readable project index.
+
+        Entries come from the last full listing, patched by every write made
+        through this Storage since, so only the first call per instance
+        scans the project directories.
+        """
+        if self._index_entries is None:
+            self.list_projects()
+        entries = list(self._index_entries.values())
         index = {
             "updated": datetime.now().isoformat(),
-            "projects": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "status": p.status,
-                    "completion": p.completion,
-                    "last_active": p.last_active.isoformat() if isinstance(p.last_active, date) else p.last_active,
-                    "tags": p.tags,
-                }
-                for p in projects
-            ],
+            "completed_count": sum(1 for e in entries if e["status"] == "completed"),
+            "projects": entries,
         }
 
         index_file = self.config.meta_dir / "projects.json"
         ensure_dir(self.config.meta_dir)
-        index_file.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        write_json(index_file, index, indent=True)
 
     # Session management methods
 
@@ -378,7 +692,7 @@ generate context summaries for Claude or other LLMs.
         ensure_dir(sessions_dir)
 
         active_file = sessions_dir / "active.yaml"
-        active_file.write_text(yaml.dump(session.to_dict()), encoding="utf-8")
+        active_file.write_text(yaml_dump(session.to_dict()), encoding="utf-8")
 
         # Auto-commit if enabled
         if self.config.get("auto_git_commit"):
@@ -393,7 +707,7 @@ generate context summaries for Claude or other LLMs.
             return None
 
         try:
-            data = yaml.safe_load(active_file.read_text(encoding="utf-8"))
+            data = yaml_load(active_file.read_text(encoding="utf-8"))
             if data:
                 return Session.from_dict(data)
         except Exception:
@@ -1,12 +1,15 @@
 """Terminal UI for JOURNEL using Textual."""
 
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Button, Footer, Header, Label, ListItem, ListView, Static
+from textual.widgets import Button, Footer, Header, OptionList, Static
+from textual.widgets.option_list import Option
 from textual.binding import Binding
 from textual.screen import ModalScreen
 from textual.events import Key
@@ -23,67 +26,84 @@ class ProjectDetail(Static):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project: Optional[Project] = None
+        # Markup per project ID, with the displayed values it was built from
+        self._markup_cache: Dict[str, Tuple[tuple, str]] = {}
 
-    def set_project(self, project: Optional[Project]) -> None:
-        """Update the displayed project."""
+    def set_project(self, project: Optional[Project], today: Optional[date] = None) -> None:
+        """Update the displayed project.
+
+        Args:
+            today: Reference date for "last active"; defaults to date.today()
+        """
         self.project = project
         if project is None:
             self.update("[dim]No project selected[/dim]")
             return
 
-        # Build rich markup for project details
-        details = f"""[bold]{project.full_name or project.name}[/bold]
+        if today is None:
+            today = date.today()
+
+        # Moving back and forth through the list re-shows the same projects;
+        # reuse their markup while nothing displayed has changed
+        shown = (
+            project.name, project.full_name, project.status, project.completion,
+            project.last_active, project.created, tuple(project.tags), project.priority,
+            project.next_steps, project.blockers, project.github, project.claude_project,
+            project.learned, today,
+        )
+        cached = self._markup_cache.get(project.id)
+        if cached is None or cached[0] != shown:
+            cached = self._markup_cache[project.id] = (shown, self._details_markup(project, today))
+        self.update(cached[1])
+
+    @staticmethod
+    def _details_markup(project: Project, today: date) -> str:
+        """Build the rich markup for a project's details."""
+        # Build rich markup for project details, joined once at the end
+        parts = [f"""[bold]{project.full_name or project.name}[/bold]
 
 [cyan]Status:[/cyan] {project.status}
 [cyan]Completion:[/cyan] {project.completion}%
-[cyan]Last Active:[/cyan] {format_date_relative(project.last_active)}
+[cyan]Last Active:[/cyan] {format_date_relative(project.last_active, today)}
 [cyan]Created:[/cyan] {project.created}
-"""
+"""]
 
         if project.tags:
-            details += f"\n[cyan]Tags:[/cyan] {', '.join(project.tags)}"
+            parts.append(f"\n[cyan]Tags:[/cyan] {', '.join(project.tags)}")
 
         if project.priority != "medium":
-            details += f"\n[cyan]Priority:[/cyan] {project.priority}"
+            parts.append(f"\n[cyan]Priority:[/cyan] {project.priority}")
 
         if project.next_steps:
-            details += f"\n\n[bold yellow]Next Steps:[/bold yellow]\n{project.next_steps}"
+            parts.append(f"\n\n[bold yellow]Next Steps:[/bold yellow]\n{project.next_steps}")
 
         if project.blockers:
-            details += f"\n\n[bold red]Blockers:[/bold red]\n{project.blockers}"
+            parts.append(f"\n\n[bold red]Blockers:[/bold red]\n{project.blockers}")
 
         if project.github:
-            details += f"\n\n[cyan]GitHub:[/cyan] {project.github}"
+            parts.append(f"\n\n[cyan]GitHub:[/cyan] {project.github}")
 
         if project.claude_project:
-            details += f"\n[cyan]Claude:[/cyan] {project.claude_project}"
+            parts.append(f"\n[cyan]Claude:[/cyan] {project.claude_project}")
 
         if project.learned:
-            details += f"\n\n[bold green]Learned:[/bold green]\n{project.learned}"
-
-        self.update(details)
+            parts.append(f"\n\n[bold green]Learned:[/bold green]\n{project.learned}")
 
+        return "".join(parts)
 
-class ProjectListItem(ListItem):
-    """Custom list item for projects."""
 
-    def __init__(self, project: Project, *args, **kwargs):
-        self.project = project
+_STATUS_ICON = {
+    "in-progress": "▶",
+    "completed": "✓",
+    "dormant": "⏸",
+    "archived": "📦",
+}
 
-        # Build the label
-        status_icon = {
-            "in-progress": "▶",
-            "completed": "✓",
-            "dormant": "⏸",
-            "archived": "📦",
-        }.get(project.status, "•")
-
-        self.label_text = f"{status_icon} {project.name} ({project.completion}%)"
-        super().__init__(*args, **kwargs)
 
-    def compose(self) -> ComposeResult:
-        """Compose the list item with a label."""
-        yield Static(self.label_text)
+@lru_cache(maxsize=1024)
+def _project_label(status: str, name: str, completion: int) -> str:
+    """Build a project list label, memoized across filter switches."""
+    return f"{_STATUS_ICON.get(status, '•')} {name} ({completion}%)"
 
 
 class HelpScreen(ModalScreen):
@@ -177,23 +197,23 @@ class JournelTUI(App):
         padding: 1 2;
     }
 
-    ListView {
+    OptionList {
         height: 100%;
     }
 
-    ListView:focus {
+    OptionList:focus {
         border: solid $accent;
     }
 
-    ListItem {
+    OptionList > .option-list--option {
         padding: 0 1;
     }
 
-    ListItem:hover {
+    OptionList > .option-list--option-hover {
         background: $boost;
     }
 
-    ListItem.-selected {
+    OptionList > .option-list--option-highlighted {
         background: $primary;
         text-style: bold;
     }
@@ -229,6 +249,14 @@ class JournelTUI(App):
         self.current_filter = "active"
         self.projects: List[Project] = []
         self.selected_project: Optional[Project] = None
+        # Reference date for dormancy and relative dates, renewed on refresh
+        self.today = date.today()
+        # Sorted project lists per filter, dropped on refresh (which every
+        # action that changes a project goes through)
+        self._filter_cache: Dict[str, List[Project]] = {}
+        # Every project (archived included), read once per refresh and
+        # partitioned by the filters
+        self._all_projects: Optional[List[Project]] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -236,7 +264,9 @@ class JournelTUI(App):
 
         with Horizontal(id="main-container"):
             with Vertical(id="left-panel"):
-                yield ListView(id="project-list")
+                # OptionList only renders the rows in view, so long lists
+                # don't cost a widget per project
+                yield OptionList(id="project-list")
 
             with Vertical(id="right-panel"):
                 yield ProjectDetail(id="project-detail")
@@ -252,33 +282,50 @@ class JournelTUI(App):
 
     def load_projects(self) -> None:
         """Load projects based on current filter."""
-        dormant_days = self.config.get("dormant_days", 14)
+        cached = self._filter_cache.get(self.current_filter)
+        if cached is not None:
+            self.projects = cached
+        else:
+            self.projects = self._filter_cache[self.current_filter] = self._filtered_projects()
+
+        self._show_projects()
+
+    def _filtered_projects(self) -> List[Project]:
+        """List the current filter's projects, most recently active first."""
+        if self._all_projects is None:
+            self._all_projects = self.storage.list_projects(include_archived=True)
+        all_projects = self._all_projects
+
+        # Projects last active before this date are dormant
+        cutoff = self.today - timedelta(days=self.config.get("dormant_days", 14))
 
+        # Projects in the archived directory are listed with status "archived"
         if self.current_filter == "all":
-            self.projects = self.storage.list_projects(include_archived=True)
+            projects = list(all_projects)
         elif self.current_filter == "archived":
-            self.projects = self.storage.list_projects(status="archived")
+            projects = [p for p in all_projects if p.status == "archived"]
         elif self.current_filter == "completed":
-            self.projects = self.storage.list_projects(status="completed")
+            projects = [p for p in all_projects if p.status == "completed"]
         elif self.current_filter == "dormant":
-            all_projects = self.storage.list_projects()
-            self.projects = [
+            projects = [
                 p for p in all_projects
-                if p.status == "in-progress" and p.days_since_active() > dormant_days
+                if p.status == "in-progress" and p.last_active < cutoff
             ]
         else:  # active
-            all_projects = self.storage.list_projects()
-            self.projects = [
+            projects = [
                 p for p in all_projects
-                if p.status == "in-progress" and p.days_since_active() <= dormant_days
+                if p.status == "in-progress" and p.last_active >= cutoff
             ]
 
         # Sort by last_active
-        self.projects.sort(key=lambda p: p.last_active, reverse=True)
+        projects.sort(key=attrgetter("last_active"), reverse=True)
+        return projects
 
-        # Update the list
-        list_view = self.query_one("#project-list", ListView)
-        list_view.clear()
+    def _show_projects(self) -> None:
+        """Fill the project list with self.projects."""
+        option_list = self.query_one("#project-list", OptionList)
+        option_list.clear_options()
+        self._show_option(None)  # Clearing doesn't post a highlight change
 
         if not self.projects:
             # Provide helpful empty state based on filter
@@ -287,46 +334,36 @@ class JournelTUI(App):
             else:
                 msg = f"[dim]No {self.current_filter} projects.\n\nPress [cyan]*[/cyan] to see all projects.[/dim]"
 
-            # Wrap Label in ListItem to satisfy ListView's assertion that all children are ListItems
-            empty_item = ListItem(Label(msg))
-            list_view.append(empty_item)
+            # Disabled, so it can't be highlighted or selected
+            option_list.add_option(Option(msg, disabled=True))
         else:
-            for project in self.projects:
-                list_view.append(ProjectListItem(project))
+            option_list.add_options([
+                Option(_project_label(p.status, p.name, p.completion), id=p.id)
+                for p in self.projects
+            ])
 
-    @on(ListView.Selected)
-    def on_list_selected(self, event: ListView.Selected) -> None:
-        """Handle project selection (Enter key or click)."""
-        # Get detail widget
+    def _show_option(self, index: Optional[int]) -> None:
+        """Show the project at a list index in the detail panel."""
         detail = self.query_one("#project-detail", ProjectDetail)
 
-        # Only handle ProjectListItem selections
-        if not isinstance(event.item, ProjectListItem):
-            # Clear selection for invalid items (like empty state)
+        if index is None or not 0 <= index < len(self.projects):
+            # Nothing highlighted (or the empty state)
             self.selected_project = None
             detail.set_project(None)
             return
 
-        # Set selected project
-        self.selected_project = event.item.project
-        detail.set_project(self.selected_project)
+        self.selected_project = self.projects[index]
+        detail.set_project(self.selected_project, self.today)
 
-    @on(ListView.Highlighted)
-    def on_list_highlighted(self, event: ListView.Highlighted) -> None:
-        """Handle project navigation (arrow keys / j/k)."""
-        # Get detail widget
-        detail = self.query_one("#project-detail", ProjectDetail)
-
-        # Only handle ProjectListItem highlights
-        if event.item is None or not isinstance(event.item, ProjectListItem):
-            # Clear for invalid items (like empty state)
-            self.selected_project = None
-            detail.set_project(None)
-            return
+    @on(OptionList.OptionSelected)
+    def on_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Handle project selection (Enter key or click)."""
+        self._show_option(event.option_index)
 
-        # Update selected project as user navigates
-        self.selected_project = event.item.project
-        detail.set_project(self.selected_project)
+    @on(OptionList.OptionHighlighted)
+    def on_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        """Handle project navigation (arrow keys / j/k)."""
+        self._show_option(event.option_index)
 
     def action_filter_active(self) -> None:
         """Filter to show only active projects."""
@@ -360,6 +397,9 @@ class JournelTUI(App):
 
     def action_refresh(self) -> None:
         """Refresh the project list."""
+        self._filter_cache.clear()
+        self._all_projects = None
+        self.today = date.today()
         self.load_projects()
         self.notify("Projects refreshed")
 
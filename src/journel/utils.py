@@ -1,17 +1,52 @@
 """Utility functions for JOURNEL."""
 
+import os
 import re
+from bisect import bisect_right
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
+import yaml
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_DASH_RE = re.compile(r'[-\s]+')
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
-    """Convert text to URL-friendly slug."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text.strip('-')
+    """Convert text to URL-friendly slug.
+
+    Memoized: imports and resumes slugify the same repo names repeatedly.
+    """
+    text = _NON_WORD_RE.sub('', text.lower())
+    return _DASH_RE.sub('-', text).strip('-')
+
+
+# libyaml's C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def yaml_load(stream: Any) -> Any:
+    """Safely parse YAML, using libyaml's C loader when available."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+def yaml_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Dump YAML in block style, using libyaml's C emitter when available.
+
+    Returns the document as a string when no stream is given, like yaml.dump.
+    """
+    kwargs.setdefault("default_flow_style", False)
+    return yaml.dump(data, stream, Dumper=_YAML_DUMPER, **kwargs)
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -20,58 +55,167 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     Returns:
         Tuple of (frontmatter_dict, body_content)
     """
-    import yaml
-
     if not content.startswith('---'):
         return {}, content
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    # Slice around the closing delimiter rather than splitting, so the
+    # body is copied once
+    end = content.find('---', 3)
+    if end == -1:
         return {}, content
 
     try:
-        frontmatter = yaml.safe_load(parts[1]) or {}
-        body = parts[2].strip()
+        frontmatter = yaml_load(content[3:end]) or {}
+        body = content[end + 3:].strip()
         return frontmatter, body
     except yaml.YAMLError:
         return {}, content
 
 
+def _frontmatter_yaml(data: dict) -> str:
+    """Dump a frontmatter dict, reusing the text for repeated identical dicts.
+
+    Re-saving a project that hasn't changed (or saving it twice in one run)
+    then skips the YAML emitter. The cache key pairs values with their types
+    (so 1 and True don't collide) and freezes lists of scalars to tuples;
+    anything else unhashable bypasses the cache.
+    """
+    try:
+        key = tuple(
+            (k, list, tuple((type(x), x) for x in v)) if isinstance(v, list) else (k, type(v), v)
+            for k, v in data.items()
+        )
+        return _dump_frozen_frontmatter(key)
+    except TypeError:
+        return yaml_dump(data, sort_keys=False)
+
+
+@lru_cache(maxsize=256)
+def _dump_frozen_frontmatter(items: tuple) -> str:
+    """Dump frontmatter items frozen by _frontmatter_yaml."""
+    data = {
+        k: [x for _, x in v] if kind is list else v
+        for k, kind, v in items
+    }
+    return yaml_dump(data, sort_keys=False)
+
+
 def format_frontmatter(data: dict, body: str) -> str:
     """Format frontmatter and body into markdown content."""
-    import yaml
+    return f"---\n{_frontmatter_yaml(data)}---\n\n{body}"
+
+
+def write_frontmatter(path: Path, data: dict, body: str) -> None:
+    """Write frontmatter and body to a file, as format_frontmatter lays them out.
+
+    The body is written on its own, so the whole document is never held
+    as one string.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"---\n{_frontmatter_yaml(data)}---\n\n")
+        f.write(body)
+
+
+def load_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+def _json_default(value: Any) -> str:
+    """Encode a value JSON has no type for, as orjson does for dates."""
+    isoformat = getattr(value, "isoformat", None)
+    return isoformat() if isoformat is not None else str(value)
 
-    frontmatter = yaml.dump(data, default_flow_style=False, sort_keys=False)
-    return f"---\n{frontmatter}---\n\n{body}"
+
+def _stdlib_json_options(indent: bool) -> dict:
+    """json.dump(s) options that reproduce orjson's output."""
+    return {
+        "default": _json_default,
+        "ensure_ascii": False,
+        "indent": 2 if indent else None,
+        "separators": (",", ": ") if indent else (",", ":"),
+    }
+
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Output is compact unless indented, and the same with or without
+    orjson. Values JSON can't represent natively are written as ISO 8601
+    (dates and times) or with str() (paths and the like).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+    import json
+    return json.dumps(obj, **_stdlib_json_options(indent)).encode("utf-8")
+
+
+def write_json(path: Path, obj: Any, indent: bool = False) -> None:
+    """Write obj to path as JSON (see dump_json).
+
+    orjson encodes to bytes in one C call; the stdlib fallback streams
+    into the file instead of building the whole string first.
+    """
+    if orjson is not None:
+        path.write_bytes(dump_json(obj, indent=indent))
+        return
+    import json
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, **_stdlib_json_options(indent))
 
 
 def get_month_file(target_date: Optional[date] = None) -> str:
     """Get the log filename for a given date."""
     if target_date is None:
         target_date = date.today()
-    return f"{target_date.year}-{target_date.month:02d}.md"
-
-
-def format_date_relative(target_date: date) -> str:
-    """Format a date as a relative string."""
-    delta = (date.today() - target_date).days
-
-    if delta == 0:
-        return "today"
-    elif delta == 1:
-        return "yesterday"
-    elif delta < 7:
-        return f"{delta} days ago"
-    elif delta < 14:
-        return "1 week ago"
-    elif delta < 30:
-        weeks = delta // 7
-        return f"{weeks} weeks ago"
-    elif delta < 60:
-        return "1 month ago"
-    else:
-        months = delta // 30
-        return f"{months} months ago"
+    return _month_file(target_date.year, target_date.month)
+
+
+@lru_cache(maxsize=256)
+def _month_file(year: int, month: int) -> str:
+    """Format a log filename, memoized on the month (not "today")."""
+    return f"{year}-{month:02d}.md"
+
+
+def format_date_relative(target_date: date, today: Optional[date] = None) -> str:
+    """Format a date as a relative string.
+
+    Args:
+        today: Reference date; pass it in when formatting many dates to
+            avoid calling date.today() for each one.
+    """
+    if today is None:
+        today = date.today()
+    return _format_days_ago((today - target_date).days)
+
+
+# Day-count thresholds and the wording from each one up to the next;
+# counts below 0 (future dates) read as "-N days ago", as they always have
+_DAYS_AGO_THRESHOLDS = (0, 1, 2, 7, 14, 30, 60)
+_DAYS_AGO_FORMATS = (
+    lambda d: f"{d} days ago",
+    lambda d: "today",
+    lambda d: "yesterday",
+    lambda d: f"{d} days ago",
+    lambda d: "1 week ago",
+    lambda d: f"{d // 7} weeks ago",
+    lambda d: "1 month ago",
+    lambda d: f"{d // 30} months ago",
+)
+
+
+@lru_cache(maxsize=2048)
+def _format_days_ago(delta: int) -> str:
+    """Format a day count as a relative string.
+
+    Memoized on the count rather than the date, so results stay right
+    across midnight.
+    """
+    return _DAYS_AGO_FORMATS[bisect_right(_DAYS_AGO_THRESHOLDS, delta)](delta)
 
 
 def ensure_dir(path: Path) -> None:
@@ -79,11 +223,27 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file and rename.
+
+    A crash mid-write leaves the old contents instead of a truncated file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def detect_git_repo() -> Optional[str]:
     """Detect if current directory is a git repo and return remote URL."""
+    return _detect_git_repo(str(Path.cwd()))
+
+
+@lru_cache(maxsize=8)
+def _detect_git_repo(cwd: str) -> Optional[str]:
+    """Look up the remote URL for the repo containing cwd (cached per directory)."""
     try:
         import git
-        repo = git.Repo(Path.cwd(), search_parent_directories=True)
+        repo = git.Repo(cwd, search_parent_directories=True)
         if repo.remotes:
             # Try to get origin URL
             origin = repo.remotes.origin if 'origin' in [r.name for r in repo.remotes] else repo.remotes[0]
@@ -99,6 +259,15 @@ def detect_git_repo() -> Optional[str]:
     return None
 
 
+# Time-in-message patterns, tried in order by parse_time_from_message
+# Time in parentheses: (2h), (1.5h), etc.
+_TIME_PARENS_RE = re.compile(r'\s*\((\d+\.?\d*)\s*h(?:ours?)?\)\s*', re.IGNORECASE)
+# Time with dash: - 2h, - 1.5h
+_TIME_DASH_RE = re.compile(r'\s*[-–]\s*(\d+\.?\d*)\s*h(?:ours?)?\s*$', re.IGNORECASE)
+# "worked Xh" at end
+_TIME_WORKED_RE = re.compile(r'\s*worked\s+(\d+\.?\d*)\s*h(?:ours?)?\s*$', re.IGNORECASE)
+
+
 def parse_time_from_message(message: str) -> tuple[str, Optional[float]]:
     """Parse time duration from message.
 
@@ -108,33 +277,31 @@ def parse_time_from_message(message: str) -> tuple[str, Optional[float]]:
     - "Implemented feature (1.5h)" -> ("Implemented feature", 1.5)
     - "Did stuff - 2h" -> ("Did stuff", 2.0)
 
+    Pure function (no I/O); safe to call in tight loops.
+
     Returns:
         Tuple of (cleaned_message, hours)
     """
-    import re
+    # Every supported format contains an "h", so skip the regexes otherwise
+    if "h" not in message and "H" not in message:
+        return message, None
 
-    # Pattern for time in parentheses: (2h), (1.5h), etc.
-    pattern_parens = r'\s*\((\d+\.?\d*)\s*h(?:ours?)?\)\s*'
-    match = re.search(pattern_parens, message, re.IGNORECASE)
+    match = _TIME_PARENS_RE.search(message)
     if match:
         hours = float(match.group(1))
-        cleaned = re.sub(pattern_parens, '', message, flags=re.IGNORECASE).strip()
+        cleaned = _TIME_PARENS_RE.sub('', message).strip()
         return cleaned, hours
 
-    # Pattern for time with dash: - 2h, - 1.5h
-    pattern_dash = r'\s*[-–]\s*(\d+\.?\d*)\s*h(?:ours?)?\s*$'
-    match = re.search(pattern_dash, message, re.IGNORECASE)
+    match = _TIME_DASH_RE.search(message)
     if match:
         hours = float(match.group(1))
-        cleaned = re.sub(pattern_dash, '', message, flags=re.IGNORECASE).strip()
+        cleaned = _TIME_DASH_RE.sub('', message).strip()
         return cleaned, hours
 
-    # Pattern for "worked Xh" at end
-    pattern_worked = r'\s*worked\s+(\d+\.?\d*)\s*h(?:ours?)?\s*$'
-    match = re.search(pattern_worked, message, re.IGNORECASE)
+    match = _TIME_WORKED_RE.search(message)
     if match:
         hours = float(match.group(1))
-        cleaned = re.sub(pattern_worked, '', message, flags=re.IGNORECASE).strip()
+        cleaned = _TIME_WORKED_RE.sub('', message).strip()
         # If message is now empty, use "worked"
         if not cleaned:
             cleaned = "worked"
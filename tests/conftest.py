@@ -39,10 +39,9 @@ def storage(temp_journel_dir):
     return storage
 
 
-@pytest.fixture
-def sample_project(storage):
-    """Create a sample project for testing."""
-    project = Project(
+def make_sample_project():
+    """Build the project used by the sample_project fixtures."""
+    return Project(
         id="test-project",
         name="Test Project",
         full_name="A test project for unit tests",
@@ -55,10 +54,31 @@ def sample_project(storage):
         next_steps="Implement feature X",
         blockers="Waiting on API",
     )
+
+
+@pytest.fixture
+def sample_project(storage):
+    """Create a sample project for testing."""
+    project = make_sample_project()
     storage.save_project(project)
     return project
 
 
+@pytest.fixture(scope="module")
+def shared_journel_dir(tmp_path_factory):
+    """Provide a JOURNEL directory holding the sample project, built once per module.
+
+    For read-only tests that pass the directory to the CLI themselves; tests
+    that change projects should use the function-scoped fixtures instead.
+    """
+    journel_dir = tmp_path_factory.mktemp("shared") / ".journel"
+    journel_dir.mkdir()
+    storage = Storage(Config(journel_dir=journel_dir))
+    storage.init_structure(init_git=False)
+    storage.save_project(make_sample_project())
+    return journel_dir
+
+
 @pytest.fixture
 def multiple_projects(storage):
     """Create multiple projects with different states."""
@@ -0,0 +1,254 @@
+"""Tests for the gh-backed GitHub client."""
+import io
+import json
+import subprocess
+import sys
+from subprocess import PIPE, Popen
+
+import pytest
+
+from journel import github_client
+from journel.github_client import GitHubClient
+
+
+def repo_node(name):
+    """Build a GraphQL repository node as gh returns it."""
+    return {
+        "name": name,
+        "nameWithOwner": f"me/{name}",
+        "description": None,
+        "url": f"https://github.com/me/{name}",
+        "stargazerCount": 0,
+        "pushedAt": "2025-01-01T00:00:00Z",
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "tools"}}]},
+        "isFork": False,
+        "isArchived": False,
+        "diskUsage": 1,
+        "openIssues": {"totalCount": 0},
+    }
+
+
+def page(*names):
+    """Build one JSON response page listing the named repos."""
+    data = {"data": {"viewer": {"repositories": {
+        "nodes": [repo_node(name) for name in names],
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+    }}}}
+    return json.dumps(data).encode("utf-8")
+
+
+class FakeProc:
+    """Stand-in for the gh Popen object."""
+
+    def __init__(self, stdout=b"", stderr=b"", returncode=0):
+        self.stdout = stdout if hasattr(stdout, "read1") else io.BytesIO(stdout)
+        self.stderr = io.BytesIO(stderr)
+        self.returncode = None
+        self.killed = False
+        self._exit_code = returncode
+
+    def kill(self):
+        self.killed = True
+
+    def wait(self):
+        if self.returncode is None:
+            self.returncode = -9 if self.killed else self._exit_code
+        return self.returncode
+
+
+@pytest.fixture
+def gh(monkeypatch):
+    """Route the client's gh process to a FakeProc set by the test.
+
+    Set `gh.proc` before listing repos; the arguments gh was started
+    with end up in `gh.args`.
+    """
+    monkeypatch.setattr(GitHubClient, "_gh_authenticated", True)
+
+    class Gh:
+        proc = None
+        args = None
+
+    def popen(args, **kwargs):
+        Gh.args = args
+        return Gh.proc
+
+    monkeypatch.setattr(github_client.subprocess, "Popen", popen)
+    return Gh
+
+
+class TestBufferedRepoListing:
+    """Test listing repos without ijson, from gh's complete output."""
+
+    @pytest.fixture(autouse=True)
+    def no_ijson(self, monkeypatch):
+        monkeypatch.setattr(github_client, "ijson", None)
+
+    def test_concatenated_pages(self, gh):
+        """Every --paginate page document contributes its repos, in order."""
+        gh.proc = FakeProc(page("one", "two") + b"\n" + page("three"))
+
+        repos = GitHubClient().fetch_user_repos()
+        assert [r.name for r in repos] == ["one", "two", "three"]
+        assert repos[0].topics == ["tools"]
+        assert "--paginate" in gh.args
+        assert gh.proc.stdout.closed
+
+    def test_limit_within_one_page(self, gh):
+        """A limit below the page size is one unpaginated request of that size."""
+        gh.proc = FakeProc(page("one", "two", "three"))
+
+        repos = GitHubClient().fetch_user_repos(limit=2)
+        assert [r.name for r in repos] == ["one", "two"]
+        assert "--paginate" not in gh.args
+        assert "limit=2" in gh.args
+
+    @pytest.mark.parametrize("stdout", [b"", b" \n"])
+    def test_empty_output(self, gh, stdout):
+        """gh exiting cleanly without a response is an error, not zero repos."""
+        gh.proc = FakeProc(stdout)
+
+        with pytest.raises(RuntimeError, match="Failed to parse GitHub response"):
+            GitHubClient().fetch_user_repos()
+
+    def test_nonzero_exit(self, gh):
+        """gh's error output is reported when it fails."""
+        gh.proc = FakeProc(page("one"), stderr=b"HTTP 502", returncode=1)
+
+        with pytest.raises(RuntimeError, match="Failed to fetch repos: HTTP 502"):
+            GitHubClient().fetch_user_repos()
+
+    def test_stalled_gh_killed(self, gh, monkeypatch):
+        """gh is stopped once it goes _TIMEOUT seconds without output."""
+        monkeypatch.setattr(GitHubClient, "_TIMEOUT", 0.2)
+        gh.proc = Popen([sys.executable, "-c", "import time; time.sleep(30)"], stdout=PIPE, stderr=PIPE)
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            GitHubClient().fetch_user_repos()
+        assert gh.proc.returncode is not None
+
+
+@pytest.mark.skipif(github_client.ijson is None, reason="ijson not installed")
+class TestStreamingRepoListing:
+    """Test listing repos with ijson, parsed while gh is still writing."""
+
+    def test_multiple_pages(self, gh):
+        """Repos from every page document are yielded, in order."""
+        gh.proc = FakeProc(page("one", "two") + page("three"))
+
+        repos = GitHubClient().fetch_user_repos()
+        assert [r.name for r in repos] == ["one", "two", "three"]
+        assert repos[2].topics == ["tools"]
+        assert not gh.proc.killed
+
+    def test_truncated_stream(self, gh):
+        """A response cut off mid-document is a parse error."""
+        gh.proc = FakeProc(page("one") + page("two")[:40])
+
+        with pytest.raises(RuntimeError, match="Failed to parse GitHub response"):
+            GitHubClient().fetch_user_repos()
+
+    def test_nonzero_exit(self, gh):
+        """gh's exit status wins over the parse error of its partial output."""
+        gh.proc = FakeProc(page("one")[:40], stderr=b"HTTP 502", returncode=1)
+
+        with pytest.raises(RuntimeError, match="Failed to fetch repos: HTTP 502"):
+            GitHubClient().fetch_user_repos()
+
+    def test_early_stop_kills_gh(self, gh):
+        """Abandoning the listing stops gh instead of leaving it writing."""
+        gh.proc = FakeProc(page("one", "two") + page("three"))
+
+        repos = GitHubClient().iter_user_repos()
+        assert next(repos).name == "one"
+        repos.close()
+        assert gh.proc.killed
+        assert gh.proc.stdout.closed
+
+
+class PagedStream(io.RawIOBase):
+    """gh stdout that hands out one page document per read, counting reads."""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = list(pages)
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def read1(self, size=-1):
+        if size == 0:  # ijson probes the stream type with read(0)
+            return b""
+        self.reads += 1
+        return self.pages.pop(0) if self.pages else b""
+
+
+@pytest.mark.skipif(github_client.ijson is None, reason="ijson not installed")
+class TestIterUserRepos:
+    """Test that the streaming listing only reads as far as it is consumed."""
+
+    def test_repos_arrive_lazily(self, gh):
+        """The first repo is available after the first page only."""
+        stream = PagedStream([page("one"), page("two"), page("three")])
+        gh.proc = FakeProc(stream)
+
+        repos = GitHubClient().iter_user_repos()
+        assert next(repos).name == "one"
+        assert stream.reads == 1
+        assert [r.name for r in repos] == ["two", "three"]
+
+    def test_limit_stops_gh(self, gh):
+        """Reaching limit stops gh before it sends the remaining pages."""
+        names = [f"repo-{i}" for i in range(300)]
+        stream = PagedStream([page(*names[:100]), page(*names[100:200]), page(*names[200:])])
+        gh.proc = FakeProc(stream)
+
+        repos = list(GitHubClient().iter_user_repos(limit=150))
+        assert [r.name for r in repos] == names[:150]
+        assert "--paginate" in gh.args
+        assert gh.proc.killed
+        assert stream.pages  # The last page was never read
+
+
+class TestFetchCommitsCounts:
+    """Test the aliased GraphQL queries behind bulk commit counts."""
+
+    def test_batched_queries(self, monkeypatch):
+        """Repos are split into batches; missing or null repos count 0."""
+        monkeypatch.setattr(GitHubClient, "_gh_authenticated", True)
+        monkeypatch.setattr(GitHubClient, "_get_viewer", lambda self: {"login": "me", "id": "U_1"})
+        names = [f"me/repo-{i}" for i in range(GitHubClient._COMMITS_BATCH + 2)]
+        names[1] = 'me/quote"d'
+        queries = []
+
+        def run(args, **kwargs):
+            assert args[-1] == "me=U_1"
+            query = args[args.index("-f") + 1].partition("=")[2]
+            queries.append(query)
+            data = {}
+            for i in range(query.count("repository(")):
+                if i != 3:
+                    history = {"history": {"totalCount": 10 + i}}
+                    data[f"r{i}"] = {"defaultBranchRef": {"target": history}}
+            data["r2"] = None  # Not found comes back as null with an error
+            output = {"data": data, "errors": [{"type": "NOT_FOUND"}]}
+            return subprocess.CompletedProcess(args, 1, stdout=json.dumps(output), stderr="")
+
+        monkeypatch.setattr(github_client.subprocess, "run", run)
+
+        counts = GitHubClient().fetch_commits_counts(names)
+        assert len(queries) == 2
+        assert queries[0].startswith("query($me: ID!) {\n")
+        assert queries[0].count("repository(") == GitHubClient._COMMITS_BATCH
+        assert queries[1].count("repository(") == 2
+        assert 'r1: repository(owner: "me", name: "quote\\"d")' in queries[0]
+
+        assert counts["me/repo-0"] == 10
+        assert counts['me/quote"d'] == 11
+        assert counts["me/repo-2"] == 0
+        assert counts["me/repo-3"] == 0
+        assert counts[names[GitHubClient._COMMITS_BATCH]] == 10
+        assert counts[names[-1]] == 11
+        assert list(counts) == names
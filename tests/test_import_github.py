@@ -0,0 +1,161 @@
+"""Tests for GitHub import state handling."""
+import json
+from datetime import datetime, timezone
+
+import yaml
+
+from journel.github_client import GitHubRepo
+from journel.import_github import (
+    create_new_import_state,
+    create_project_from_repo,
+    load_import_state,
+    load_repos_cache,
+    process_batch_ai_mode,
+    record_import_decision,
+    save_import_state,
+    save_repos_cache,
+)
+
+
+def make_repo(name):
+    """Build a minimal GitHubRepo for state tests."""
+    return GitHubRepo(
+        name=name,
+        full_name=f"me/{name}",
+        description=None,
+        html_url=f"https://github.com/me/{name}",
+        stargazers_count=0,
+        pushed_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        language=None,
+        topics=[],
+        fork=False,
+        archived=False,
+        size=1,
+        open_issues_count=0,
+    )
+
+
+class TestImportJournal:
+    """Test the snapshot + decision journal behind import resume."""
+
+    def test_journal_replayed_past_snapshot(self, storage):
+        """Decisions made after the last snapshot are recovered on load."""
+        state = create_new_import_state()
+        save_import_state(storage, state)
+
+        record_import_decision(storage, state, make_repo("one"), 1, "s", "skipped")
+        save_import_state(storage, state)
+        record_import_decision(storage, state, make_repo("two"), 2, "o", "imported_as_ongoing")
+
+        loaded = load_import_state(storage)
+        assert loaded["current_position"] == 2
+        assert loaded["processed"]["skipped"] == 1
+        assert loaded["processed"]["imported_as_ongoing"] == 1
+        assert [r["name"] for r in loaded["repos_processed"]] == ["one", "two"]
+
+    def test_torn_journal_line_dropped(self, storage):
+        """A half-written last line is ignored and trimmed from the journal."""
+        state = create_new_import_state()
+        save_import_state(storage, state)
+        record_import_decision(storage, state, make_repo("one"), 1, "s", "skipped")
+
+        journal = storage.config.meta_dir / "import_state.jsonl"
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"name": "tw')
+
+        loaded = load_import_state(storage)
+        assert loaded["current_position"] == 1
+        assert journal.read_text(encoding="utf-8").endswith("\n")
+
+    def test_unchanged_snapshot_not_rewritten(self, storage):
+        """Saving the same state twice keeps the first write."""
+        state = create_new_import_state()
+        save_import_state(storage, state)
+        state_file = storage.config.meta_dir / "import_state.json"
+        first = state_file.read_bytes()
+
+        state["last_updated"] = "later"
+        save_import_state(storage, state)
+        assert state_file.read_bytes() == first
+
+        state["current_position"] = 5
+        save_import_state(storage, state)
+        assert json.loads(state_file.read_bytes())["current_position"] == 5
+        assert not state_file.with_name("import_state.json.tmp").exists()
+
+    def test_legacy_yaml_state_migrated(self, storage):
+        """A YAML state file from older versions is converted to JSON."""
+        state = create_new_import_state()
+        state["current_position"] = 3
+        state["processed"]["skipped"] = 3
+        state["repos_processed"] = [
+            {"name": name, "action": "s", "timestamp": "2025-01-01T00:00:00"}
+            for name in ("one", "two", "three")
+        ]
+        legacy = storage.config.meta_dir / "import_state.yaml"
+        legacy.write_text(yaml.dump(state), encoding="utf-8")
+
+        loaded = load_import_state(storage)
+        assert loaded["current_position"] == 3
+        assert not legacy.exists()
+        assert (storage.config.meta_dir / "import_state.json").exists()
+
+        # The per-repo list survives a snapshot, via the journal, without recounting
+        save_import_state(storage, loaded)
+        reloaded = load_import_state(storage)
+        assert [r["name"] for r in reloaded["repos_processed"]] == ["one", "two", "three"]
+        assert reloaded["processed"]["skipped"] == 3
+
+
+class TestReposCache:
+    """Test the per-session repo list cache used on resume."""
+
+    def test_round_trip(self, storage):
+        """Cached repos come back equal for the same session only."""
+        repos = [make_repo("one"), make_repo("two")]
+        save_repos_cache(storage, "session-1", repos)
+
+        assert load_repos_cache(storage, "session-1") == repos
+        assert load_repos_cache(storage, "session-2") is None
+
+
+class TestCreateProjectFromRepo:
+    """Test the existence check against the session's ID set."""
+
+    def test_existing_ids_checked_without_disk(self, storage, monkeypatch):
+        """Slug collisions are caught from the set, which tracks new projects."""
+        def no_listing(include_archived=False):
+            raise AssertionError("unexpected directory listing")
+
+        monkeypatch.setattr(storage, "list_project_ids", no_listing)
+        existing_ids = {"taken"}
+
+        assert create_project_from_repo(make_repo("taken"), storage, "archived", existing_ids) is None
+        assert create_project_from_repo(make_repo("My Repo"), storage, "archived", existing_ids).id == "my-repo"
+        assert create_project_from_repo(make_repo("my-repo"), storage, "active", existing_ids) is None
+        assert existing_ids == {"taken", "my-repo"}
+
+
+class TestBatchAIMode:
+    """Test the one-exchange-per-batch JSON workflow."""
+
+    def test_decisions_applied_in_order(self, storage, monkeypatch, capsys):
+        """One JSON array line classifies the whole batch."""
+        state = create_new_import_state()
+        monkeypatch.setattr("builtins.input", lambda: '["skip", "s"]')
+
+        batch = [make_repo("one"), make_repo("two")]
+        assert process_batch_ai_mode(batch, 1, 2, storage, state) is None
+        assert state["processed"]["skipped"] == 2
+        assert state["current_position"] == 2
+
+    def test_short_array_falls_back_per_repo(self, storage, monkeypatch, capsys):
+        """Repos without a decision are prompted one at a time."""
+        state = create_new_import_state()
+        answers = iter(['["s"]', "q"])
+        monkeypatch.setattr("builtins.input", lambda: next(answers))
+
+        batch = [make_repo("one"), make_repo("two")]
+        assert process_batch_ai_mode(batch, 1, 2, storage, state) == "quit"
+        assert state["processed"]["skipped"] == 1
+        assert state["current_position"] == 1
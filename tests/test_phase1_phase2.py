@@ -41,12 +41,12 @@ class TestPhase1NonInteractive:
 class TestPhase1JSONOutput:
     """Test Phase 1 --format json for machine-readable output."""
 
-    def test_status_json_output(self, runner, temp_journel_dir, sample_project):
+    def test_status_json_output(self, runner, shared_journel_dir):
         """Test status command with JSON output."""
         result = runner.invoke(
             main,
             ["status", "--format", "json"],
-            env={"JOURNEL_DIR": str(temp_journel_dir)},
+            env={"JOURNEL_DIR": str(shared_journel_dir)},
         )
         assert result.exit_code == 0
 
@@ -82,12 +82,12 @@ class TestPhase1JSONOutput:
 class TestPhase2Commands:
     """Test Phase 2 new commands (ctx, get, update)."""
 
-    def test_ctx_json_output(self, runner, temp_journel_dir, sample_project):
+    def test_ctx_json_output(self, runner, shared_journel_dir):
         """Test ctx command with JSON output."""
         result = runner.invoke(
             main,
             ["ctx", "--format", "json"],
-            env={"JOURNEL_DIR": str(temp_journel_dir)},
+            env={"JOURNEL_DIR": str(shared_journel_dir)},
         )
         assert result.exit_code == 0
 
@@ -96,12 +96,12 @@ class TestPhase2Commands:
         assert "recent_logs" in data
         assert isinstance(data["active_projects"], list)
 
-    def test_get_command_json(self, runner, temp_journel_dir, sample_project):
+    def test_get_command_json(self, runner, shared_journel_dir):
         """Test get command returns single project as JSON."""
         result = runner.invoke(
             main,
             ["get", "test-project", "--format", "json"],
-            env={"JOURNEL_DIR": str(temp_journel_dir)},
+            env={"JOURNEL_DIR": str(shared_journel_dir)},
         )
         assert result.exit_code == 0
 
@@ -113,12 +113,12 @@ class TestPhase2Commands:
         assert "notes" in data
         assert "learned" in data
 
-    def test_get_command_not_found(self, runner, temp_journel_dir):
+    def test_get_command_not_found(self, runner, shared_journel_dir):
         """Test get command with non-existent project."""
         result = runner.invoke(
             main,
             ["get", "nonexistent", "--format", "json"],
-            env={"JOURNEL_DIR": str(temp_journel_dir)},
+            env={"JOURNEL_DIR": str(shared_journel_dir)},
         )
         # Command succeeds but returns error in JSON
         data = json.loads(result.output)
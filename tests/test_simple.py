@@ -1,5 +1,7 @@
 """Simple smoke tests to verify basic functionality."""
 import json
+import subprocess
+import sys
 
 
 def test_import():
@@ -8,6 +10,18 @@ def test_import():
     assert cli is not None
 
 
+def test_cli_import_stays_light():
+    """Test that importing the CLI leaves Textual and GitPython unloaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, journel.cli; print(sorted(m for m in ('textual', 'git') if m in sys.modules))"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
 def test_cli_main_exists():
     """Test that main command exists."""
     from journel.cli import main
@@ -29,3 +43,70 @@ def test_models():
     assert p.name == "Test"
     assert p.completion == 0
     assert p.days_since_active() == 0
+
+
+def test_frontmatter_round_trip():
+    """Test that frontmatter keeps its YAML types through format and parse."""
+    from journel.utils import format_frontmatter, parse_frontmatter
+    from datetime import date
+
+    data = {
+        "name": "Needs: quoting",
+        "created": date(2025, 1, 2),
+        "tags": ["a", "b"],
+        "completion": 40,
+        "github": None,
+        "next_steps": "line one\nline two",
+    }
+    frontmatter, body = parse_frontmatter(format_frontmatter(data, "# Body"))
+    assert frontmatter == data
+    assert body == "# Body"
+
+
+def test_format_date_relative_boundaries():
+    """Test the relative date wording on each side of its thresholds."""
+    from journel.utils import format_date_relative
+    from datetime import date, timedelta
+
+    today = date(2025, 6, 30)
+    expected = {
+        0: "today",
+        1: "yesterday",
+        2: "2 days ago",
+        6: "6 days ago",
+        7: "1 week ago",
+        13: "1 week ago",
+        14: "2 weeks ago",
+        29: "4 weeks ago",
+        30: "1 month ago",
+        59: "1 month ago",
+        60: "2 months ago",
+        400: "13 months ago",
+    }
+    for days, text in expected.items():
+        assert format_date_relative(today - timedelta(days=days), today) == text
+
+
+def test_ensure_dir_recreates_removed_dir(tmp_path):
+    """Test that ensure_dir makes a directory again after it was removed."""
+    import shutil
+    from journel.utils import ensure_dir
+
+    path = tmp_path / "a" / "b"
+    ensure_dir(path)
+    shutil.rmtree(tmp_path / "a")
+    ensure_dir(path)
+    assert path.is_dir()
+
+
+def test_dump_json_same_with_and_without_orjson(monkeypatch):
+    """Test that the stdlib fallback writes what orjson writes."""
+    from datetime import datetime, timezone
+    from pathlib import Path
+    import journel.utils as utils
+
+    data = {"when": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "path": Path("a"), "name": "café"}
+    expected = '{"when":"2025-01-02T03:04:05+00:00","path":"a","name":"café"}'.encode("utf-8")
+    assert utils.dump_json(data) == expected
+    monkeypatch.setattr(utils, "orjson", None)
+    assert utils.dump_json(data) == expected
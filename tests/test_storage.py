@@ -0,0 +1,218 @@
+"""Tests for Storage fast paths."""
+import json
+import shutil
+from datetime import date, timedelta
+
+from journel.config import Config
+from journel.models import LogEntry, Project
+from journel.storage import Storage
+
+
+class TestTouchLastActive:
+    """Test in-place last_active patching."""
+
+    def test_touch_updates_only_date(self, storage):
+        """Touching a project bumps last_active and keeps the body intact."""
+        project = Project(
+            id="old-project",
+            name="Old Project",
+            created=date(2024, 1, 1),
+            last_active=date(2024, 1, 1),
+            notes="# Old Project\n\nlast_active: not frontmatter",
+        )
+        storage.save_project(project)
+
+        assert storage.touch_last_active("old-project", date(2025, 3, 4))
+
+        loaded = storage.load_project("old-project")
+        assert loaded.last_active == date(2025, 3, 4)
+        assert loaded.created == date(2024, 1, 1)
+        assert loaded.notes == project.notes
+
+    def test_touch_missing_project(self, storage):
+        """Touching an unknown project reports failure."""
+        assert not storage.touch_last_active("missing", date.today())
+
+
+class TestProjectFileCache:
+    """Test the stat-validated parsed-project cache behind list_projects."""
+
+    def test_cache_written_and_reused(self, storage, sample_project):
+        """A second Storage reads unchanged projects from the cache."""
+        storage.list_projects()
+        assert (storage.config.meta_dir / "project_cache.json").exists()
+
+        fresh = Storage(storage.config)
+        projects = fresh.list_projects()
+        assert [p.id for p in projects] == ["test-project"]
+        assert projects[0].tags == ["test", "sample"]
+        assert not fresh._file_cache_dirty
+
+    def test_cache_invalidated_on_edit(self, storage, sample_project):
+        """Editing a project file on disk is picked up on the next listing."""
+        storage.list_projects()
+
+        sample_project.completion = 80
+        sample_project.notes = "# Changed\n\nLonger body so the size changes too"
+        storage.save_project(sample_project)
+
+        projects = Storage(storage.config).list_projects()
+        assert projects[0].completion == 80
+
+    def test_cache_forgets_moved_projects(self, storage, sample_project):
+        """Moving a project between directories drops the stale entry."""
+        storage.list_projects()
+        storage.move_to_archived(sample_project)
+
+        fresh = Storage(storage.config)
+        assert fresh.list_projects() == []
+        assert [p.id for p in fresh.list_projects(status="archived")] == ["test-project"]
+
+    def test_load_project_skips_cache(self, storage, sample_project):
+        """Loading one project by ID neither reads nor writes the cache file."""
+        cache_file = storage.config.meta_dir / "project_cache.json"
+        storage.list_projects()
+        cache_file.write_text("not json", encoding="utf-8")
+
+        fresh = Storage(storage.config)
+        assert fresh.load_project("test-project").tags == ["test", "sample"]
+        assert fresh._file_cache is None
+        assert cache_file.read_text(encoding="utf-8") == "not json"
+
+
+class TestListProjectIds:
+    """Test the file-name based project ID listing."""
+
+    def test_ids_from_all_directories(self, storage, sample_project):
+        """Archived projects are listed only when asked for."""
+        other = Project(id="other", name="Other", created=date.today(), last_active=date.today())
+        storage.save_project(other)
+        storage.move_to_archived(other)
+
+        assert storage.list_project_ids() == ["test-project"]
+        assert sorted(storage.list_project_ids(include_archived=True)) == ["other", "test-project"]
+
+
+class TestIncrementalIndex:
+    """Test that projects.json is patched in memory after the first build."""
+
+    def test_writes_patch_index_without_rescan(self, storage, sample_project, monkeypatch):
+        """Saves and moves after the first update are reflected without a scan."""
+        storage.update_project_index()
+
+        def no_scan(project_dir):
+            raise AssertionError("unexpected directory scan")
+
+        monkeypatch.setattr(storage, "_scan_projects", no_scan)
+
+        new_project = Project(id="second", name="Second", created=date.today(), last_active=date.today())
+        storage.save_project(new_project)
+        storage.move_to_archived(sample_project)
+        storage.update_project_index()
+
+        index = json.loads((storage.config.meta_dir / "projects.json").read_text(encoding="utf-8"))
+        assert [p["id"] for p in index["projects"]] == ["second"]
+
+        monkeypatch.undo()
+        fresh = Storage(storage.config)
+        fresh.update_project_index()
+        rebuilt = json.loads((storage.config.meta_dir / "projects.json").read_text(encoding="utf-8"))
+        assert rebuilt["projects"] == index["projects"]
+
+
+class TestBatchCommits:
+    """Test folding auto-commits into one."""
+
+    def test_saves_share_one_commit(self, storage, monkeypatch):
+        """Saves inside batch_commits produce a single commit at the end."""
+        commits = []
+
+        class FakeIndex:
+            def add(self, paths):
+                pass
+
+            def diff(self, ref):
+                return ["changed"]
+
+            def commit(self, message):
+                commits.append(message)
+
+        class FakeRepo:
+            index = FakeIndex()
+
+        monkeypatch.setattr(storage, "repo", FakeRepo())
+
+        with storage.batch_commits("Bulk save"):
+            for name in ("one", "two"):
+                storage.save_project(Project(id=name, name=name, created=date.today(), last_active=date.today()))
+            assert commits == []
+
+        assert commits == ["Bulk save"]
+        storage.save_project(Project(id="three", name="Three", created=date.today(), last_active=date.today()))
+        assert commits == ["Bulk save", "Update project: Three"]
+
+
+class TestHasUncommittedChanges:
+    """Test the dirty check used before syncing."""
+
+    def test_untracked_and_failed_status(self, temp_journel_dir):
+        """New files count as changes, also when git status itself fails."""
+        storage = Storage(Config(journel_dir=temp_journel_dir))
+        storage.init_structure()
+        storage.repo.git.add("-A")  # config.yaml is written after the first commit
+        storage.repo.index.commit("Save config")
+        assert not storage.has_uncommitted_changes()
+
+        (temp_journel_dir / "projects" / "new.md").write_text("new", encoding="utf-8")
+        assert storage.has_uncommitted_changes()
+
+        # Falls back to GitPython when the git binary exits non-zero
+        storage._git_exe = shutil.which("false")
+        assert storage.has_uncommitted_changes()
+
+
+class TestAddLogEntry:
+    """Test where log entries land in the monthly file."""
+
+    def test_entries_grouped_under_date_headers(self, storage):
+        """Newest date section goes on top; same-day entries go under its header."""
+        storage.add_log_entry(LogEntry(date=date(2025, 1, 1), project=None, message="first"))
+        storage.add_log_entry(LogEntry(date=date(2025, 1, 2), project=None, message="second"))
+        storage.add_log_entry(LogEntry(date=date(2025, 1, 1), project=None, message="third"))
+
+        content = (storage.config.logs_dir / "2025-01.md").read_text(encoding="utf-8")
+        assert content == (
+            "# January 2025 Activity Log\n"
+            "\n"
+            "\n## 2025-01-02\n- second\n"
+            "\n## 2025-01-01\n- third\n- first\n"
+        )
+
+    def test_recent_logs_stop_at_cutoff(self, storage):
+        """Only the requested days are returned, newest first."""
+        today = date.today()
+        for age in (10, 2, 0):
+            storage.add_log_entry(LogEntry(date=today - timedelta(days=age), project=None, message=f"{age} days old"))
+
+        recent = storage.get_recent_logs(days=7)
+        assert "0 days old" in recent
+        assert "2 days old" in recent
+        assert "10 days old" not in recent
+        assert recent.index("0 days old") < recent.index("2 days old")
+
+    def test_recent_logs_out_of_order(self, storage):
+        """A section appended below an older one is still returned."""
+        today = date.today()
+        month_start = today.replace(day=1)
+        old = month_start - timedelta(days=1)
+        log_file = storage.config.logs_dir / f"{today:%Y-%m}.md"
+        log_file.write_text(
+            "# Activity Log\n"
+            f"\n## {old.isoformat()}\n- too old\n"
+            f"\n## {today.isoformat()}\n- appended by hand\n",
+            encoding="utf-8",
+        )
+
+        recent = storage.get_recent_logs(days=1)
+        assert "appended by hand" in recent
+        assert "too old" not in recent
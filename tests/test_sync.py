@@ -0,0 +1,100 @@
+"""Tests for jnl sync against a local bare remote."""
+import subprocess
+
+import pytest
+
+from journel.cli import main
+from journel.config import Config
+from journel.storage import Storage
+
+
+def git(cwd, *args):
+    """Run git in cwd and return its stripped stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def commit_file(cwd, name, text):
+    """Write a file in a clone and commit it."""
+    path = cwd / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    git(cwd, "add", "-A")
+    git(cwd, "commit", "-q", "-m", f"Edit {name}")
+
+
+@pytest.fixture
+def synced(tmp_path, monkeypatch):
+    """A JOURNEL repo tracking a bare remote, plus a second clone of it."""
+    # Keep the user's git config (pull.rebase, hooks, ...) out of the tests
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+
+    remote = tmp_path / "remote.git"
+    git(tmp_path, "init", "-q", "--bare", str(remote))
+
+    journel_dir = tmp_path / ".journel"
+    storage = Storage(Config(journel_dir=journel_dir))
+    storage.init_structure()
+    git(journel_dir, "add", "-A")
+    git(journel_dir, "commit", "-q", "-m", "Save config")
+    git(journel_dir, "remote", "add", "origin", str(remote))
+    git(journel_dir, "push", "-q", "-u", "origin", "HEAD")
+
+    other = tmp_path / "other"
+    git(tmp_path, "clone", "-q", str(remote), str(other))
+
+    monkeypatch.setattr("journel.commands.sync.get_storage", lambda: storage)
+    return journel_dir, other
+
+
+class TestSync:
+    """Test fetching, committing, integrating and pushing."""
+
+    def test_fast_forward(self, runner, synced):
+        """Remote-only changes are brought in."""
+        journel_dir, other = synced
+        commit_file(other, "projects/remote.md", "remote")
+        git(other, "push", "-q")
+
+        result = runner.invoke(main, ["sync"])
+        assert "Sync complete!" in result.output
+        assert (journel_dir / "projects" / "remote.md").exists()
+
+    @pytest.mark.parametrize("rebase", ["false", "true"])
+    def test_local_and_remote_changes(self, runner, synced, rebase):
+        """Uncommitted local work is committed, combined with remote work and pushed."""
+        journel_dir, other = synced
+        git(journel_dir, "config", "pull.rebase", rebase)
+        commit_file(other, "projects/remote.md", "remote")
+        git(other, "push", "-q")
+        (journel_dir / "projects" / "local.md").write_text("local", encoding="utf-8")
+
+        result = runner.invoke(main, ["sync"])
+        assert "Sync complete!" in result.output
+
+        git(other, "pull", "-q", "--no-rebase")
+        assert (other / "projects" / "local.md").exists()
+        merges = git(journel_dir, "rev-list", "--merges", "HEAD")
+        assert bool(merges) == (rebase == "false")
+
+    @pytest.mark.parametrize("rebase", ["false", "true"])
+    def test_conflict_aborted(self, runner, synced, rebase):
+        """A conflict leaves the local branch as it was and is reported."""
+        journel_dir, other = synced
+        git(journel_dir, "config", "pull.rebase", rebase)
+        commit_file(other, "projects/shared.md", "remote")
+        git(other, "push", "-q")
+        commit_file(journel_dir, "projects/shared.md", "local")
+        local_head = git(journel_dir, "rev-parse", "HEAD")
+
+        result = runner.invoke(main, ["sync"])
+        assert "Sync stopped" in result.output
+        assert "Sync complete!" not in result.output
+        assert git(journel_dir, "rev-parse", "HEAD") == local_head
+        assert git(journel_dir, "status", "--porcelain") == ""
+        assert (journel_dir / "projects" / "shared.md").read_text(encoding="utf-8") == "local"